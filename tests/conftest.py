@@ -1,14 +1,44 @@
 import pytest, logging
+import os
+import threading
+from http.server import ThreadingHTTPServer
 from utils.api_client import ApiClient
+from utils.cassette import shared_cassette
 from utils.webhook_utils import WebhookClient
+from utils.webhook_capture import CaptureServer
+from utils.reqres_stub import ReqresStubServer
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--reqres-stub",
+        action="store_true",
+        help="run the API tests against the in-process Reqres stub instead of reqres.in",
+    )
+
+@pytest.fixture(scope="session")
+def reqres_stub() -> ReqresStubServer:
+    """
+    In-process reqres.in stand-in (utils/reqres_stub.py), shared by the session.
+    Tune stub.faults (latency, jitter, error_rate) per test as needed.
+    """
+    with ReqresStubServer() as stub:
+        yield stub
 
 @pytest.fixture(scope="session")
-def api_client() -> ApiClient:
+def api_client(request) -> ApiClient:
     """
     Provides a shared ApiClient instance for all tests.
-    requires REQRES_API_TOKEN to be set before running tests.
+    requires REQRES_API_TOKEN to be set before running tests,
+    unless --reqres-stub points it at the local stub.
     """
-    return ApiClient()
+    if request.config.getoption("--reqres-stub"):
+        stub = request.getfixturevalue("reqres_stub")
+        os.environ.setdefault("REQRES_API_TOKEN", "reqres-stub")
+        with ApiClient(base_url=stub.base_url) as client:
+            yield client
+        return
+    with ApiClient() as client:
+        yield client
 
 @pytest.fixture(scope="session")
 def webhook_client() -> WebhookClient:
@@ -16,4 +46,65 @@ def webhook_client() -> WebhookClient:
     Provides a shared WebhookClient instance.
     Requires WEBHOOK_TARGET_URL to be set before running tests.
     """
-    return WebhookClient()
\ No newline at end of file
+    cassette = shared_cassette()
+    if cassette is not None and cassette.mode == "replay":
+        # these checks send fresh event ids and timestamps, nothing to replay
+        pytest.skip("live webhook delivery checks do not run from a cassette")
+    with WebhookClient() as client:
+        yield client
+
+@pytest.fixture(scope="session")
+def capture_server() -> CaptureServer:
+    """
+    In-process Webhook.site stand-in (utils/webhook_capture.py), shared by
+    the whole session. Captures live in capture_server.store.
+    """
+    with CaptureServer() as server:
+        yield server
+
+@pytest.fixture
+def local_webhook_client(capture_server) -> WebhookClient:
+    """
+    WebhookClient pointed at the local capture server, with a fresh token
+    per test so tests never see each other's captures.
+    """
+    with WebhookClient(
+        target_url=capture_server.target_url(),
+        api_base_url=capture_server.base_url,
+    ) as client:
+        yield client
+
+@pytest.fixture
+def indexed_webhook_client(capture_server) -> WebhookClient:
+    """
+    Like local_webhook_client, but reading captures straight from the
+    server's store: find_request / wait_for_event use its indexes and
+    wakeups instead of polling the HTTP API.
+    """
+    with WebhookClient(
+        target_url=capture_server.target_url(),
+        api_base_url=capture_server.base_url,
+        capture_store=capture_server.store,
+    ) as client:
+        yield client
+
+@pytest.fixture
+def serve_http():
+    """
+    Starts local HTTP servers for offline tests.
+    Call it with a BaseHTTPRequestHandler subclass, get back the base URL.
+    """
+    servers = []
+
+    def start(handler_cls) -> str:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler_cls)
+        threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
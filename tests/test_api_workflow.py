@@ -1,5 +1,4 @@
 import pytest
-from jsonschema import validate
 
 from utils.json_schemas import *
 
@@ -14,7 +13,7 @@ def test_get_single_user_success(api_client):
     body = response.json()
     user = body["data"]
     # validate schema
-    validate(instance=body, schema=USER_SCHEMA)
+    validate_fast("user", body)
 
     '''assert "data" in body
     assert "email" in user
@@ -44,7 +43,7 @@ def test_create_user_success(api_client):
     )
     body = response.json()
     # validate schema
-    validate(instance=body, schema=CREATED_USER_SCHEMA)
+    validate_fast("created_user", body)
     # More focused checks: values echoed correctly
     assert body.get("name") == payload["name"]
     assert body.get("job") == payload["job"]
@@ -80,6 +79,37 @@ def test_get_nonexistent_user_returns_404(api_client, user_id: int):
     # Reqres returns an empty JSON object for this case
     assert response.text in ("{}", "")
 
+def test_get_many_nonexistent_users_return_404(api_client):
+    """
+    Same negative check as above, but fired concurrently over many ids
+    with ApiClient.request_many (results come back in input order).
+    """
+    user_ids = list(range(1000, 1020))
+    result = api_client.request_many(
+        [("GET", f"/api/users/{user_id}") for user_id in user_ids]
+    )
+
+    assert not result.errors, f"Transport errors: {result.errors}"
+    for user_id, item in zip(user_ids, result.items):
+        assert item.path == f"/api/users/{user_id}"
+        assert item.response.status_code == 404, (
+            f"Unexpected status code for id {user_id}: {item.response.status_code}"
+        )
+
+def test_list_users_pagination_yields_all_users(api_client):
+    """
+    GET /api/users?page=N through iter_pages / iter_items:
+    - every page reports the same total_pages
+    - the items streamed add up to the advertised total
+    """
+    pages = list(api_client.iter_pages("/api/users"))
+    assert pages, "Expected at least one page"
+    assert [page["page"] for page in pages] == list(range(1, pages[0]["total_pages"] + 1))
+
+    users = list(api_client.iter_items("/api/users"))
+    assert len(users) == pages[0]["total"]
+    assert len({user["id"] for user in users}) == len(users)
+
 @pytest.mark.parametrize("payload, expected_error_substring", [
     ({"email": "user@domain"}, "missing password"),
     ({"password": "secret"}, "missing email"),
@@ -102,5 +132,5 @@ def test_login_missing_password_returns_400(api_client, payload:dict, expected_e
 
     body = response.json()
     # Validate error message schema
-    validate(instance=body, schema=ERROR_SCHEMA)
+    validate_fast("error", body)
     assert expected_error_substring in body["error"].lower()
\ No newline at end of file
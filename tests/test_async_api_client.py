@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from utils.api_client import ApiClientError
+from utils.async_api_client import AsyncApiClient
+
+
+@pytest.fixture(autouse=True)
+def api_token(monkeypatch):
+    monkeypatch.setenv("REQRES_API_TOKEN", "test-token")
+
+
+async def _run_with_server(handler, scenario):
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        return await scenario(f"http://127.0.0.1:{port}")
+    finally:
+        await runner.cleanup()
+
+
+def test_async_client_merges_headers_and_mirrors_methods():
+    async def echo(request):
+        return web.json_response({
+            "method": request.method,
+            "api_key": request.headers.get("x-api-key"),
+            "trace": request.headers.get("x-trace"),
+            "body": await request.json() if request.can_read_body else None,
+        }, status=201 if request.method == "POST" else 200)
+
+    async def scenario(base_url):
+        async with AsyncApiClient(base_url=base_url) as client:
+            got = await client.get("/api/users/2", headers={"x-trace": "abc"})
+            created = await client.post("/api/users", json={"name": "Rim"})
+            deleted = await client.delete("/api/users/2")
+        return got, created, deleted
+
+    got, created, deleted = asyncio.run(_run_with_server(echo, scenario))
+
+    assert got.status_code == 200
+    assert got.json() == {"method": "GET", "api_key": "test-token", "trace": "abc", "body": None}
+    assert created.status_code == 201
+    assert created.json()["body"] == {"name": "Rim"}
+    assert deleted.json()["method"] == "DELETE"
+
+
+def test_async_client_bounds_concurrency():
+    peak = {"now": 0, "max": 0, "hits": 0}
+
+    async def slow(request):
+        peak["hits"] += 1
+        peak["now"] += 1
+        peak["max"] = max(peak["max"], peak["now"])
+        await asyncio.sleep(0.01)
+        peak["now"] -= 1
+        return web.json_response({})
+
+    async def scenario(base_url):
+        async with AsyncApiClient(
+            base_url=base_url, max_concurrency=5, single_flight=False
+        ) as client:
+            responses = await asyncio.gather(*(client.get(f"/x/{n}") for n in range(40)))
+        return responses
+
+    responses = asyncio.run(_run_with_server(slow, scenario))
+
+    assert all(r.status_code == 200 for r in responses)
+    assert peak["hits"] == 40
+    assert peak["max"] == 5
+
+
+def test_async_single_flight_followers_get_their_own_response():
+    hits = []
+
+    async def slow(request):
+        hits.append(1)
+        await asyncio.sleep(0.05)
+        return web.json_response({"id": 2})
+
+    async def scenario(base_url):
+        async with AsyncApiClient(base_url=base_url, single_flight=True) as client:
+            return await asyncio.gather(*(client.get("/api/users/2") for _ in range(4)))
+
+    responses = asyncio.run(_run_with_server(slow, scenario))
+
+    assert len(hits) == 1
+    assert len({id(r) for r in responses}) == len({id(r.headers) for r in responses}) == 4
+    assert all(r.json() == {"id": 2} for r in responses)
+
+
+def test_async_client_wraps_transport_errors():
+    async def scenario():
+        async with AsyncApiClient(base_url="http://127.0.0.1:9") as client:
+            await client.get("/api/users/2", timeout=1)
+
+    with pytest.raises(ApiClientError) as exc_info:
+        asyncio.run(scenario())
+    assert exc_info.value.method == "GET"
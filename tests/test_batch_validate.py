@@ -0,0 +1,36 @@
+import json
+
+from utils.batch_validate import INVALID_JSON, main, validate_files
+
+GOOD_ERROR = {"error": "Missing password"}
+
+
+def _write_ndjson(path, rows):
+    path.write_text("".join(row if isinstance(row, str) else json.dumps(row) + "\n" for row in rows))
+    return str(path)
+
+
+def test_counts_and_first_errors_in_file_order(tmp_path):
+    rows = [GOOD_ERROR] * 25 + [{"error": 1}, "not json\n", "\n", {"nope": True}] + [GOOD_ERROR] * 10
+    path = _write_ndjson(tmp_path / "errors.ndjson", rows)
+
+    for workers in (0, 2):
+        report = validate_files([path], schema="error", workers=workers, chunk_size=7, max_errors=2)
+
+        assert report.lines == 38
+        assert report.counts["error"] == {"passed": 35, "failed": 2}
+        assert report.counts[INVALID_JSON] == {"passed": 0, "failed": 1}
+        assert [(e.line, e.path) for e in report.errors] == [(26, "$.error"), (27, "$")]
+        assert report.errors[0].message == "1 is not of type 'string'"
+
+
+def test_mixed_schema_records_and_cli_exit_code(tmp_path, capsys):
+    path = _write_ndjson(tmp_path / "mixed.ndjson", [
+        {"schema": "error", "body": GOOD_ERROR},
+        {"schema": "created_user", "body": {"name": "n", "job": "j", "id": "1", "createdAt": "bad"}},
+    ])
+
+    assert main([path, "--workers", "0"]) == 1
+    out = capsys.readouterr().out
+    assert "mixed.ndjson:2: [created_user] $.createdAt: 'bad' is not a 'date-time'" in out
+    assert main([_write_ndjson(tmp_path / "ok.ndjson", [GOOD_ERROR]), "--schema", "error", "--workers", "0"]) == 0
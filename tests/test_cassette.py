@@ -0,0 +1,82 @@
+from http.server import BaseHTTPRequestHandler
+import json
+
+import pytest
+
+from utils.api_client import ApiClient, ApiClientError
+from utils.cassette import Cassette, CassetteMissError, interaction_key
+
+
+class _CounterHandler(BaseHTTPRequestHandler):
+    calls = 0
+
+    def do_GET(self):
+        type(self).calls += 1
+        self._reply(200, {"path": self.path, "call": type(self).calls})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self._reply(201, dict(body, id="7"))
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_interaction_key_normalizes_query_and_json_body():
+    assert interaction_key("get", "http://H/a?b=2&a=1") == "GET http://h/a?a=1&b=2"
+    assert interaction_key("POST", "http://h/a", b'{"b": 1, "a": 2}') == interaction_key(
+        "POST", "http://h/a", '{"a":2,"b":1}'
+    )
+
+
+def test_record_then_replay_offline(serve_http, tmp_path, monkeypatch):
+    monkeypatch.setenv("REQRES_API_TOKEN", "test-token")
+    base_url = serve_http(_CounterHandler)
+    path = tmp_path / "api.jsonl"
+
+    recorder = Cassette(path, mode="record")
+    with ApiClient(base_url=base_url, cassette=recorder) as client:
+        recorded = [client.get("/api/users?page=1", use_cache=False).json() for _ in range(2)]
+        created = client.post("/api/users", json={"name": "n", "job": "j"})
+    recorder.close()
+    assert recorder.snapshot()["recorded"] == 3
+    assert path.with_name("api.jsonl.idx").exists()
+
+    # the server counts calls: every replayed response must come from the cassette
+    _CounterHandler.calls = 0
+    replayer = Cassette(path, mode="replay")
+    with ApiClient(base_url=base_url, cassette=replayer) as client:
+        replayed = [client.get("/api/users?page=1", use_cache=False).json() for _ in range(3)]
+        replayed_post = client.post("/api/users", json={"job": "j", "name": "n"})
+
+        assert replayed == recorded + recorded[-1:]
+        assert replayed_post.status_code == 201 and replayed_post.json() == created.json()
+        assert _CounterHandler.calls == 0
+
+        with pytest.raises(ApiClientError) as excinfo:
+            client.get("/api/unknown")
+        assert isinstance(excinfo.value.original_exception, CassetteMissError)
+    assert replayer.snapshot()["hits"] == 4
+
+
+def test_index_is_rebuilt_when_missing(tmp_path):
+    path = tmp_path / "c.jsonl"
+    record = {
+        "key": interaction_key("GET", "http://h/x"),
+        "request": {"method": "GET", "url": "http://h/x"},
+        "response": {"status": 204, "reason": "No Content", "url": "http://h/x", "headers": {}, "body": ""},
+    }
+    path.write_text(json.dumps(record) + "\n")
+
+    class _Request:
+        method, url, body = "GET", "http://h/x", None
+
+    assert Cassette(path).play(_Request()).status_code == 204
@@ -0,0 +1,180 @@
+from http.server import BaseHTTPRequestHandler
+import time
+
+import pytest
+
+from utils.api_client import ApiClient, ApiClientError, CircuitOpenError
+from utils.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from utils.reqres_stub import ReqresStubServer
+from utils.retry import RetryPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_opens_on_failure_rate_and_recovers_through_half_open():
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        window_size=4, min_calls=4, failure_rate_threshold=0.5,
+        open_duration=10, half_open_calls=2, clock=clock,
+    )
+    for success in (True, False, True):
+        assert breaker.allow()
+        breaker.record(success)
+    assert breaker.state == "closed"  # below min_calls
+    breaker.record(False)
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    assert breaker.retry_after() == pytest.approx(10)
+
+    clock.now = 10
+    assert breaker.state == "half_open"
+    assert breaker.allow() and breaker.allow()
+    assert not breaker.allow()  # trial slots taken
+    breaker.record(True)
+    breaker.record(True)
+    assert breaker.state == "closed"
+
+    # a fresh window: one old failure does not reopen it
+    breaker.record(False)
+    assert breaker.state == "closed"
+    assert breaker.snapshot() == {
+        "state": "closed", "calls": 7, "failures": 3, "slow_calls": 0, "rejected": 2, "opened": 1,
+    }
+
+
+def test_failed_trial_reopens_and_released_slot_is_reusable():
+    clock = FakeClock()
+    breaker = CircuitBreaker(window_size=2, min_calls=2, open_duration=5, half_open_calls=1, clock=clock)
+    breaker.record(False)
+    breaker.record(False)
+    clock.now = 5
+    assert breaker.allow()
+    breaker.record(None)  # local error: not an outcome
+    assert breaker.allow()
+    breaker.record(False)
+    assert breaker.state == "open"
+    assert breaker.snapshot()["opened"] == 2
+
+
+def test_outcomes_from_an_earlier_state_are_ignored():
+    clock = FakeClock()
+    breaker = CircuitBreaker(window_size=2, min_calls=2, open_duration=5, half_open_calls=1, clock=clock)
+    stale = breaker.allow()
+    breaker.record(False, permit=breaker.allow())
+    breaker.record(False, permit=breaker.allow())
+    assert breaker.state == "open"
+
+    clock.now = 5
+    trial = breaker.allow()
+    # a call started while closed finishes now: not a trial, cannot close it
+    breaker.record(True, permit=stale)
+    assert breaker.state == "half_open"
+    breaker.record(True, permit=trial)
+    assert breaker.state == "closed"
+    assert breaker.snapshot()["calls"] == 3
+
+
+def test_opens_on_slow_call_rate():
+    breaker = CircuitBreaker(
+        window_size=5, min_calls=5, slow_call_duration=1.0, slow_call_rate_threshold=0.6,
+    )
+    for duration in (0.1, 2.0, 0.2, 1.5, 0.3):
+        breaker.record(True, duration)
+    assert breaker.state == "closed"
+    breaker.record(True, 3.0)  # window is now 3/5 slow
+    assert breaker.state == "open"
+    assert breaker.snapshot()["slow_calls"] == 3
+
+
+def test_registry_scopes_and_settings():
+    assert CircuitBreakerRegistry.from_settings({"enabled": False}) is None
+    registry = CircuitBreakerRegistry.from_settings({"enabled": True, "min_calls": "3"})
+    route = registry.for_request("get", "https://reqres.in/api/users/2?x=1")
+    assert route is registry.for_request("GET", "https://reqres.in/api/users/7")
+    assert route.name == "reqres.in GET /api/users/{id}"
+    assert route.min_calls == 3
+    assert registry.for_request("DELETE", "https://reqres.in/api/users/2") is not route
+
+    by_host = CircuitBreakerRegistry(scope="host")
+    assert by_host.for_request("GET", "https://reqres.in/a") is by_host.for_request("POST", "https://reqres.in/b")
+
+
+def test_api_client_fails_fast_during_outage(monkeypatch):
+    monkeypatch.setenv("REQRES_API_TOKEN", "reqres-stub")
+    registry = CircuitBreakerRegistry(window_size=5, min_calls=5, open_duration=0.3, half_open_calls=1)
+    with ReqresStubServer(latency=0.05, error_rate=1.0) as stub:
+        with ApiClient(
+            base_url=stub.base_url,
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breakers=registry,
+            single_flight=False,
+        ) as client:
+            assert [client.get("/api/users/2").status_code for _ in range(5)] == [503] * 5
+
+            start = time.perf_counter()
+            for _ in range(100):
+                with pytest.raises(CircuitOpenError) as exc_info:
+                    client.get("/api/users/3")
+            elapsed = time.perf_counter() - start
+            assert isinstance(exc_info.value, ApiClientError)
+            assert 0 < exc_info.value.retry_after <= 0.3
+
+            # other routes have their own breaker
+            assert client.post("/api/users", json={}).status_code == 503
+
+            stub.faults.error_rate = 0
+            time.sleep(0.3)
+            assert client.get("/api/users/2").status_code == 200
+            stats = client.circuit_stats
+
+    assert elapsed < 0.05 * 5  # 100 rejections cost less than 5 real calls
+    assert stub.faults.injected_errors == 6
+    endpoint = stats[f"{stub.base_url.split('://')[1]} GET /api/users/{{id}}"]
+    assert endpoint["state"] == "closed"
+    assert endpoint["rejected"] == 100 and endpoint["opened"] == 1
+
+
+class _FlakyOnceHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    seen = set()
+
+    def do_GET(self):
+        first = self.path not in self.seen
+        self.seen.add(self.path)
+        body = b"{}"
+        self.send_response(503 if first else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_retry_backoff_does_not_count_as_slow(serve_http, monkeypatch):
+    monkeypatch.setenv("REQRES_API_TOKEN", "test-token")
+    _FlakyOnceHandler.seen = set()
+    registry = CircuitBreakerRegistry(
+        window_size=2, min_calls=2, slow_call_duration=0.2, slow_call_rate_threshold=0.5
+    )
+    # every retry waits 300ms locally, but the server answers instantly
+    retry = RetryPolicy(max_attempts=2, sleep=lambda _: time.sleep(0.3))
+
+    with ApiClient(
+        base_url=serve_http(_FlakyOnceHandler),
+        retry_policy=retry,
+        circuit_breakers=registry,
+    ) as client:
+        assert client.get("/api/users/1").status_code == 200
+        assert client.get("/api/users/2").status_code == 200
+        stats = client.circuit_stats
+
+    (endpoint,) = stats.values()
+    assert endpoint["state"] == "closed"
+    assert endpoint["slow_calls"] == 0
@@ -0,0 +1,38 @@
+import os
+
+from utils import config
+
+
+def _write(path, text, mtime_ns):
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_settings_are_parsed_once_until_the_file_changes(tmp_path, monkeypatch):
+    settings_file = tmp_path / "settings.yaml"
+    _write(settings_file, "api:\n  timeout: 5\n", 1_000_000_000)
+    parses = []
+    real_safe_load = config.yaml.safe_load
+    monkeypatch.setattr(
+        config.yaml, "safe_load", lambda f: parses.append(1) or real_safe_load(f)
+    )
+
+    first = config.load_settings(settings_file)
+    assert config.load_settings(settings_file) is first
+    assert config.get_setting("api.timeout", config_path=settings_file) == 5
+    assert len(parses) == 1
+
+    _write(settings_file, "api:\n  timeout: 7\n", 2_000_000_000)
+    assert config.load_settings(settings_file)["api"]["timeout"] == 7
+    assert config.reload(settings_file)["api"]["timeout"] == 7
+    assert len(parses) == 3
+
+
+def test_get_setting_dotted_paths(tmp_path):
+    settings_file = tmp_path / "settings.yaml"
+    _write(settings_file, "api:\n  retry:\n    enabled: false\n  token: null\n", 1_000_000_000)
+
+    assert config.get_setting("api.retry", config_path=settings_file) == {"enabled": False}
+    assert config.get_setting("api.retry.enabled", True, config_path=settings_file) is False
+    assert config.get_setting("api.token", "x", config_path=settings_file) is None
+    assert config.get_setting("api.missing.deeper", "x", config_path=settings_file) == "x"
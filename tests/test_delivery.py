@@ -0,0 +1,46 @@
+from utils import delivery
+from utils.delivery import DeliveryMeter, analyze
+
+
+def test_analyze_counts_loss_duplicates_and_reordering():
+    sent = {0: 0.0, 1: 0.1, 2: 0.2, 3: 0.3, 4: 0.4}
+    captures = [(0, 0.05), (2, 0.25), (1, 0.3), (2, 0.31), (4, 0.6)]
+
+    summary = analyze("run", sent, captures, send_failures=1).summary()
+
+    assert summary["sent"] == 6
+    assert summary["received"] == 4
+    assert summary["lost"] == 1 and summary["loss_rate"] == 0.2
+    assert summary["duplicates"] == 1
+    assert summary["reordered"] == 1
+    assert summary["latency"]["count"] == 4
+    assert abs(summary["latency"]["max_ms"] - 200) < 1
+    assert summary["clamped"] == 0
+
+
+def test_analyze_counts_and_warns_about_clamped_samples(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(delivery.logger, "warning", lambda msg, *args: warnings.append(msg % args))
+    # created_at truncated to the second: captures look older than their sends
+    sent = {0: 100.4, 1: 100.9, 2: 101.2}
+    captures = [(0, 100.0), (1, 101.0), (2, 101.0)]
+
+    summary = analyze("run", sent, captures, clock="wall").summary()
+
+    assert summary["clamped"] == 2
+    assert summary["latency"]["count"] == 3
+    assert len(warnings) == 1 and "2 of 3 latency samples were negative" in warnings[0]
+
+
+def test_meter_measures_local_delivery(indexed_webhook_client):
+    meter = DeliveryMeter(indexed_webhook_client)
+    meter.run(20)
+    meter.run(30, concurrency=4)
+
+    report = meter.collect(settle=2)
+
+    summary = report.summary()
+    assert (summary["sent"], summary["received"], summary["lost"]) == (50, 50, 0)
+    assert summary["duplicates"] == 0
+    assert summary["latency"]["count"] == 50
+    assert 0 < summary["latency"]["max_ms"] < 2000
@@ -0,0 +1,126 @@
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+import itertools
+import threading
+import time
+
+import pytest
+
+from utils.api_client import ApiClient
+from utils.hedging import HedgePolicy
+from utils.latency import LatencyRecorder
+from utils.retry import RetryBudget
+
+
+def test_hedge_wins_when_primary_is_slow():
+    calls = itertools.count()
+
+    def call():
+        if next(calls) == 0:
+            time.sleep(0.5)
+            return "slow"
+        return "fast"
+
+    policy = HedgePolicy()
+    start = time.monotonic()
+    assert policy.run(call, delay=0.02) == "fast"
+    assert time.monotonic() - start < 0.4
+    assert policy.stats.snapshot()["hedges_won"] == 1
+    policy.close()
+
+
+def test_budget_caps_hedges_and_errors_fall_back():
+    policy = HedgePolicy(budget=RetryBudget(ratio=0.0, min_per_second=0.0, max_tokens=0.0))
+    assert policy.run(lambda: time.sleep(0.05) or "done", delay=0.01) == "done"
+    assert policy.stats.snapshot()["budget_denied"] == 1
+
+    policy = HedgePolicy()
+    calls = itertools.count()
+
+    def flaky():
+        if next(calls) == 0:
+            time.sleep(0.05)
+            raise RuntimeError("primary failed")
+        time.sleep(0.1)
+        return "hedge"
+
+    assert policy.run(flaky, delay=0.01) == "hedge"
+
+    def always_fails():
+        time.sleep(0.03)
+        raise RuntimeError("always")
+
+    with pytest.raises(RuntimeError, match="always"):
+        policy.run(always_fails, delay=0.01)
+
+
+def test_more_callers_than_workers_do_not_hedge_fast_calls():
+    policy = HedgePolicy(max_workers=2)
+
+    def fast():
+        time.sleep(0.005)
+        return "ok"
+
+    # 32 callers on 2 workers: queueing alone would exceed the 50ms delay
+    with ThreadPoolExecutor(max_workers=32) as callers:
+        results = list(callers.map(lambda _: policy.run(fast, delay=0.05), range(32)))
+    policy.close()
+
+    stats = policy.stats.snapshot()
+    assert results == ["ok"] * 32
+    assert stats["hedges_sent"] == 0
+    assert stats["pool_saturated"] > 0
+
+
+def test_delay_needs_enough_samples():
+    latency = LatencyRecorder()
+    policy = HedgePolicy(min_samples=3, percentile=50)
+    latency.record("GET", "/api/users/1", 200, 10_000_000)
+    assert policy.delay_for(latency, "GET", "/api/users/2") is None
+    for _ in range(2):
+        latency.record("GET", "/api/users/3", 200, 10_000_000)
+    assert policy.delay_for(latency, "GET", "/api/users/2") == pytest.approx(0.01, rel=0.05)
+
+
+class _SometimesSlowHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    seen = set()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            first = self.path not in self.seen
+            self.seen.add(self.path)
+        if first and "slow" in self.path:
+            time.sleep(0.5)
+        body = b'{"data": {}}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_api_client_hedges_slow_get(serve_http, monkeypatch):
+    monkeypatch.setenv("REQRES_API_TOKEN", "test-token")
+    base_url = serve_http(_SometimesSlowHandler)
+    # warm-up calls are never hedged (fewer than min_samples before each),
+    # and min_delay keeps a stalled keep-alive call from triggering a hedge
+    policy = HedgePolicy(min_samples=10, percentile=90, min_delay=0.1)
+
+    with ApiClient(base_url=base_url, hedging=policy, single_flight=False) as client:
+        for n in range(10):
+            client.get(f"/api/users/{n}", use_cache=False)
+        before = client.hedge_stats
+        start = time.monotonic()
+        response = client.get("/api/users/2?slow=1", use_cache=False)
+        elapsed = time.monotonic() - start
+        client.post("/api/users/2?slow=1")  # not idempotent: never hedged
+
+    assert response.status_code == 200
+    assert elapsed < 0.4
+    after = client.hedge_stats
+    assert after["hedges_sent"] - before["hedges_sent"] == 1
+    assert after["hedges_won"] - before["hedges_won"] == 1
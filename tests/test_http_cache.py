@@ -0,0 +1,109 @@
+from http.server import BaseHTTPRequestHandler
+import json
+import time
+
+import pytest
+import requests
+
+from utils.api_client import ApiClient
+from utils.http_cache import ResponseCache, copy_response
+
+
+class _UserHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    bodies_sent = 0
+
+    def do_GET(self):
+        etag = '"user-v1"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        type(self).bodies_sent += 1
+        body = json.dumps({"data": {"id": 2, "path": self.path}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def cached_client(serve_http, monkeypatch):
+    monkeypatch.setenv("REQRES_API_TOKEN", "test-token")
+    _UserHandler.bodies_sent = 0
+    base_url = serve_http(_UserHandler)
+    with ApiClient(base_url=base_url, cache=ResponseCache(ttl=0.05)) as client:
+        yield client
+
+
+def test_fresh_entries_are_served_without_a_request(cached_client):
+    first = cached_client.get("/api/users/2")
+    second = cached_client.get("/api/users/2")
+
+    assert second.json() == first.json()
+    assert _UserHandler.bodies_sent == 1
+    assert cached_client.cache_stats["hits"] == 1
+
+
+def test_stale_entries_are_revalidated_with_etag(cached_client):
+    cached_client.get("/api/users/2")
+    time.sleep(0.06)
+
+    response = cached_client.get("/api/users/2")
+
+    assert response.status_code == 200
+    assert response.json()["data"]["id"] == 2
+    assert _UserHandler.bodies_sent == 1
+    assert cached_client.cache_stats["revalidations"] == 1
+
+
+def test_query_params_and_opt_out_bypass_the_entry(cached_client):
+    cached_client.get("/api/users", params={"page": 1})
+    cached_client.get("/api/users", params={"page": 2})
+    cached_client.get("/api/users", params={"page": 1}, use_cache=False)
+
+    assert _UserHandler.bodies_sent == 3
+
+
+def test_lru_is_bounded_by_entries():
+    cache = ResponseCache(max_entries=2)
+
+    class _Resp:
+        status_code = 200
+        content = b"{}"
+        headers = {}
+
+    for n in range(3):
+        cache.store((f"http://x/{n}",), _Resp())
+
+    assert cache.snapshot()["entries"] == 2
+    assert cache.snapshot()["evictions"] == 1
+    assert cache.lookup(("http://x/0",)) == (None, False)
+
+
+def test_revalidation_does_not_change_headers_callers_hold():
+    cache = ResponseCache()
+    key = ("http://x/api/users/2",)
+    original = requests.Response()
+    original.status_code = 200
+    original._content = b"{}"
+    original.headers["ETag"] = '"v1"'
+    cache.store(key, original)
+    entry, _ = cache.lookup(key)
+    held = copy_response(entry.response)
+
+    not_modified = requests.Response()
+    not_modified.status_code = 304
+    not_modified.headers["ETag"] = '"v2"'
+    refreshed = cache.revalidated(key, not_modified)
+
+    assert refreshed.headers["ETag"] == '"v2"'
+    assert original.headers["ETag"] == held.headers["ETag"] == '"v1"'
+    assert cache.lookup(key)[0].etag == '"v2"'
@@ -0,0 +1,77 @@
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from utils.http_pool import PooledSession, pool_settings
+from utils.webhook_utils import WebhookClient
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_url(serve_http):
+    return serve_http(_OkHandler)
+
+
+def test_session_reuses_keep_alive_connection(local_url):
+    with PooledSession(pool_maxsize=2) as session:
+        for _ in range(5):
+            assert session.get(f"{local_url}/ping").status_code == 200
+
+        stats = session.stats.snapshot()
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 4
+
+
+def test_idle_connections_are_evicted(local_url):
+    with PooledSession(keepalive_idle_timeout=0) as session:
+        session.get(f"{local_url}/ping")
+        session.get(f"{local_url}/ping")
+
+        stats = session.stats.snapshot()
+    assert stats["new_connections"] == 2
+    assert stats["idle_evictions"] == 1
+
+
+def test_webhook_client_pools_target_and_api_separately(local_url):
+    with WebhookClient(target_url=f"{local_url}/token-1", api_base_url=local_url) as client:
+        assert client.target_session is not client.api_session
+        for n in range(3):
+            assert client.send_event({"n": n}).status_code == 200
+            assert client.retrieve_latest_request() == {}
+
+        stats = client.connection_stats
+    for name in ("target", "api"):
+        assert stats[name]["new_connections"] == 1
+        assert stats[name]["reused_connections"] == 2
+
+
+def test_pool_settings_fall_back_to_defaults():
+    settings = pool_settings({"pool_maxsize": "not-a-number"})
+    assert settings["pool_maxsize"] == 10
+    assert settings["keepalive_idle_timeout"] == 30.0
+
+    settings = pool_settings(
+        {"pool_connections": None, "pool_maxsize": None, "keepalive_idle_timeout": None}
+    )
+    assert settings["pool_connections"] == 10
+    assert settings["pool_maxsize"] == 10
+    # only the idle timeout may be disabled with null
+    assert settings["keepalive_idle_timeout"] is None
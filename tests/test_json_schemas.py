@@ -0,0 +1,57 @@
+import jsonschema
+import pytest
+
+from utils.json_schemas import USER_SCHEMA, get_validator, validate_fast
+
+USER_BODY = {
+    "data": {
+        "id": 2,
+        "email": "janet.weaver@reqres.in",
+        "first_name": "Janet",
+        "last_name": "Weaver",
+        "avatar": "https://reqres.in/img/faces/2-image.jpg",
+    }
+}
+
+
+def test_validators_are_built_once():
+    assert get_validator("user") is get_validator("user")
+    validate_fast("user", USER_BODY)
+
+
+def test_validate_fast_raises_like_jsonschema():
+    body = {"data": dict(USER_BODY["data"], id="2")}
+
+    with pytest.raises(jsonschema.ValidationError) as fast:
+        validate_fast("user", body)
+    with pytest.raises(jsonschema.ValidationError) as reference:
+        jsonschema.validate(body, USER_SCHEMA)
+
+    assert fast.value.message == reference.value.message
+    assert list(fast.value.absolute_path) == ["data", "id"]
+
+
+@pytest.mark.parametrize(
+    "name, instance",
+    [
+        ("user", {"data": dict(USER_BODY["data"], email="not-an-email")}),
+        ("created_user", {"name": "n", "job": "j", "id": "1", "createdAt": "yesterday"}),
+        ("created_user", {"name": "n", "job": "j", "id": "1", "createdAt": "2024-01-01"}),
+    ],
+)
+def test_formats_are_checked(name, instance):
+    with pytest.raises(jsonschema.ValidationError, match="is not a"):
+        validate_fast(name, instance)
+
+
+@pytest.mark.parametrize(
+    "created_at",
+    ["2024-01-01T12:00:00.000Z", "2024-01-01T12:00:00z", "2024-01-01T12:00:00.1+02:00"],
+)
+def test_valid_date_time(created_at):
+    validate_fast("created_user", {"name": "n", "job": "j", "id": "1", "createdAt": created_at})
+
+
+def test_unknown_schema():
+    with pytest.raises(KeyError):
+        validate_fast("nope", {})
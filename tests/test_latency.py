@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from utils.latency import LatencyHistogram, LatencyRecorder, status_class, template_path
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("/api/users/2", "/api/users/{id}"),
+    ("api/users/12345?delay=3", "/api/users/{id}"),
+    ("/token/0b5a4f6e-6b1a-4a53-9d5e-2b2f7c1b9e11/request/latest", "/token/{id}/request/latest"),
+    ("/api/users", "/api/users"),
+])
+def test_template_path_collapses_ids(path, expected):
+    assert template_path(path) == expected
+
+
+def test_status_class():
+    assert status_class(204) == "2xx"
+    assert status_class(404) == "4xx"
+    assert status_class(None) == "error"
+
+
+def test_percentiles_are_within_relative_error():
+    histogram = LatencyHistogram(precision=7)
+    values = [random.randint(1_000, 5_000_000_000) for _ in range(20_000)]
+    for value in values:
+        histogram.record(value)
+    values.sort()
+
+    for q in (50, 90, 99, 99.9):
+        exact = values[max(0, int(round(q / 100 * len(values))) - 1)]
+        assert histogram.percentile(q) == pytest.approx(exact, rel=0.03)
+    assert histogram.percentile(100) == values[-1]
+    assert histogram.percentile(0) == values[0]
+
+
+def test_small_values_are_exact():
+    histogram = LatencyHistogram(precision=7)
+    for value in range(1, 101):
+        histogram.record(value)
+    assert histogram.percentile(50) == 50
+
+
+def test_recorder_snapshot_and_reset():
+    recorder = LatencyRecorder()
+    recorder.record("get", "/api/users/2", 200, 2_000_000)
+    recorder.record("GET", "/api/users/3", 200, 4_000_000)
+    recorder.record("GET", "/api/users/999", 404, 1_000_000)
+
+    snapshot = recorder.snapshot(reset=True)
+
+    assert set(snapshot) == {"GET /api/users/{id} 2xx", "GET /api/users/{id} 4xx"}
+    assert snapshot["GET /api/users/{id} 2xx"]["count"] == 2
+    assert snapshot["GET /api/users/{id} 2xx"]["max_ms"] == 4.0
+    assert "p99.9_ms" in snapshot["GET /api/users/{id} 2xx"]
+    assert recorder.snapshot()["GET /api/users/{id} 2xx"]["count"] == 0
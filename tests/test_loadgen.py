@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from utils.api_client import ApiClient
+from utils.loadgen import SCENARIOS, Scenario, Stage, arrival_offsets, main, run_load
+
+
+def test_arrival_schedule_follows_stages():
+    offsets = list(arrival_offsets([Stage(1, 10), Stage(1, 10, 30)]))
+
+    assert len([t for t in offsets if t < 1]) == 9
+    # linear ramp 10 -> 30 rps over the second stage: ~20 arrivals
+    assert 17 <= len([t for t in offsets if t >= 1]) <= 21
+    assert offsets == sorted(offsets)
+
+    poisson = list(arrival_offsets([Stage(10, 50)], poisson=True, rng=random.Random(1)))
+    assert 400 <= len(poisson) <= 600
+
+
+def test_open_loop_counts_queueing_in_latency(reqres_stub, monkeypatch):
+    monkeypatch.setenv("REQRES_API_TOKEN", "reqres-stub")
+    monkeypatch.setattr(reqres_stub.faults, "latency", 0.02)
+    scenarios = [SCENARIOS["get_user"], SCENARIOS["login_missing_password"]]
+
+    with ApiClient(base_url=reqres_stub.base_url, single_flight=False) as client:
+        # one worker, 100 rps, 20ms service time: requests must queue
+        report = run_load(client, scenarios, [Stage(0.3, 100)], workers=1, seed=7)
+
+    summary = report.summary()
+    stats = summary["scenarios"]
+    assert sum(s["count"] for s in stats.values()) == report.scheduled == 29
+    assert all(s["errors"] == 0 for s in stats.values())
+    worst = max(s["latency"]["max_ms"] for s in stats.values())
+    assert worst > 2 * max(s["service"]["max_ms"] for s in stats.values())
+
+
+def test_unexpected_scenario_exceptions_count_as_errors(monkeypatch):
+    monkeypatch.setenv("REQRES_API_TOKEN", "test-token")
+
+    def broken(client):
+        raise KeyError("not an ApiClientError")
+
+    with ApiClient(base_url="http://127.0.0.1:9") as client:
+        report = run_load(client, [Scenario("broken", broken, 200)], [Stage(0.1, 50)], workers=2)
+
+    stats = report.scenarios["broken"]
+    assert stats.count == stats.errors == report.scheduled == 4
+
+
+def test_cli_rejects_unknown_scenario():
+    with pytest.raises(SystemExit):
+        main(["--stage", "1:1", "--scenario", "nope"])
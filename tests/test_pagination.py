@@ -0,0 +1,73 @@
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlparse
+import json
+
+import pytest
+
+from utils.api_client import ApiClient, ApiClientError
+
+TOTAL_PAGES = 5
+PER_PAGE = 3
+
+
+class _UsersHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    pages_served = []
+
+    def do_GET(self):
+        page = int(parse_qs(urlparse(self.path).query).get("page", ["1"])[0])
+        type(self).pages_served.append(page)
+        if page > TOTAL_PAGES:
+            status, body = 500, {}
+        else:
+            status, body = 200, {
+                "page": page,
+                "per_page": PER_PAGE,
+                "total_pages": TOTAL_PAGES,
+                "data": [{"id": (page - 1) * PER_PAGE + n} for n in range(1, PER_PAGE + 1)],
+            }
+        raw = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def client(serve_http, monkeypatch):
+    monkeypatch.setenv("REQRES_API_TOKEN", "test-token")
+    _UsersHandler.pages_served = []
+    with ApiClient(base_url=serve_http(_UsersHandler), single_flight=False) as api:
+        yield api
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_iter_items_streams_every_page_in_order(client, prefetch):
+    ids = [user["id"] for user in client.iter_items("/api/users", prefetch=prefetch)]
+
+    assert ids == list(range(1, TOTAL_PAGES * PER_PAGE + 1))
+    assert sorted(_UsersHandler.pages_served) == list(range(1, TOTAL_PAGES + 1))
+
+
+def test_iter_pages_starts_from_requested_page(client):
+    pages = [page["page"] for page in client.iter_pages("/api/users", params={"page": 4})]
+
+    assert pages == [4, 5]
+
+
+def test_prefetch_window_bounds_pages_fetched_ahead(client):
+    pages = client.iter_pages("/api/users", prefetch=1)
+    next(pages)
+    next(pages)
+    pages.close()
+
+    # page 1, page 2 (consumed) and at most one page prefetched ahead
+    assert max(_UsersHandler.pages_served) <= 3
+
+
+def test_non_200_page_raises(client):
+    with pytest.raises(ApiClientError):
+        list(client.iter_pages("/api/users", params={"page": TOTAL_PAGES + 1}))
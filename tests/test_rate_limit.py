@@ -0,0 +1,61 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from utils.rate_limit import RateLimiterRegistry, TokenBucket
+
+
+def test_burst_is_free_then_requests_are_spaced_by_rate():
+    bucket = TokenBucket(rate=50, burst=5)
+
+    start = time.monotonic()
+    for _ in range(10):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+
+    # 5 tokens from the burst, 5 more at 50/s -> ~0.1s
+    assert 0.08 <= elapsed < 0.5
+    assert bucket.snapshot()["waits"] == 5
+
+
+def test_bucket_is_shared_safely_between_threads():
+    bucket = TokenBucket(rate=200, burst=1)
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(20)]
+
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - start >= 19 / 200 * 0.9
+
+
+def test_bucket_works_from_asyncio_tasks():
+    bucket = TokenBucket(rate=100, burst=1)
+
+    async def scenario():
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(11)))
+        return time.monotonic() - start
+
+    assert asyncio.run(scenario()) >= 0.09
+
+
+def test_registry_matches_host_and_ignores_unknown_hosts():
+    registry = RateLimiterRegistry({
+        "reqres.in": {"rate": 5, "burst": 2},
+        "127.0.0.1:8080": {"rate": 1},
+    })
+
+    assert registry.for_url("https://reqres.in/api/users/2").rate == 5
+    assert registry.for_url("http://127.0.0.1:8080/x").burst == 1
+    assert registry.for_url("http://127.0.0.1:9090/x") is None
+    assert registry.acquire("https://webhook.site/abc") == 0.0
+
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
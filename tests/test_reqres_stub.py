@@ -0,0 +1,44 @@
+import time
+
+import pytest
+
+from utils.api_client import ApiClient
+from utils.reqres_stub import ReqresStubServer
+from utils.retry import RetryPolicy
+
+
+@pytest.fixture
+def stub_client(reqres_stub, monkeypatch):
+    monkeypatch.setenv("REQRES_API_TOKEN", "reqres-stub")
+    with ApiClient(base_url=reqres_stub.base_url) as client:
+        yield client
+
+
+def test_stub_serves_reqres_shapes(stub_client):
+    assert stub_client.get("/api/users/2").json()["data"]["email"] == "janet.weaver@reqres.in"
+    missing = stub_client.get("/api/users/23")
+    assert (missing.status_code, missing.text) == (404, "{}")
+    assert [len(page["data"]) for page in stub_client.iter_pages("/api/users")] == [6, 6]
+
+    login = stub_client.post("/api/login", json={"email": "eve.holt@reqres.in", "password": "x"})
+    assert login.json() == {"token": "QpwL5tke4Pnpja7X4"}
+    created = stub_client.post("/api/users", json={"name": "n", "job": "j"})
+    assert created.status_code == 201 and created.json()["createdAt"].endswith("Z")
+    assert stub_client.delete("/api/users/2").status_code == 204
+
+
+def test_fault_injection_latency_and_errors(monkeypatch):
+    monkeypatch.setenv("REQRES_API_TOKEN", "reqres-stub")
+    with ReqresStubServer(latency=0.05, error_rate=0.5, seed=3) as stub:
+        with ApiClient(base_url=stub.base_url, retry_policy=RetryPolicy(max_attempts=1)) as client:
+            start = time.monotonic()
+            statuses = [client.get("/api/users/2").status_code for _ in range(10)]
+            elapsed = time.monotonic() - start
+
+            stub.faults.error_rate = 0
+            stub.faults.latency = 0
+            assert client.get("/api/users/2").status_code == 200
+
+    assert elapsed >= 10 * 0.05
+    assert set(statuses) == {200, 503}
+    assert statuses.count(503) == stub.faults.injected_errors
@@ -0,0 +1,95 @@
+import pytest
+
+from utils.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _sequence(*outcomes):
+    outcomes = list(outcomes)
+
+    def send():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return send
+
+
+def test_retries_transient_statuses_then_returns_success():
+    sleeps = []
+    policy = RetryPolicy(max_attempts=3, sleep=sleeps.append)
+    first = FakeResponse(503)
+
+    response, attempts = policy.run("GET", _sequence(first, FakeResponse(200)))
+
+    assert response.status_code == 200
+    assert attempts == 2
+    assert first.closed
+    assert len(sleeps) == 1
+    assert policy.stats.snapshot()["attempts_per_request"] == {2: 1}
+
+
+def test_does_not_retry_non_idempotent_methods():
+    policy = RetryPolicy(max_attempts=3, sleep=lambda _: None)
+
+    response, attempts = policy.run("POST", _sequence(FakeResponse(503)))
+
+    assert response.status_code == 503
+    assert attempts == 1
+
+
+def test_gives_up_after_max_attempts_and_reraises_transport_error():
+    policy = RetryPolicy(max_attempts=2, sleep=lambda _: None)
+
+    with pytest.raises(ConnectionError):
+        policy.run(
+            "GET",
+            _sequence(ConnectionError("boom"), ConnectionError("boom again")),
+            retry_exceptions=(ConnectionError,),
+        )
+    assert policy.stats.snapshot()["attempts"] == 2
+
+
+def test_retry_after_header_overrides_backoff():
+    sleeps = []
+    policy = RetryPolicy(max_attempts=2, max_retry_after=5, sleep=sleeps.append)
+
+    policy.run("GET", _sequence(FakeResponse(429, {"Retry-After": "3"}), FakeResponse(200)))
+    policy.run("GET", _sequence(FakeResponse(429, {"Retry-After": "120"}), FakeResponse(200)))
+
+    assert sleeps == [3.0, 5.0]
+
+
+def test_backoff_is_capped_full_jitter():
+    policy = RetryPolicy(backoff_base=1.0, backoff_cap=4.0)
+    for retry_number in range(1, 10):
+        assert 0 <= policy.backoff(retry_number) <= min(4.0, 2 ** (retry_number - 1))
+
+
+def test_empty_budget_stops_retries():
+    budget = RetryBudget(ratio=0.0, min_per_second=0.0, max_tokens=1.0)
+    policy = RetryPolicy(max_attempts=5, budget=budget, sleep=lambda _: None)
+
+    response, attempts = policy.run(
+        "GET", _sequence(FakeResponse(503), FakeResponse(503), FakeResponse(200))
+    )
+
+    assert response.status_code == 503
+    assert attempts == 2
+    assert policy.stats.snapshot()["budget_exhausted"] == 1
+
+
+def test_parse_retry_after_handles_http_dates_and_garbage():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
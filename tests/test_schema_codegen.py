@@ -0,0 +1,82 @@
+import copy
+
+import jsonschema
+import pytest
+
+from utils import json_schemas, schema_codegen
+from utils.json_schemas import SCHEMAS, validate_fast
+
+VALID = {
+    "user": {
+        "data": {
+            "id": 2,
+            "email": "janet.weaver@reqres.in",
+            "first_name": "Janet",
+            "last_name": "Weaver",
+            "avatar": "https://reqres.in/img/faces/2-image.jpg",
+        },
+        "support": {"url": "https://reqres.in", "text": "thanks"},
+    },
+    "created_user": {"name": "n", "job": "j", "id": "7", "createdAt": "2024-01-01T12:00:00.000Z"},
+    "error": {"error": "Missing password"},
+}
+
+BAD_VALUES = [None, True, 1, 1.0, 1.5, "", "x", "2024-01-01", [], {}]
+
+
+def _mutations(instance, path=()):
+    """
+    The instance itself, then every variant with one value replaced or removed.
+    """
+    yield instance
+    if not isinstance(instance, dict):
+        return
+    for key in instance:
+        for bad in BAD_VALUES:
+            yield dict(instance, **{key: bad})
+        yield {k: v for k, v in instance.items() if k != key}
+        for nested in _mutations(instance[key]):
+            if nested is not instance[key]:
+                yield dict(instance, **{key: nested})
+
+
+@pytest.mark.parametrize("name", sorted(SCHEMAS))
+def test_generated_validator_agrees_with_jsonschema(name):
+    compiled = schema_codegen.compile_schema(name, cache_dir=None)
+    assert compiled.generated
+
+    for instance in [*BAD_VALUES, *_mutations(copy.deepcopy(VALID[name]))]:
+        try:
+            validate_fast(name, instance)
+            reference = None
+        except jsonschema.ValidationError as exc:
+            reference = exc.message
+
+        assert compiled.is_valid(instance) is (reference is None), instance
+        if reference is not None:
+            with pytest.raises(jsonschema.ValidationError) as raised:
+                compiled.validate(instance)
+            assert raised.value.message == reference
+
+
+def test_generated_source_is_cached_on_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(schema_codegen, "_compiled", {})
+    first = schema_codegen.compile_schema("user", cache_dir=tmp_path)
+    cache_file = tmp_path / f"{schema_codegen.schema_hash(SCHEMAS['user'])}.py"
+    assert cache_file.read_text() == first.source
+
+    monkeypatch.setattr(schema_codegen, "_compiled", {})
+    monkeypatch.setattr(schema_codegen, "generate_source", pytest.fail)
+    second = schema_codegen.compile_schema("user", cache_dir=tmp_path)
+    assert second.is_valid(VALID["user"])
+
+
+def test_unsupported_keywords_fall_back_to_generic(monkeypatch):
+    monkeypatch.setitem(SCHEMAS, "enum_only", {"enum": ["a", "b"]})
+    monkeypatch.setattr(json_schemas, "_VALIDATORS", {})
+    monkeypatch.setattr(schema_codegen, "_compiled", {})
+
+    compiled = schema_codegen.compile_schema("enum_only", cache_dir=None)
+
+    assert not compiled.generated
+    assert compiled.is_valid("a") and not compiled.is_valid("c")
@@ -0,0 +1,152 @@
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+import asyncio
+import threading
+import time
+
+import pytest
+
+from utils.api_client import ApiClient
+from utils.single_flight import AsyncSingleFlight, SingleFlight, request_key
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        time.sleep(0.2)
+        body = b'{"data": {"id": 2}}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_concurrent_identical_gets_share_one_upstream_request(serve_http, monkeypatch):
+    monkeypatch.setenv("REQRES_API_TOKEN", "test-token")
+    _SlowHandler.hits = 0
+    base_url = serve_http(_SlowHandler)
+
+    with ApiClient(base_url=base_url, single_flight=True) as client:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            responses = list(pool.map(lambda _: client.get("/api/users/2"), range(8)))
+        stats = client.single_flight_stats
+
+    assert _SlowHandler.hits == 1
+    assert all(r.json() == {"data": {"id": 2}} for r in responses)
+    # every caller owns its headers
+    assert len({id(r.headers) for r in responses}) == 8
+    assert stats["leaders"] == 1
+    assert stats["coalesced"] == 7
+
+
+def test_differing_headers_and_extra_kwargs_are_not_coalesced(serve_http, monkeypatch):
+    monkeypatch.setenv("REQRES_API_TOKEN", "test-token")
+    _SlowHandler.hits = 0
+    base_url = serve_http(_SlowHandler)
+    calls = [
+        lambda: client.get("/api/users/2", headers={"x-trace": "a"}),
+        lambda: client.get("/api/users/2", headers={"x-trace": "b"}),
+        lambda: client.get("/api/users/2", allow_redirects=False),
+        lambda: client.get("/api/users/2", cookies={"session": "s"}),
+    ]
+
+    with ApiClient(base_url=base_url, single_flight=True) as client:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda call: call(), calls))
+        stats = client.single_flight_stats
+
+    assert _SlowHandler.hits == 4
+    assert stats["coalesced"] == 0
+
+
+def test_errors_are_shared_with_followers():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.05)
+        raise RuntimeError("upstream down")
+
+    errors = []
+
+    def follower():
+        started.wait()
+        try:
+            flight.do("k", failing)
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=follower)
+    thread.start()
+    with pytest.raises(RuntimeError):
+        flight.do("k", failing)
+    thread.join()
+
+    assert len(errors) == 1
+    assert flight.snapshot() == {"leaders": 1, "coalesced": 1, "in_flight": 0}
+
+
+def test_async_single_flight_coalesces_tasks():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "body"
+
+    async def scenario():
+        return await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+
+    results = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert [r for r, _ in results] == ["body"] * 5
+    assert sum(shared for _, shared in results) == 4
+
+
+def test_async_followers_survive_cancelled_leader():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "body"
+
+    async def scenario():
+        leader = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(flight.do("k", fetch)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return results
+
+    results = asyncio.run(scenario())
+
+    # one follower took over as leader, the other two shared its result
+    assert len(calls) == 2
+    assert sorted(results) == [("body", False), ("body", True), ("body", True)]
+    assert flight.snapshot() == {"leaders": 2, "coalesced": 2, "in_flight": 0}
+
+
+def test_request_key_depends_on_params_headers_and_timeout():
+    base = request_key("get", "http://x/api/users", {"page": 1}, {"x-api-key": "a"})
+
+    assert base == request_key("GET", "http://x/api/users?page=1", None, {"X-Api-Key": "a"})
+    assert base != request_key("GET", "http://x/api/users", {"page": 2}, {"x-api-key": "a"})
+    assert base != request_key("GET", "http://x/api/users", {"page": 1}, {"x-api-key": "b"})
+    assert base != request_key(
+        "GET", "http://x/api/users", {"page": 1}, {"x-api-key": "a", "x-trace": "1"}
+    )
+    assert base != request_key("GET", "http://x/api/users", {"page": 1}, {"x-api-key": "a"}, 5.0)
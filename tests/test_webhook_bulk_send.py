@@ -0,0 +1,77 @@
+from http.server import BaseHTTPRequestHandler
+import json
+import threading
+
+import pytest
+
+from utils.webhook_utils import WebhookClient, WebhookClientError
+
+
+def test_send_events_streams_a_generator(local_webhook_client, capture_server):
+    consumed = []
+
+    def payloads():
+        for n in range(200):
+            consumed.append(n)
+            yield {"event_id": f"bulk-{n}", "seq": n}
+
+    report = local_webhook_client.send_events(payloads(), concurrency=4)
+
+    assert [event.index for event in report.events] == list(range(200))
+    assert not report.failures
+    assert all(event.status_code == 200 for event in report.events)
+    assert report.bytes_sent == sum(
+        len(json.dumps({"event_id": f"bulk-{n}", "seq": n}).encode()) for n in range(200)
+    )
+    summary = report.summary()
+    assert summary["count"] == 200
+    assert summary["events_per_second"] > 0
+    assert summary["latency"]["count"] == 200
+    token_id = local_webhook_client._extract_token_id()
+    assert capture_server.store.count(token_id) == 200
+
+
+def test_send_events_builds_callable_payloads_in_the_worker(local_webhook_client):
+    built_in = []
+
+    def build(n):
+        built_in.append(threading.current_thread().name)
+        return {"event_id": f"lazy-{n}"}
+
+    report = local_webhook_client.send_events(
+        (lambda n=n: build(n) for n in range(20)), concurrency=2
+    )
+
+    assert not report.failures
+    assert report.bytes_sent == sum(len(json.dumps({"event_id": f"lazy-{n}"})) for n in range(20))
+    assert len(built_in) == 20
+    assert all(name.startswith("webhook-send") for name in built_in)
+
+
+def test_send_events_records_failures_per_event(serve_http):
+    class _FlakyHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            status = 500 if body["n"] % 3 == 0 else 200
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    base_url = serve_http(_FlakyHandler)
+    with WebhookClient(target_url=f"{base_url}/token") as client:
+        def broken_builder():
+            raise KeyError("seq")
+
+        report = client.send_events(
+            [{"n": n} for n in range(9)] + [{"n": float("nan")}, broken_builder], concurrency=2
+        )
+        with pytest.raises(WebhookClientError, match="not JSON serialisable"):
+            client.send_event({"n": float("nan")})
+
+    assert [event.index for event in report.failures] == [0, 3, 6, 9, 10]
+    assert report.events[3].status_code == 500
+    assert report.events[9].error is not None and report.events[9].status_code is None
+    assert isinstance(report.events[10].error.original_exception, KeyError)
@@ -0,0 +1,105 @@
+from uuid import uuid4
+import json
+import threading
+import time
+
+from utils.webhook_capture import CaptureStore
+from utils.webhook_utils import match_correlation_id, match_event_id
+
+
+def test_capture_round_trip_matches_webhook_site_shape(local_webhook_client):
+    event_id = str(uuid4())
+    response = local_webhook_client.send_event(
+        payload={"event_id": event_id, "data": {"n": 1}},
+        headers={"x-correlation-id": "cid-42"},
+    )
+    assert response.status_code == 200
+
+    latest = local_webhook_client.retrieve_latest_request()
+
+    assert latest["method"] == "POST"
+    assert latest["headers"]["x-correlation-id"] == ["cid-42"]
+    assert isinstance(latest["content"], str)
+    assert json.loads(latest["content"]) == {"event_id": event_id, "data": {"n": 1}}
+    assert local_webhook_client.retrieve_latest_request_content()["event_id"] == event_id
+
+
+def test_latest_is_404_for_unused_token(local_webhook_client):
+    assert local_webhook_client.retrieve_latest_request() == {}
+
+
+def test_search_and_wait_against_local_server(local_webhook_client):
+    for n in range(30):
+        local_webhook_client.send_event(
+            payload={"event_id": f"evt-{n}"}, headers={"x-correlation-id": f"cid-{n}"}
+        )
+
+    assert local_webhook_client.find_request(event_id="evt-3", per_page=10)["headers"][
+        "x-correlation-id"
+    ] == ["cid-3"]
+    event = local_webhook_client.wait_for_event(
+        match_correlation_id("cid-29"), deadline=2
+    )
+    assert event.content == {"event_id": "evt-29"}
+    assert local_webhook_client.wait_for_event(
+        match_event_id("evt-0"), deadline=2, search=True, search_pages=3
+    ) is not None
+
+
+def test_store_pages_newest_first_and_bounds_memory():
+    store = CaptureStore(max_per_token=3)
+    for n in range(5):
+        store.add("tok", "POST", "http://x/tok", {}, json.dumps({"event_id": n}))
+
+    items, total = store.page("tok", per_page=2)
+
+    assert total == 3
+    assert [json.loads(c["content"])["event_id"] for c in items] == [4, 3]
+    assert store.page("tok", query='content:"2"')[1] == 1
+
+
+def test_store_indexes_event_and_correlation_ids():
+    store = CaptureStore(max_per_token=2)
+    store.add("tok", "POST", "http://x/tok", {"x-correlation-id": ["c1"]}, json.dumps({"event_id": "e1"}))
+    store.add("tok", "POST", "http://x/tok", {}, "not json event_id")
+    store.add("other", "POST", "http://x/other", {}, json.dumps({"event_id": "e2"}))
+
+    assert store.find(event_id="e1")["headers"] == {"x-correlation-id": ["c1"]}
+    assert store.find(correlation_id="c1", token_id="other") is None
+    assert store.find(event_id="e2", token_id="tok") is None
+
+    # evicting e1 from the bounded deque drops it from the indexes too
+    store.add("tok", "POST", "http://x/tok", {}, "{}")
+    assert store.find(event_id="e1") is None
+    assert store.find(correlation_id="c1") is None
+
+
+def test_store_wait_for_wakes_on_capture():
+    store = CaptureStore()
+    timer = threading.Timer(
+        0.05, store.add, ("tok", "POST", "http://x/tok", {}, json.dumps({"event_id": "late"}))
+    )
+    timer.start()
+    started = time.monotonic()
+
+    found = store.wait_for(token_id="tok", event_id="late", timeout=5)
+
+    assert json.loads(found["content"]) == {"event_id": "late"}
+    assert time.monotonic() - started < 1
+    assert store.wait_for(token_id="tok", predicate=lambda c: c["method"] == "PUT", timeout=0.05) is None
+
+
+def test_indexed_client_waits_without_polling(indexed_webhook_client):
+    sent_at = time.monotonic()
+    indexed_webhook_client.send_event(
+        payload={"event_id": "evt-idx"}, headers={"x-correlation-id": "cid-idx"}
+    )
+
+    event = indexed_webhook_client.wait_for_event(
+        match_event_id("evt-idx"), deadline=2, sent_at=sent_at
+    )
+
+    assert event.polls == 0
+    assert 0 <= event.latency < 2
+    assert indexed_webhook_client.find_request(correlation_id="cid-idx")["uuid"] == event.request["uuid"]
+    assert indexed_webhook_client.find_request(event_id="missing") == {}
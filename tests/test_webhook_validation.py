@@ -2,7 +2,8 @@ from datetime import datetime, timezone
 from uuid import uuid4
 import time
 import pytest
-import json
+
+from utils.webhook_utils import match_event_id, header_value
 
 def test_e2e_timestamp_delivery_and_validation(webhook_client):
 
@@ -21,22 +22,19 @@ def test_e2e_timestamp_delivery_and_validation(webhook_client):
     }
 
     # 2. send POST to webhook URL
+    sent_at = time.monotonic()
     post_response = webhook_client.send_event(payload=payload)
 
     assert 200 <= post_response.status_code < 300, (f"unexpected status code from webhook: {post_response.status_code}, body: {post_response.text}")
 
-    # 3. Ping webhook.site API briefly for the latest request
-    latest_body = None
-    max_attempts = 5
-    for attempt in range(1, max_attempts + 1):
-        latest_body = webhook_client.retrieve_latest_request_content()
-        # check if it is our event (matching event_id)
-        if latest_body.get("event_id") == event_id:
-            break
-        # if not , wait a bit before retrying
-        time.sleep(1)
-
-    assert latest_body is not None, "Did not receive any webhook request body"
+    # 3. wait (adaptive polling) until webhook.site has captured our event;
+    # search=True looks it up by event_id, so parallel senders cannot race us
+    event = webhook_client.wait_for_event(
+        match_event_id(event_id), deadline=10, sent_at=sent_at, search=True
+    )
+
+    assert event is not None, f"Webhook event {event_id} was not captured within 10s"
+    latest_body = event.content
     assert latest_body.get("event_id") == event_id, (f"Latest webhook request does not match our event_id, body was: {latest_body}")
 
     # 4. validate some fields in the payload
@@ -85,29 +83,14 @@ def test_correlation_id(webhook_client):
     response = webhook_client.send_event(payload=payload, headers=headers)
     assert 200 <= response.status_code < 300, (f"unexpected status code from webhook: {response.status_code}, body: {response.text}")
     
-    # 3. poll the API until we retrieve the matching event
-
-    max_attempts = 5
-    metadata = None
-
-    for attempt in range(max_attempts):
-        metadata = webhook_client.retrieve_latest_request()
-        raw_content = metadata.get("content")
-
-        if raw_content:
-            try:
-                content_json = json.loads(raw_content)
-                # Check if this is the event we just sent
-                if content_json.get("event_id") == payload["event_id"]:
-                    break
-            except json.JSONDecodeError:
-                pass
-
-        time.sleep(1)
-
-    assert metadata is not None, "Failed to retrieve webhook metadata"
-    # 4. check if correlation ID is in headers
-    retrieved_headers = metadata.get("headers", {}) # returns a list of headers
-    assert retrieved_headers.get("x-correlation-id")[0] == correlation_id, (f"correlation id mismatch, sent {correlation_id}, got {retrieved_headers.get('x-correlation-id')}")
+    # 3. wait until the API returns the matching event
+    event = webhook_client.wait_for_event(
+        match_event_id(payload["event_id"]), deadline=10, search=True
+    )
+
+    assert event is not None, "Failed to retrieve webhook metadata"
+    metadata = event.request
+    # 4. check if correlation ID is in headers (stored as a list per header)
+    assert header_value(metadata, "x-correlation-id") == correlation_id, (f"correlation id mismatch, sent {correlation_id}, got {metadata.get('headers', {}).get('x-correlation-id')}")
 
 
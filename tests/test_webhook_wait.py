@@ -0,0 +1,188 @@
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlparse
+import json
+import time
+
+import pytest
+
+from utils.webhook_utils import (
+    WebhookClient,
+    WebhookClientError,
+    match_correlation_id,
+    match_event_id,
+)
+
+
+class _LatestHandler(BaseHTTPRequestHandler):
+    """
+    Serves /token/{id}/request/latest: 502 for the first `failures` polls,
+    404 until `ready_after` seconds have passed, then a capture of `event_id`.
+    """
+
+    protocol_version = "HTTP/1.1"
+    started = 0.0
+    ready_after = 0.0
+    failures = 0
+    polls = 0
+
+    def do_GET(self):
+        type(self).polls += 1
+        if self.polls <= self.failures:
+            status, body = 502, "Bad Gateway"
+        elif time.monotonic() - self.started < self.ready_after:
+            status, body = 404, {"success": False}
+        else:
+            status, body = 200, {
+                "uuid": "req-1",
+                "headers": {"x-correlation-id": ["cid-1"]},
+                "content": json.dumps({"event_id": "evt-1"}),
+            }
+        raw = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def client_for(serve_http):
+    def build(ready_after, failures=0):
+        _LatestHandler.started = time.monotonic()
+        _LatestHandler.ready_after = ready_after
+        _LatestHandler.failures = failures
+        _LatestHandler.polls = 0
+        base_url = serve_http(_LatestHandler)
+        return WebhookClient(target_url=f"{base_url}/token-1", api_base_url=base_url)
+
+    return build
+
+
+def test_wait_returns_matching_event_with_latency(client_for):
+    with client_for(ready_after=0.2) as client:
+        event = client.wait_for_event(match_event_id("evt-1"), deadline=5)
+
+    assert event is not None
+    assert event.content == {"event_id": "evt-1"}
+    assert 0.2 <= event.latency < 1.5
+    # tight first intervals: several polls in the first 200ms, not one per second
+    assert event.polls >= 3
+
+
+def test_wait_honors_deadline(client_for):
+    with client_for(ready_after=60) as client:
+        start = time.monotonic()
+        event = client.wait_for_event(match_event_id("evt-1"), deadline=0.5)
+        elapsed = time.monotonic() - start
+
+    assert event is None
+    assert 0.5 <= elapsed < 0.7
+
+
+def test_wait_keeps_polling_through_transient_errors(client_for):
+    with client_for(ready_after=0, failures=2) as client:
+        event = client.wait_for_event(match_event_id("evt-1"), deadline=5)
+
+    assert event is not None
+    assert event.polls == 3
+
+
+def test_wait_raises_last_error_when_every_poll_fails(client_for):
+    with client_for(ready_after=0, failures=10_000) as client:
+        with pytest.raises(WebhookClientError, match="Unexpected status"):
+            client.wait_for_event(match_event_id("evt-1"), deadline=0.3)
+
+    assert _LatestHandler.polls > 1
+
+
+def test_wait_matches_correlation_id(client_for):
+    with client_for(ready_after=0) as client:
+        assert client.wait_for_event(match_correlation_id("cid-1"), deadline=2).polls == 1
+        assert client.wait_for_event(match_correlation_id("other"), deadline=0.2) is None
+
+
+class _ListHandler(BaseHTTPRequestHandler):
+    """
+    Serves /token/{id}/requests newest first over 5 captures (evt-4 newest
+    ... evt-0 oldest), `per_page` per page unless `page_size` overrides it,
+    each page after `delay` seconds.
+    """
+
+    protocol_version = "HTTP/1.1"
+    pages_requested = []
+    page_size = None
+    delay = 0.0
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query["page"][0])
+        per_page = self.page_size or int(query["per_page"][0])
+        time.sleep(self.delay)
+        type(self).pages_requested.append(page)
+        captures = [
+            {
+                "uuid": f"req-{n}",
+                "headers": {"x-correlation-id": [f"cid-{n}"]},
+                "content": json.dumps({"event_id": f"evt-{n}"}),
+            }
+            for n in reversed(range(5))
+        ]
+        data = captures[(page - 1) * per_page: page * per_page]
+        raw = json.dumps({
+            "data": data,
+            "current_page": page,
+            "is_last_page": page * per_page >= len(captures),
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def list_client(serve_http):
+    _ListHandler.pages_requested = []
+    _ListHandler.page_size = None
+    _ListHandler.delay = 0.0
+    base_url = serve_http(_ListHandler)
+    with WebhookClient(target_url=f"{base_url}/token-1", api_base_url=base_url) as client:
+        yield client
+
+
+def test_find_request_stops_at_first_match(list_client):
+    found = list_client.find_request(event_id="evt-2", per_page=2)
+
+    assert found["uuid"] == "req-2"
+    assert _ListHandler.pages_requested == [1, 2]
+
+
+def test_find_request_by_correlation_id_and_miss(list_client):
+    assert list_client.find_request(correlation_id="cid-0", per_page=2)["uuid"] == "req-0"
+    assert list_client.find_request(correlation_id="nope", per_page=2, max_pages=2) == {}
+
+
+def test_wait_for_event_can_search_instead_of_latest(list_client):
+    event = list_client.wait_for_event(
+        match_event_id("evt-1"), deadline=2, search=True, search_pages=3
+    )
+
+    assert event.content == {"event_id": "evt-1"}
+
+
+def test_search_wait_clips_every_page_request_to_the_deadline(list_client):
+    _ListHandler.page_size = 1
+    _ListHandler.delay = 0.15
+
+    start = time.monotonic()
+    event = list_client.wait_for_event(
+        match_event_id("missing"), deadline=0.5, search=True, search_pages=5
+    )
+    elapsed = time.monotonic() - start
+
+    assert event is None
+    assert elapsed < 0.5 + 0.1
@@ -1,10 +1,22 @@
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 import logging
 import time
 
 import requests
 
+from .cassette import Cassette, shared_cassette
+from .circuit_breaker import CircuitBreakerRegistry
 from .config import load_settings, get_env_or_setting
+from .hedging import HedgePolicy
+from .http_cache import ResponseCache, copy_response
+from .http_pool import PooledSession, pool_settings
+from .latency import LatencyRecorder
+from .rate_limit import RateLimiterRegistry, shared_rate_limiters
+from .retry import RetryPolicy
+from .single_flight import SingleFlight, request_key
 
 logger = logging.getLogger(__name__)
 
@@ -43,19 +55,87 @@ class ApiClientError(RuntimeError):
         super().__init__(full_message)
 
 
-class ApiClient:
+class CircuitOpenError(ApiClientError):
+    """
+    Raised without sending anything when the circuit breaker of the target
+    endpoint is open. `retry_after` is the number of seconds until the
+    breaker lets a trial call through.
     """
-    API client for the Reqres API.
 
-    - Base URL comes from config/settings.yaml (api.base_url)
-    - API token comes from env var REQRES_API_TOKEN, with optional fallback
-      to api.token in settings (for local debugging), sent as `x-api-key`.
-    - All requests share a default timeout, configurable in config/settings.yaml
+    def __init__(
+        self,
+        message: str,
+        method: Optional[str] = None,
+        url: Optional[str] = None,
+        retry_after: float = 0.0,
+    ) -> None:
+        self.retry_after = retry_after
+        super().__init__(f"{message} (retry_after={retry_after:.3f}s)", method=method, url=url)
+
+
+@dataclass
+class BatchItem:
+    """
+    Outcome of one spec executed by ApiClient.request_many.
+    Exactly one of `response` / `error` is set.
+    """
+
+    index: int
+    method: str
+    path: str
+    response: Optional[requests.Response] = None
+    error: Optional[ApiClientError] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchResult:
+    """
+    Results of ApiClient.request_many, in the same order as the input specs,
+    plus total wall-clock time for the whole batch.
+    """
+
+    items: List[BatchItem] = field(default_factory=list)
+    total_elapsed: float = 0.0
+
+    @property
+    def responses(self) -> List[Optional[requests.Response]]:
+        return [item.response for item in self.items]
+
+    @property
+    def errors(self) -> List[BatchItem]:
+        return [item for item in self.items if item.error is not None]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Timing summary: count, error count, wall-clock and per-item
+        min/mean/max elapsed seconds.
+        """
+        timings = [item.elapsed for item in self.items]
+        return {
+            "count": len(self.items),
+            "errors": len(self.errors),
+            "total_elapsed": self.total_elapsed,
+            "min_elapsed": min(timings) if timings else 0.0,
+            "mean_elapsed": sum(timings) / len(timings) if timings else 0.0,
+            "max_elapsed": max(timings) if timings else 0.0,
+        }
+
+
+class _BaseApiClient:
+    """
+    Configuration shared by the blocking and asyncio API clients:
+    base URL, default headers (incl. x-api-key) and default timeout.
     """
 
     def __init__(self, base_url: Optional[str] = None) -> None:
         settings = load_settings()
         api_cfg = settings.get("api", {})
+        self._api_cfg: Dict[str, Any] = api_cfg
 
         config_base_url = api_cfg.get("base_url")
         token = get_env_or_setting("api.token", "REQRES_API_TOKEN", default=None)
@@ -92,7 +172,8 @@ class ApiClient:
             self.default_timeout = 10.0
 
         logger.debug(
-            "ApiClient initialized with base_url=%s, has_token=%s, timeout=%s",
+            "%s initialized with base_url=%s, has_token=%s, timeout=%s",
+            type(self).__name__,
             self.base_url,
             bool(token),
             self.default_timeout
@@ -111,6 +192,162 @@ class ApiClient:
             merged.update(headers)
         return merged
 
+
+class ApiClient(_BaseApiClient):
+    """
+    API client for the Reqres API.
+
+    - Base URL comes from config/settings.yaml (api.base_url)
+    - API token comes from env var REQRES_API_TOKEN, with optional fallback
+      to api.token in settings (for local debugging), sent as `x-api-key`.
+    - All requests share a default timeout, configurable in config/settings.yaml
+    - All requests go through one long-lived keep-alive session whose pool is
+      sized from config/settings.yaml (api.pool_connections, api.pool_maxsize,
+      api.keepalive_idle_timeout). Call close() or use the client as a context
+      manager to release the connections.
+    - Transient failures (429/502/503/504, connection errors, timeouts) on
+      idempotent methods are retried with jittered exponential backoff under a
+      retry budget, configured in config/settings.yaml (api.retry)
+    - Every attempt first takes a token from the per-host rate limiter
+      (rate_limits in config/settings.yaml), so callers queue locally
+    - Optional GET response cache with ETag / Last-Modified revalidation
+      (api.cache in config/settings.yaml, or the `cache` argument)
+    - Optionally, concurrent identical GETs are coalesced into one upstream
+      request (api.single_flight in config/settings.yaml, off by default)
+    - Every request is timed with perf_counter_ns (end to end, including
+      retries and rate-limit waits) into per-endpoint latency histograms
+      keyed by method + templated path + status class, see `latency`
+    - Optional record / replay cassette under the session (CASSETTE_MODE,
+      CASSETTE_PATH), so suites can run offline from a recording
+    - Optional request hedging for idempotent methods (api.hedging in
+      config/settings.yaml, or the `hedging` argument): a duplicate is sent
+      when a call outlives the endpoint's observed pN latency, within a
+      budget; counters via `hedge_stats`
+    - Optional per-endpoint circuit breaker (api.circuit_breaker in
+      config/settings.yaml, or the `circuit_breakers` argument): once an
+      endpoint's failure or slow-call rate crosses its threshold, calls fail
+      fast with CircuitOpenError until a half-open trial succeeds; state and
+      counters via `circuit_stats`
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiters: Optional[RateLimiterRegistry] = None,
+        cache: Optional[ResponseCache] = None,
+        single_flight: Optional[bool] = None,
+        cassette: Optional[Cassette] = None,
+        hedging: Optional[HedgePolicy] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+    ) -> None:
+        super().__init__(base_url)
+
+        # self.latency (per-endpoint histograms, query with latency.snapshot())
+        self.latency = LatencyRecorder()
+
+        # self.single_flight (argument wins over api.single_flight)
+        if single_flight is None:
+            single_flight = bool(self._api_cfg.get("single_flight", False))
+        self.single_flight: Optional[SingleFlight] = SingleFlight() if single_flight else None
+
+        # self.cache (None unless enabled in api.cache or passed in)
+        self.cache = cache if cache is not None else ResponseCache.from_settings(
+            self._api_cfg.get("cache")
+        )
+
+        # self.hedging (None unless enabled in api.hedging or passed in)
+        self.hedging = hedging if hedging is not None else HedgePolicy.from_settings(
+            self._api_cfg.get("hedging")
+        )
+
+        # self.circuit_breakers (None unless enabled in api.circuit_breaker or passed in)
+        self.circuit_breakers = (
+            circuit_breakers
+            if circuit_breakers is not None
+            else CircuitBreakerRegistry.from_settings(self._api_cfg.get("circuit_breaker"))
+        )
+
+        # self.rate_limiters (process-wide per-host buckets by default)
+        self.rate_limiters = rate_limiters or shared_rate_limiters()
+
+        # self.retry_policy (argument wins over api.retry settings)
+        if retry_policy is None:
+            retry_policy = RetryPolicy.from_settings(self._api_cfg.get("retry"))
+        self.retry_policy = retry_policy
+
+        # self.session (shared keep-alive connection pool)
+        pool_kwargs = pool_settings(self._api_cfg)
+        self.pool_maxsize: int = pool_kwargs["pool_maxsize"]
+        self.session = PooledSession(**pool_kwargs)
+
+        # self.cassette (record / replay below the session; None = live)
+        self.cassette = cassette if cassette is not None else shared_cassette()
+        if self.cassette is not None:
+            self.cassette.mount(self.session)
+
+    def __enter__(self) -> "ApiClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close all pooled connections held by this client.
+        """
+        if self.hedging is not None:
+            self.hedging.close()
+        self.session.close()
+
+    @property
+    def connection_stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of connection pool usage: new vs reused connections,
+        idle evictions and the reuse ratio.
+        """
+        return self.session.stats.snapshot()
+
+    @property
+    def hedge_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Hedging counters (requests, hedges_sent, hedges_won, budget_denied),
+        None when hedging is disabled.
+        """
+        return self.hedging.stats.snapshot() if self.hedging is not None else None
+
+    @property
+    def circuit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-breaker state and counters (calls, failures, slow_calls,
+        rejected, opened), keyed by endpoint; empty when disabled.
+        """
+        return self.circuit_breakers.snapshot() if self.circuit_breakers is not None else {}
+
+    @property
+    def retry_stats(self) -> Dict[str, Any]:
+        """
+        Retry counters: requests, attempts, retries, budget exhaustion and
+        the attempts-per-request histogram.
+        """
+        return self.retry_policy.stats.snapshot()
+
+    @property
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Response cache counters (hits, misses, revalidations, ...); empty
+        when caching is disabled.
+        """
+        return self.cache.snapshot() if self.cache is not None else {}
+
+    @property
+    def single_flight_stats(self) -> Dict[str, Any]:
+        """
+        Single-flight counters (leaders, coalesced, in_flight); empty when
+        coalescing is disabled.
+        """
+        return self.single_flight.snapshot() if self.single_flight is not None else {}
+
     def _request(
         self,
         method: str,
@@ -121,13 +358,67 @@ class ApiClient:
     ) -> requests.Response:
         """
         Helper that performs HTTP requests with logging and error handling.
+        Idempotent calls are hedged when a HedgePolicy is configured, and
+        calls to an endpoint whose circuit is open fail fast.
 
         Args:
             method: HTTP method name (GET, POST, DELETE, ...)
             path: endpoint path
             headers: optional per-call headers
             timeout: optional per-call timeout
+
+        Raises:
+            CircuitOpenError: the endpoint's circuit breaker is open
+            ApiClientError: the request failed at the transport level
         """
+        def call() -> requests.Response:
+            if self.hedging is not None and self.hedging.applies(method):
+                return self.hedging.run(
+                    lambda: self._send(method, path, headers=headers, timeout=timeout, **kwargs),
+                    self.hedging.delay_for(self.latency, method, path),
+                )
+            return self._send(method, path, headers=headers, timeout=timeout, **kwargs)
+
+        if self.circuit_breakers is None:
+            return call()
+
+        url = self._build_url(path)
+        breaker = self.circuit_breakers.for_request(method, url)
+        permit = breaker.allow()
+        if permit is None:
+            logger.info("HTTP %s %s rejected, circuit %s is open", method.upper(), url, breaker.name)
+            raise CircuitOpenError(
+                "Circuit open", method=method.upper(), url=url, retry_after=breaker.retry_after()
+            )
+
+        try:
+            response = call()
+        except ApiClientError:
+            breaker.record(False, permit=permit)
+            raise
+        except BaseException:
+            # not an upstream failure: release a half-open trial slot
+            breaker.record(None, permit=permit)
+            raise
+        # 5xx (after retries) counts against the endpoint, 4xx is the caller's
+        # fault. Slowness is judged on response.elapsed (request sent ->
+        # headers received) of the final attempt, so retry backoff,
+        # Retry-After sleeps and rate-limiter waits never make a call "slow".
+        breaker.record(
+            response.status_code < 500,
+            response.elapsed.total_seconds(),
+            permit=permit,
+        )
+        return response
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> requests.Response:
         url = self._build_url(path)
         merged_headers = self._merge_headers(headers)
         effective_timeout = timeout or self.default_timeout
@@ -137,17 +428,30 @@ class ApiClient:
         if "json" in kwargs:
             logger.debug("Request JSON payload: %s", kwargs["json"])
 
-        start = time.time()
-        try:
-            response = requests.request(
+        def send() -> requests.Response:
+            self.rate_limiters.acquire(url)
+            return self.session.request(
                 method=method,
                 url=url,
                 headers=merged_headers,
                 timeout=effective_timeout,
                 **kwargs,
             )
+
+        start = time.perf_counter_ns()
+        try:
+            response, attempts = self.retry_policy.run(
+                method,
+                send,
+                retry_exceptions=(
+                    requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                ),
+            )
         except requests.exceptions.RequestException as exc:
-            elapsed = time.time() - start
+            elapsed_ns = time.perf_counter_ns() - start
+            self.latency.record(method, path, None, elapsed_ns)
+            elapsed = elapsed_ns / 1e9
             logger.error(
                 "HTTP %s %s failed after %.3fs: %r",
                 method.upper(),
@@ -163,25 +467,82 @@ class ApiClient:
                 original_exception=exc,
             ) from exc
 
-        elapsed = time.time() - start
+        elapsed_ns = time.perf_counter_ns() - start
+        self.latency.record(method, path, response.status_code, elapsed_ns)
+        elapsed = elapsed_ns / 1e9
         logger.info(
-            "HTTP %s %s -> %s (%.3fs)",
+            "HTTP %s %s -> %s (%.3fs, attempts=%s)",
             method.upper(),
             url,
             response.status_code,
             elapsed,
+            attempts,
         )
 
         return response
 
     def get(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+        **kwargs: Any
+    ) -> requests.Response:
+        def fetch() -> requests.Response:
+            if self.cache is None or not use_cache:
+                return self._request("GET", path, headers=headers, timeout=timeout, **kwargs)
+            return self._cached_get(path, headers=headers, timeout=timeout, **kwargs)
+
+        # only plain GETs (params aside) are coalesced: auth, cookies,
+        # allow_redirects, ... are not part of the key
+        if self.single_flight is None or set(kwargs) - {"params"}:
+            return fetch()
+
+        key = request_key(
+            "GET",
+            self._build_url(path),
+            kwargs.get("params"),
+            self._merge_headers(headers),
+            timeout,
+        ) + (use_cache,)
+        response, shared = self.single_flight.do(key, fetch)
+        # Followers get their own Response object (and headers) over the same body
+        return copy_response(response) if shared else response
+
+    def _cached_get(
         self,
         path: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
         **kwargs: Any
     ) -> requests.Response:
-        return self._request("GET", path, headers=headers, timeout=timeout, **kwargs)
+        """
+        GET through the response cache: fresh entries are returned without a
+        request, stale ones are revalidated conditionally (304 -> cached body).
+        """
+        key = self.cache.key(
+            self._build_url(path), kwargs.get("params"), self._merge_headers(headers)
+        )
+        entry, fresh = self.cache.lookup(key)
+        if entry is not None and fresh:
+            logger.info("HTTP GET %s served from cache", key[0])
+            return copy_response(entry.response)
+
+        request_headers = dict(headers or {})
+        if entry is not None and entry.can_revalidate:
+            request_headers.update(entry.conditional_headers())
+
+        response = self._request(
+            "GET", path, headers=request_headers, timeout=timeout, **kwargs
+        )
+        if response.status_code == 304 and entry is not None:
+            cached = self.cache.revalidated(key, response)
+            if cached is not None:
+                logger.info("HTTP GET %s revalidated (304), using cached body", key[0])
+                return cached
+        self.cache.store(key, response)
+        return response
 
     def post(
         self,
@@ -208,3 +569,158 @@ class ApiClient:
         **kwargs: Any
     ) -> requests.Response:
         return self._request("DELETE", path, headers=headers, timeout=timeout, **kwargs)
+
+    def request_many(
+        self,
+        specs: Iterable[Sequence[Any]],
+        max_workers: Optional[int] = None,
+    ) -> BatchResult:
+        """
+        Run independent requests concurrently on a thread pool sharing this
+        client's connection pool.
+
+        Args:
+            specs: iterable of (method, path) or (method, path, kwargs) tuples;
+                kwargs are passed to _request (headers, timeout, json, params, ...)
+            max_workers: worker threads; defaults to the pool size
+                (api.pool_maxsize) so every worker can keep a warm connection
+
+        returns:
+            BatchResult with one BatchItem per spec, in input order. Transport
+            failures are recorded per item as ApiClientError instead of
+            aborting the batch.
+        """
+        spec_list = list(specs)
+        if max_workers is None:
+            max_workers = self.pool_maxsize
+        max_workers = max(1, min(max_workers, len(spec_list) or 1))
+        if max_workers > self.pool_maxsize:
+            # Extra connections are opened and then discarded, not pooled
+            logger.warning(
+                "request_many max_workers=%s exceeds pool_maxsize=%s",
+                max_workers,
+                self.pool_maxsize,
+            )
+
+        def run(indexed_spec: Any) -> BatchItem:
+            index, spec = indexed_spec
+            method, path = spec[0], spec[1]
+            kwargs = dict(spec[2]) if len(spec) > 2 and spec[2] else {}
+            item = BatchItem(index=index, method=method.upper(), path=path)
+            start = time.perf_counter()
+            try:
+                item.response = self._request(method, path, **kwargs)
+            except ApiClientError as exc:
+                item.error = exc
+            item.elapsed = time.perf_counter() - start
+            return item
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="api-batch"
+        ) as executor:
+            items = list(executor.map(run, enumerate(spec_list)))
+        result = BatchResult(items=items, total_elapsed=time.perf_counter() - start)
+
+        logger.info(
+            "request_many: %s requests, %s errors, %.3fs wall-clock (%s workers)",
+            len(items),
+            len(result.errors),
+            result.total_elapsed,
+            max_workers,
+        )
+        return result
+
+    def _fetch_page(
+        self, path: str, params: Dict[str, Any], page: int, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        GET one page of a Reqres-style list endpoint and decode it.
+        Raises ApiClientError on a non-200 status or a non-JSON body, since
+        pagination cannot continue past either.
+        """
+        response = self.get(path, params={**params, "page": page}, **kwargs)
+        if response.status_code != 200:
+            raise ApiClientError(
+                f"Unexpected status {response.status_code} while paginating (page={page})",
+                method="GET",
+                url=response.url,
+            )
+        try:
+            return response.json()
+        except ValueError as exc:
+            raise ApiClientError(
+                f"Page {page} is not valid JSON",
+                method="GET",
+                url=response.url,
+                original_exception=exc,
+            ) from exc
+
+    def iter_pages(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        prefetch: int = 2,
+        **kwargs: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate the pages of a list endpoint such as /api/users,
+        which returns `page`, `total_pages` and `data`.
+
+        While a page is being consumed, up to `prefetch` following pages are
+        fetched in the background, so at most prefetch + 1 pages are held in
+        memory however many pages there are. Pagination starts at
+        params["page"] (default 1) and stops after `total_pages`.
+
+        Args:
+            path: list endpoint path
+            params: extra query params sent with every page
+            prefetch: pages fetched ahead of the consumer (0 = sequential)
+            kwargs: passed to get() (headers, timeout, ...)
+        """
+        params = dict(params or {})
+        page_number = int(params.pop("page", 1))
+
+        first = self._fetch_page(path, params, page_number, **kwargs)
+        total_pages = int(first.get("total_pages") or page_number)
+        yield first
+
+        next_page = page_number + 1
+        if prefetch <= 0:
+            while next_page <= total_pages:
+                yield self._fetch_page(path, params, next_page, **kwargs)
+                next_page += 1
+            return
+
+        executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="api-prefetch")
+        pending: Deque[Future] = deque()
+        try:
+            while next_page <= total_pages and len(pending) < prefetch:
+                pending.append(executor.submit(self._fetch_page, path, params, next_page, **kwargs))
+                next_page += 1
+            while pending:
+                page = pending.popleft().result()
+                if next_page <= total_pages:
+                    pending.append(executor.submit(self._fetch_page, path, params, next_page, **kwargs))
+                    next_page += 1
+                yield page
+        finally:
+            # consumer stopped early or a page failed: drop queued fetches
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def iter_items(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        prefetch: int = 2,
+        items_key: str = "data",
+        **kwargs: Any
+    ) -> Iterator[Any]:
+        """
+        Lazily iterate the items (page[items_key]) of every page yielded by
+        iter_pages(), with the same background prefetch.
+        """
+        for page in self.iter_pages(path, params=params, prefetch=prefetch, **kwargs):
+            yield from page.get(items_key) or []
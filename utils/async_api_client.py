@@ -0,0 +1,269 @@
+from typing import Any, Dict, Optional
+import asyncio
+import json
+import logging
+import time
+
+import aiohttp
+from requests.structures import CaseInsensitiveDict
+
+from .api_client import ApiClientError, _BaseApiClient
+from .http_cache import copy_response
+from .http_pool import pool_settings
+from .rate_limit import RateLimiterRegistry, shared_rate_limiters
+from .single_flight import AsyncSingleFlight, request_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 100
+
+
+class AsyncResponse:
+    """
+    Fully-read HTTP response returned by AsyncApiClient.
+
+    Mirrors the parts of requests.Response the tests rely on
+    (status_code, headers, text, json(), url) so assertions read the same
+    for both clients.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: CaseInsensitiveDict,
+        content: bytes,
+        url: str,
+        elapsed: float,
+        encoding: Optional[str] = None,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.elapsed = elapsed
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self, **kwargs: Any) -> Any:
+        return json.loads(self.content, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<AsyncResponse [{self.status_code}]>"
+
+
+class AsyncApiClient(_BaseApiClient):
+    """
+    asyncio API client for the Reqres API, with the same get/post/delete
+    surface as ApiClient.
+
+    - Base URL, token header and default timeout come from the same settings
+      as ApiClient (see _BaseApiClient)
+    - One aiohttp session per client, created lazily on the running event loop
+    - In-flight requests are bounded by a semaphore of size max_concurrency
+      (argument, or api.async_max_concurrency in config/settings.yaml); the
+      connector limit matches it so every admitted request gets a connection
+    - Requests wait (without holding a concurrency slot) on the same per-host
+      rate limiters as ApiClient
+    - Concurrent identical GETs share one upstream request when
+      api.single_flight is enabled (or single_flight=True)
+    - Transport failures and timeouts are wrapped in ApiClientError
+
+    Use as `async with AsyncApiClient() as client:` or call `await close()`.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        rate_limiters: Optional[RateLimiterRegistry] = None,
+        single_flight: Optional[bool] = None,
+    ) -> None:
+        super().__init__(base_url)
+        self.rate_limiters = rate_limiters or shared_rate_limiters()
+
+        if single_flight is None:
+            single_flight = bool(self._api_cfg.get("single_flight", False))
+        self.single_flight: Optional[AsyncSingleFlight] = (
+            AsyncSingleFlight() if single_flight else None
+        )
+
+        if max_concurrency is None:
+            max_concurrency = self._api_cfg.get(
+                "async_max_concurrency", DEFAULT_MAX_CONCURRENCY
+            )
+        try:
+            self.max_concurrency = int(max_concurrency)
+        except (TypeError, ValueError):
+            self.max_concurrency = DEFAULT_MAX_CONCURRENCY
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self._keepalive_timeout = pool_settings(self._api_cfg)["keepalive_idle_timeout"]
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+
+    async def __aenter__(self) -> "AsyncApiClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the underlying aiohttp session and its pooled connections.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._semaphore = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created on first use so both objects bind to the running loop
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=0,
+                keepalive_timeout=self._keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of requests currently holding a concurrency slot.
+        """
+        return self._in_flight
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> AsyncResponse:
+        """
+        Helper that performs HTTP requests with logging and error handling.
+
+        Args:
+            method: HTTP method name (GET, POST, DELETE, ...)
+            path: endpoint path
+            headers: optional per-call headers
+            timeout: optional per-call timeout
+        """
+        url = self._build_url(path)
+        merged_headers = self._merge_headers(headers)
+        effective_timeout = timeout or self.default_timeout
+
+        logger.info("HTTP %s %s", method.upper(), url)
+        logger.debug("Request headers: %s", merged_headers)
+        if "json" in kwargs:
+            logger.debug("Request JSON payload: %s", kwargs["json"])
+
+        await self.rate_limiters.acquire_async(url)
+        session = self._get_session()
+        async with self._semaphore:
+            self._in_flight += 1
+            start = time.perf_counter()
+            try:
+                async with session.request(
+                    method,
+                    url,
+                    headers=merged_headers,
+                    timeout=aiohttp.ClientTimeout(total=effective_timeout),
+                    **kwargs,
+                ) as raw:
+                    content = await raw.read()
+                    response = AsyncResponse(
+                        status_code=raw.status,
+                        headers=CaseInsensitiveDict(raw.headers),
+                        content=content,
+                        url=str(raw.url),
+                        elapsed=time.perf_counter() - start,
+                        encoding=raw.get_encoding() if content else None,
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                elapsed = time.perf_counter() - start
+                logger.error(
+                    "HTTP %s %s failed after %.3fs: %r",
+                    method.upper(),
+                    url,
+                    elapsed,
+                    exc,
+                )
+                # Wrap low-level network errors in ApiClientError
+                raise ApiClientError(
+                    "HTTP request failed",
+                    method=method.upper(),
+                    url=url,
+                    original_exception=exc,
+                ) from exc
+            finally:
+                self._in_flight -= 1
+
+        logger.info(
+            "HTTP %s %s -> %s (%.3fs)",
+            method.upper(),
+            url,
+            response.status_code,
+            response.elapsed,
+        )
+
+        return response
+
+    async def get(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> AsyncResponse:
+        # only plain GETs (params aside) are coalesced, see ApiClient.get
+        if self.single_flight is None or set(kwargs) - {"params"}:
+            return await self._request("GET", path, headers=headers, timeout=timeout, **kwargs)
+
+        key = request_key(
+            "GET",
+            self._build_url(path),
+            kwargs.get("params"),
+            self._merge_headers(headers),
+            timeout,
+        )
+        response, shared = await self.single_flight.do(
+            key,
+            lambda: self._request("GET", path, headers=headers, timeout=timeout, **kwargs),
+        )
+        # each follower gets its own response object and headers
+        return copy_response(response) if shared else response
+
+    async def post(
+        self,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> AsyncResponse:
+        return await self._request(
+            "POST",
+            path,
+            headers=headers,
+            timeout=timeout,
+            json=json,
+            **kwargs
+        )
+
+    async def delete(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> AsyncResponse:
+        return await self._request("DELETE", path, headers=headers, timeout=timeout, **kwargs)
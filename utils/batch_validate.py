@@ -0,0 +1,255 @@
+"""
+Re-validate archived response bodies (newline-delimited JSON) against the
+schemas in utils/json_schemas.py on a process pool.
+
+    python -m utils.batch_validate responses/*.ndjson --schema user
+    python -m utils.batch_validate corpus.ndjson            # {"schema": ..., "body": ...} records
+"""
+from concurrent.futures import Future, ProcessPoolExecutor
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+from jsonschema.exceptions import best_match
+
+from .json_schemas import SCHEMAS
+from .schema_codegen import compile_schema
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 2000
+DEFAULT_MAX_ERRORS = 20
+
+# schema name used in the per-schema counts for lines that are not valid JSON
+INVALID_JSON = "<invalid json>"
+
+
+@dataclass
+class ErrorSample:
+    """
+    One failing line: where it is, which schema, the JSON path and message.
+    """
+
+    source: str
+    line: int
+    schema: str
+    path: str
+    message: str
+
+
+@dataclass
+class BatchReport:
+    """
+    Aggregated result of validate_files(): pass/fail counts per schema and
+    the first `max_errors` failures in input order.
+    """
+
+    counts: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    errors: List[ErrorSample] = field(default_factory=list)
+    lines: int = 0
+    total_elapsed: float = 0.0
+
+    @property
+    def failed(self) -> int:
+        return sum(c["failed"] for c in self.counts.values())
+
+    @property
+    def ok(self) -> bool:
+        return self.failed == 0
+
+    def merge(self, chunk: Dict[str, Any], max_errors: int) -> None:
+        self.lines += chunk["lines"]
+        for name, (passed, failed) in chunk["counts"].items():
+            counts = self.counts.setdefault(name, {"passed": 0, "failed": 0})
+            counts["passed"] += passed
+            counts["failed"] += failed
+        room = max_errors - len(self.errors)
+        if room > 0:
+            self.errors.extend(ErrorSample(*error) for error in chunk["errors"][:room])
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "lines": self.lines,
+            "failed": self.failed,
+            "lines_per_second": self.lines / self.total_elapsed if self.total_elapsed > 0 else 0.0,
+            "total_elapsed": self.total_elapsed,
+            "schemas": self.counts,
+        }
+
+
+def _json_path(error: Any) -> str:
+    return "$" + "".join(
+        f"[{part}]" if isinstance(part, int) else f".{part}" for part in error.absolute_path
+    )
+
+
+def _init_worker() -> None:
+    # compile (or load from the .schema_cache) once per worker, not per chunk
+    for name in SCHEMAS:
+        compile_schema(name)
+
+
+def validate_chunk(
+    source: str,
+    first_line: int,
+    lines: Sequence[str],
+    schema: Optional[str],
+    max_errors: int,
+) -> Dict[str, Any]:
+    """
+    Validate one chunk of raw NDJSON lines. Runs in a worker process and
+    returns plain counts plus at most `max_errors` error samples, so only a
+    small result crosses the process boundary.
+
+    With `schema` set every line is a body for that schema; otherwise each
+    line is a {"schema": name, "body": ...} record.
+    """
+    counts: Dict[str, List[int]] = {}
+    errors: List[Tuple[str, int, str, str, str]] = []
+
+    def fail(line_no: int, name: str, path: str, message: str) -> None:
+        counts.setdefault(name, [0, 0])[1] += 1
+        if len(errors) < max_errors:
+            errors.append((source, line_no, name, path, message))
+
+    seen = 0
+    for line_no, raw in enumerate(lines, start=first_line):
+        if not raw.strip():
+            continue
+        seen += 1
+        try:
+            record = json.loads(raw)
+        except ValueError as exc:
+            fail(line_no, INVALID_JSON, "$", str(exc))
+            continue
+        if schema is not None:
+            name, body = schema, record
+        elif isinstance(record, dict) and record.get("schema") in SCHEMAS and "body" in record:
+            name, body = record["schema"], record["body"]
+        else:
+            fail(line_no, INVALID_JSON, "$", 'expected a {"schema": ..., "body": ...} record')
+            continue
+
+        compiled = compile_schema(name)
+        if compiled.is_valid(body):
+            counts.setdefault(name, [0, 0])[0] += 1
+            continue
+        if len(errors) < max_errors:
+            error = best_match(compiled.iter_errors(body))
+            if error is not None:
+                fail(line_no, name, _json_path(error), error.message)
+                continue
+        fail(line_no, name, "$", "invalid")
+    return {"lines": seen, "counts": counts, "errors": errors}
+
+
+def _chunks(paths: Iterable[str], chunk_size: int) -> Iterator[Tuple[str, int, List[str]]]:
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            first_line = 1
+            while True:
+                lines = list(islice(f, chunk_size))
+                if not lines:
+                    break
+                yield path, first_line, lines
+                first_line += len(lines)
+
+
+def validate_files(
+    paths: Iterable[str],
+    schema: Optional[str] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+) -> BatchReport:
+    """
+    Stream NDJSON files in chunks of `chunk_size` lines to a process pool.
+
+    At most 2 * workers chunks are in flight, and results are merged in
+    submission order, so memory stays constant however large the corpus is
+    and the error samples are the first failures in file order.
+
+    Args:
+        paths: NDJSON files
+        schema: name in SCHEMAS applied to every line; None for
+            {"schema": name, "body": ...} records
+        workers: worker processes (default: CPU count); 0 validates inline
+        chunk_size: lines sent to a worker per task
+        max_errors: error samples to keep
+    """
+    if schema is not None and schema not in SCHEMAS:
+        raise KeyError(f"Unknown schema {schema!r}, expected one of {sorted(SCHEMAS)}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    report = BatchReport()
+    start = time.perf_counter()
+    chunks = _chunks(paths, chunk_size)
+
+    if workers <= 0:
+        for source, first_line, lines in chunks:
+            report.merge(validate_chunk(source, first_line, lines, schema, max_errors), max_errors)
+    else:
+        # compile in the parent first so workers load the sources from disk
+        _init_worker()
+        window = 2 * workers
+        pending: Deque[Future] = deque()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            try:
+                for source, first_line, lines in chunks:
+                    if len(pending) >= window:
+                        report.merge(pending.popleft().result(), max_errors)
+                    pending.append(executor.submit(
+                        validate_chunk, source, first_line, lines, schema, max_errors
+                    ))
+                while pending:
+                    report.merge(pending.popleft().result(), max_errors)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    report.total_elapsed = time.perf_counter() - start
+    logger.info(
+        "Validated %s lines, %s failed, in %.3fs (%s workers)",
+        report.lines,
+        report.failed,
+        report.total_elapsed,
+        workers,
+    )
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.batch_validate",
+        description="Validate NDJSON response corpora against utils/json_schemas.py",
+    )
+    parser.add_argument("paths", nargs="+", help="newline-delimited JSON files")
+    parser.add_argument("--schema", choices=sorted(SCHEMAS), help="schema for every line")
+    parser.add_argument("--workers", type=int, default=None, help="processes (0 = inline)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--max-errors", type=int, default=DEFAULT_MAX_ERRORS)
+    args = parser.parse_args(argv)
+
+    report = validate_files(
+        args.paths,
+        schema=args.schema,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        max_errors=args.max_errors,
+    )
+    print(json.dumps(report.summary(), indent=2))
+    for error in report.errors:
+        print(f"{error.source}:{error.line}: [{error.schema}] {error.path}: {error.message}")
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
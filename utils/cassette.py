@@ -0,0 +1,303 @@
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from datetime import timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import atexit
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .config import PROJECT_ROOT, get_env_or_setting
+
+logger = logging.getLogger(__name__)
+
+MODES = ("record", "replay", "passthrough")
+DEFAULT_CASSETTE_PATH = PROJECT_ROOT / "tests" / "cassettes" / "default.jsonl"
+
+
+class CassetteMissError(requests.RequestException):
+    """
+    Raised in replay mode when no recorded interaction matches a request.
+    Not a ConnectionError, so retry policies do not retry it.
+    """
+
+
+def _normalize_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path or "/", query, ""))
+
+
+def _normalize_body(body: Any) -> str:
+    if body is None or body == b"" or body == "":
+        return ""
+    raw = body.encode("utf-8") if isinstance(body, str) else bytes(body)
+    try:
+        # JSON bodies match regardless of key order and whitespace
+        raw = json.dumps(json.loads(raw), sort_keys=True, separators=(",", ":")).encode("utf-8")
+    except ValueError:
+        pass
+    return hashlib.sha256(raw).hexdigest()[:32]
+
+
+def interaction_key(method: str, url: str, body: Any = None) -> str:
+    """
+    Match key of a request: method, URL with sorted query params, and a
+    digest of the body (JSON normalised). Headers are ignored, so secrets
+    like x-api-key never affect matching or end up in the cassette.
+    """
+    return f"{method.upper()} {_normalize_url(url)} {_normalize_body(body)}".rstrip()
+
+
+class Cassette:
+    """
+    Record / replay store of HTTP interactions in a JSONL file.
+
+    - record: requests go to the network; every response is appended to
+      the cassette (the file is truncated on the first write)
+    - replay: requests are answered from the cassette without network;
+      unmatched requests raise CassetteMissError
+    - passthrough: the cassette is not used
+
+    Each line holds one interaction. An index of line offsets per match key
+    is kept next to it (<path>.idx), so replay opens the file lazily on the
+    first lookup and reads only the matching line (seek + readline).
+    Repeated identical requests replay their recordings in order, repeating
+    the last one once exhausted (e.g. polling the same URL).
+    """
+
+    def __init__(self, path: Any = DEFAULT_CASSETTE_PATH, mode: str = "replay") -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}, expected one of {MODES}")
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + ".idx")
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, List[int]]] = None
+        self._cursors: Dict[str, int] = {}
+        self._reader: Any = None
+        self._writer: Any = None
+        self._truncated = False
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+
+    @classmethod
+    def from_settings(cls) -> Optional["Cassette"]:
+        """
+        Cassette configured by CASSETTE_MODE / CASSETTE_PATH (or cassette.mode /
+        cassette.path in settings.yaml); None in passthrough mode.
+        """
+        mode = get_env_or_setting("cassette.mode", "CASSETTE_MODE", default="passthrough")
+        if mode == "passthrough":
+            return None
+        path = get_env_or_setting("cassette.path", "CASSETTE_PATH", default=None)
+        if path is None:
+            path = DEFAULT_CASSETTE_PATH
+        elif not Path(path).is_absolute():
+            path = PROJECT_ROOT / path
+        return cls(path, mode=mode)
+
+    @property
+    def active(self) -> bool:
+        return self.mode != "passthrough"
+
+    def mount(self, session: requests.Session) -> None:
+        """
+        Route a session's http:// and https:// traffic through this cassette,
+        wrapping the adapters already mounted (e.g. PooledHTTPAdapter).
+        """
+        if not self.active:
+            return
+        for prefix in ("http://", "https://"):
+            inner = session.get_adapter(prefix)
+            if not isinstance(inner, CassetteAdapter):
+                session.mount(prefix, CassetteAdapter(self, inner))
+
+    def _load_index(self) -> Dict[str, List[int]]:
+        # caller holds the lock
+        if self._index is not None:
+            return self._index
+        index: Optional[Dict[str, List[int]]] = None
+        size = self.path.stat().st_size if self.path.exists() else 0
+        try:
+            stored = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if stored.get("size") == size:
+                index = stored["keys"]
+        except (OSError, ValueError, KeyError):
+            pass
+        if index is None and size:
+            # missing or stale index: one pass over the cassette rebuilds it
+            index = {}
+            with self.path.open("rb") as f:
+                offset = f.tell()
+                for line in iter(f.readline, b""):
+                    if line.strip():
+                        index.setdefault(json.loads(line)["key"], []).append(offset)
+                    offset = f.tell()
+        self._index = index or {}
+        return self._index
+
+    def save_index(self) -> None:
+        with self._lock:
+            if self._index is None or not self.path.exists():
+                return
+            if self._writer is not None:
+                self._writer.flush()
+            payload = {"size": self.path.stat().st_size, "keys": self._index}
+            tmp = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp, self.index_path)
+
+    def close(self) -> None:
+        self.save_index()
+        with self._lock:
+            for handle in (self._reader, self._writer):
+                if handle is not None:
+                    handle.close()
+            self._reader = self._writer = None
+
+    def play(self, request: requests.PreparedRequest) -> requests.Response:
+        key = interaction_key(request.method, request.url, request.body)
+        with self._lock:
+            offsets = self._load_index().get(key)
+            if not offsets:
+                self.misses += 1
+                raise CassetteMissError(
+                    f"No recorded interaction for {key} in {self.path}", request=request
+                )
+            position = self._cursors.get(key, 0)
+            self._cursors[key] = position + 1
+            if self._reader is None:
+                self._reader = self.path.open("rb")
+            self._reader.seek(offsets[min(position, len(offsets) - 1)])
+            record = json.loads(self._reader.readline())
+            self.hits += 1
+        return _build_response(record["response"], request)
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        key = interaction_key(request.method, request.url, request.body)
+        content = response.content or b""
+        try:
+            body: Dict[str, str] = {"body": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            body = {"body_b64": base64.b64encode(content).decode("ascii")}
+        record = {
+            "key": key,
+            "request": {"method": request.method, "url": request.url},
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "url": response.url,
+                "headers": dict(response.headers),
+                **body,
+            },
+        }
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._lock:
+            if self._writer is None:
+                if self._truncated:
+                    self._load_index()
+                    self._writer = self.path.open("ab")
+                else:
+                    # a recording replaces the previous cassette
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._writer = self.path.open("wb")
+                    self._truncated = True
+                    self._index = {}
+                    self._cursors.clear()
+            offset = self._writer.tell()
+            self._writer.write(line)
+            self._index.setdefault(key, []).append(offset)
+            self.recorded += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "path": str(self.path),
+                "hits": self.hits,
+                "misses": self.misses,
+                "recorded": self.recorded,
+            }
+
+
+def _build_response(data: Dict[str, Any], request: requests.PreparedRequest) -> requests.Response:
+    response = requests.Response()
+    response.status_code = data["status"]
+    response.reason = data.get("reason")
+    response.url = data.get("url") or request.url
+    response.headers = CaseInsensitiveDict(data.get("headers") or {})
+    # stored bodies are already decoded; drop transfer encodings
+    for name in ("Content-Encoding", "Transfer-Encoding"):
+        response.headers.pop(name, None)
+    if "body_b64" in data:
+        response._content = base64.b64decode(data["body_b64"])
+    else:
+        response._content = data.get("body", "").encode("utf-8")
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.request = request
+    response.elapsed = timedelta(0)
+    return response
+
+
+class CassetteAdapter(BaseAdapter):
+    """
+    Transport adapter that records through, or replays instead of, the
+    wrapped adapter depending on the cassette mode. Sits below retries,
+    rate limiting and latency recording, so those behave as with a network.
+    """
+
+    def __init__(self, cassette: Cassette, inner: BaseAdapter) -> None:
+        super().__init__()
+        self.cassette = cassette
+        self.inner = inner
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        if self.cassette.mode == "replay":
+            return self.cassette.play(request)
+        response = self.inner.send(request, **kwargs)
+        if self.cassette.mode == "record":
+            self.cassette.record(request, response)
+        return response
+
+    def close(self) -> None:
+        self.inner.close()
+
+    def __getattr__(self, name: str) -> Any:
+        # e.g. PooledHTTPAdapter.stats
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+
+_shared_cassette: Optional[Cassette] = None
+_shared_loaded = False
+_shared_lock = threading.Lock()
+
+
+def shared_cassette() -> Optional[Cassette]:
+    """
+    Process-wide cassette from CASSETTE_MODE / CASSETTE_PATH, shared by every
+    client so one recording holds the whole run; None in passthrough mode.
+    The index is saved at interpreter exit.
+    """
+    global _shared_cassette, _shared_loaded
+    with _shared_lock:
+        if not _shared_loaded:
+            _shared_cassette = Cassette.from_settings()
+            _shared_loaded = True
+            if _shared_cassette is not None:
+                atexit.register(_shared_cassette.close)
+                logger.info(
+                    "Cassette %s mode using %s", _shared_cassette.mode, _shared_cassette.path
+                )
+        return _shared_cassette
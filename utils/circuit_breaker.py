@@ -0,0 +1,267 @@
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+import logging
+import threading
+import time
+
+from .latency import template_path
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker over a rolling window of the last `window_size` calls.
+
+    - closed: calls flow; once the window holds at least `min_calls`
+      outcomes and the failure rate reaches `failure_rate_threshold`, or the
+      share of calls slower than `slow_call_duration` seconds reaches
+      `slow_call_rate_threshold`, the circuit opens
+    - open: calls are rejected immediately for `open_duration` seconds
+    - half_open: up to `half_open_calls` trial calls are let through; if
+      they all succeed the circuit closes (with a fresh window), any failure
+      opens it again
+
+    allow() hands out a permit (the breaker's generation, bumped on every
+    state change); record() ignores outcomes whose permit belongs to an
+    earlier state, so a call started while closed cannot count as a
+    half-open trial.
+
+    Counters (see snapshot()): calls, failures, slow_calls, rejected, opened.
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        window_size: int = 20,
+        min_calls: int = 10,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: Optional[float] = None,
+        slow_call_rate_threshold: float = 1.0,
+        open_duration: float = 30.0,
+        half_open_calls: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._failures = 0
+        self._slow = 0
+        self._state = CLOSED
+        self._generation = 1
+        self._opened_at = 0.0
+        self._trials_started = 0
+        self._trials_succeeded = 0
+        self.calls = 0
+        self.failures = 0
+        self.slow_calls = 0
+        self.rejected = 0
+        self.opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def retry_after(self) -> float:
+        """
+        Seconds until an open circuit lets a trial call through (0 otherwise).
+        """
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.open_duration - self._clock())
+
+    def _maybe_half_open(self) -> None:
+        # caller holds the lock
+        if self._state == OPEN and self._clock() - self._opened_at >= self.open_duration:
+            self._state = HALF_OPEN
+            self._generation += 1
+            self._trials_started = 0
+            self._trials_succeeded = 0
+            logger.info("Circuit %s half-open, allowing trial calls", self.name)
+
+    def allow(self) -> Optional[int]:
+        """
+        A permit if a call may proceed now, None if it is rejected. In
+        half-open state this reserves one of the trial slots, so every
+        allowed call must be followed by record(..., permit=permit).
+        """
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CLOSED:
+                return self._generation
+            if self._state == HALF_OPEN and self._trials_started < self.half_open_calls:
+                self._trials_started += 1
+                return self._generation
+            self.rejected += 1
+            return None
+
+    def record(
+        self, success: Optional[bool], duration: float = 0.0, permit: Optional[int] = None
+    ) -> None:
+        """
+        Report the outcome of an allowed call. success=None releases the slot
+        without counting an outcome (e.g. the call failed for a local reason).
+        `duration` should be network time only (no backoff or rate-limit
+        waits). Outcomes with a permit from an earlier state are ignored.
+        """
+        with self._lock:
+            self._maybe_half_open()
+            if permit is not None and permit != self._generation:
+                logger.debug("Circuit %s ignoring outcome of a call from an earlier state", self.name)
+                return
+            if success is None:
+                if self._state == HALF_OPEN:
+                    self._trials_started = max(0, self._trials_started - 1)
+                return
+            slow = self.slow_call_duration is not None and duration >= self.slow_call_duration
+            self.calls += 1
+            self.failures += not success
+            self.slow_calls += slow
+
+            if self._state == HALF_OPEN:
+                if not success or slow:
+                    self._open("trial call failed" if not success else "trial call was slow")
+                    return
+                self._trials_succeeded += 1
+                if self._trials_succeeded >= self.half_open_calls:
+                    self._close()
+                return
+            if self._state != CLOSED:
+                return
+
+            if len(self._window) == self._window.maxlen:
+                old_failed, old_slow = self._window[0]
+                self._failures -= old_failed
+                self._slow -= old_slow
+            self._window.append((not success, slow))
+            self._failures += not success
+            self._slow += slow
+
+            size = len(self._window)
+            if size < self.min_calls:
+                return
+            if self._failures / size >= self.failure_rate_threshold:
+                self._open(f"failure rate {self._failures}/{size}")
+            elif self.slow_call_duration is not None and self._slow / size >= self.slow_call_rate_threshold:
+                self._open(f"slow call rate {self._slow}/{size}")
+
+    def _open(self, reason: str) -> None:
+        # caller holds the lock
+        self._state = OPEN
+        self._generation += 1
+        self._opened_at = self._clock()
+        self.opened += 1
+        logger.warning(
+            "Circuit %s opened (%s), failing fast for %.1fs", self.name, reason, self.open_duration
+        )
+
+    def _close(self) -> None:
+        # caller holds the lock
+        self._state = CLOSED
+        self._generation += 1
+        self._window.clear()
+        self._failures = 0
+        self._slow = 0
+        logger.info("Circuit %s closed", self.name)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            self._maybe_half_open()
+            return {
+                "state": self._state,
+                "calls": self.calls,
+                "failures": self.failures,
+                "slow_calls": self.slow_calls,
+                "rejected": self.rejected,
+                "opened": self.opened,
+            }
+
+
+class CircuitBreakerRegistry:
+    """
+    One CircuitBreaker per host ("reqres.in") or per host and route
+    ("reqres.in GET /api/users/{id}"), created on first use with the same
+    settings. Configured in config/settings.yaml:
+
+        api:
+          circuit_breaker:
+            enabled: true
+            scope: route          # or host
+            window_size: 20
+            min_calls: 10
+            failure_rate_threshold: 0.5
+            slow_call_duration: 5
+            slow_call_rate_threshold: 0.8
+            open_duration: 30
+            half_open_calls: 3
+    """
+
+    def __init__(self, scope: str = "route", **breaker_kwargs: Any) -> None:
+        if scope not in ("route", "host"):
+            raise ValueError("scope must be 'route' or 'host'")
+        self.scope = scope
+        self.breaker_kwargs = breaker_kwargs
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    @classmethod
+    def from_settings(cls, section: Optional[Dict[str, Any]]) -> Optional["CircuitBreakerRegistry"]:
+        """
+        Build a registry from settings["api"]["circuit_breaker"]; returns
+        None unless `enabled: true`.
+        """
+        section = dict(section or {})
+        if not section.pop("enabled", False):
+            return None
+        casts = {
+            "window_size": int,
+            "min_calls": int,
+            "failure_rate_threshold": float,
+            "slow_call_duration": float,
+            "slow_call_rate_threshold": float,
+            "open_duration": float,
+            "half_open_calls": int,
+        }
+        kwargs = {
+            key: casts[key](value)
+            for key, value in section.items()
+            if key in casts and value is not None
+        }
+        return cls(scope=section.get("scope", "route"), **kwargs)
+
+    def key(self, method: str, url: str) -> str:
+        parts = urlsplit(url)
+        if self.scope == "host":
+            return parts.netloc
+        return f"{parts.netloc} {method.upper()} {template_path(parts.path)}"
+
+    def for_request(self, method: str, url: str) -> CircuitBreaker:
+        key = self.key(method, url)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    key, CircuitBreaker(name=key, **self.breaker_kwargs)
+                )
+        return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {key: breaker.snapshot() for key, breaker in sorted(breakers.items())}
@@ -1,20 +1,85 @@
 from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import threading
 import yaml
 import os
 
-def load_settings() -> dict:
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SETTINGS_PATH = PROJECT_ROOT / "config" / "settings.yaml"
+
+# path -> ((mtime_ns, size), settings, {dotted path: value})
+_cache: Dict[Path, Tuple[Tuple[int, int], dict, Dict[str, Any]]] = {}
+_cache_lock = threading.Lock()
+_MISSING = object()
+
+
+def _flatten(settings: Any, prefix: str = "", into: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Every dotted path in the settings tree mapped to its value, including
+    the intermediate sections: {"api": {...}, "api.base_url": "...", ...}
+    """
+    into = {} if into is None else into
+    if isinstance(settings, dict):
+        for key, value in settings.items():
+            path = f"{prefix}{key}"
+            into[path] = value
+            _flatten(value, f"{path}.", into)
+    return into
+
+
+def _load(config_path: Path, force: bool = False) -> Tuple[dict, Dict[str, Any]]:
+    """
+    Cached (settings, dotted-path lookup) for config_path. The file is only
+    re-parsed when its mtime or size changed since it was last read.
+    """
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Settings file not found: {config_path}") from None
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _cache.get(config_path)
+    if cached is not None and cached[0] == version and not force:
+        return cached[1], cached[2]
+
+    with _cache_lock:
+        cached = _cache.get(config_path)
+        if cached is not None and cached[0] == version and not force:
+            return cached[1], cached[2]
+        with config_path.open("r", encoding="utf-8") as f:
+            settings = yaml.safe_load(f) or {}
+        _cache[config_path] = (version, settings, _flatten(settings))
+        return settings, _cache[config_path][2]
+
+
+def load_settings(config_path: Optional[Path] = None) -> dict:
     """
     Loads settings from config/settings.yaml and returns them as a dict.
+
+    The parsed file is cached per process and reused until the file's mtime
+    or size changes (checked with one stat() per call), so the returned dict
+    is shared: treat it as read-only.
+    """
+    return _load(Path(config_path or DEFAULT_SETTINGS_PATH))[0]
+
+
+def reload(config_path: Optional[Path] = None) -> dict:
+    """
+    Re-read the settings file even if it looks unchanged (e.g. after an
+    edit within the filesystem's mtime resolution) and return the settings.
     """
+    return _load(Path(config_path or DEFAULT_SETTINGS_PATH), force=True)[0]
 
-    project_root = Path(__file__).resolve().parent.parent
-    config_path = project_root / "config" / "settings.yaml"
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"Settings file not found: {config_path}")
+def get_setting(path: str, default=None, config_path: Optional[Path] = None):
+    """
+    Value at a dotted path in settings.yaml, e.g. "api.retry.max_attempts",
+    or `default` when any part of the path is missing.
+    """
+    lookup = _load(Path(config_path or DEFAULT_SETTINGS_PATH))[1]
+    value = lookup.get(path, _MISSING)
+    return default if value is _MISSING else value
 
-    with config_path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
 
 def get_env_or_setting(path: str, env_var: str, default=None):
     """Helper to fetch a value from environment first then from settings.yaml.
@@ -28,14 +93,6 @@ def get_env_or_setting(path: str, env_var: str, default=None):
     value = os.getenv(env_var)
     if value is not None:
         return value
-    
-    # fallback check in settings
-    settings = load_settings()
-    parts = path.split(".")
-    current = settings
-    for p in parts:
-        if not isinstance(current, dict) or p not in current:
-            return default
-        current = current[p]
-    return current
-        
+
+    # fallback check in settings (precomputed dotted paths, no re-parse)
+    return get_setting(path, default)
@@ -0,0 +1,299 @@
+"""
+Webhook delivery measurement: send a sustained, stamped event stream and
+report the delivery latency distribution, loss, duplication and reordering.
+
+    python -m utils.delivery --count 300 --rate 10      # against WEBHOOK_TARGET_URL
+    python -m utils.delivery --local --count 5000 --concurrency 8
+"""
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import functools
+from uuid import uuid4
+import argparse
+import json
+import logging
+import sys
+import time
+
+from .latency import LatencyHistogram
+from .webhook_utils import WebhookClient, WebhookClientError, decode_content
+
+logger = logging.getLogger(__name__)
+
+# Payload field carrying the measurement stamp
+STAMP_FIELD = "x-delivery"
+
+
+@dataclass
+class DeliveryReport:
+    """
+    Delivery statistics of one measurement run.
+
+      - sent / send_failures: events handed to send_event and those that failed
+      - received: distinct sequence numbers captured
+      - lost: sequence numbers sent successfully but never captured
+      - duplicates: captures beyond the first for a sequence number
+      - reordered: captures that arrived after a higher sequence number
+      - latency: send -> capture time (ns), from the capture server's clock
+      - clamped: captures timestamped before their send time, recorded as 0
+        latency (Webhook.site's 1s `created_at` truncation or clock skew);
+        a large share means the latency percentiles are biased low
+    """
+
+    run_id: str
+    sent: int = 0
+    send_failures: int = 0
+    received: int = 0
+    lost: List[int] = field(default_factory=list)
+    duplicates: int = 0
+    reordered: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    clamped: int = 0
+    clock: str = "monotonic"
+
+    def summary(self) -> Dict[str, Any]:
+        delivered = self.sent - self.send_failures
+        return {
+            "run_id": self.run_id,
+            "sent": self.sent,
+            "send_failures": self.send_failures,
+            "received": self.received,
+            "lost": len(self.lost),
+            "loss_rate": len(self.lost) / delivered if delivered else 0.0,
+            "duplicates": self.duplicates,
+            "reordered": self.reordered,
+            "clamped": self.clamped,
+            "clock": self.clock,
+            "latency": self.latency.snapshot(),
+        }
+
+
+def analyze(
+    run_id: str,
+    sent: Dict[int, float],
+    captures: Sequence[Tuple[int, float]],
+    send_failures: int = 0,
+    clock: str = "monotonic",
+) -> DeliveryReport:
+    """
+    Build a DeliveryReport from the send times of successfully sent events
+    ({seq: sent_time}) and the captures in capture order ([(seq, captured_time)]),
+    both in seconds on the same clock.
+    """
+    report = DeliveryReport(run_id=run_id, sent=len(sent) + send_failures,
+                            send_failures=send_failures, clock=clock)
+    seen = set()
+    highest = -1
+    for seq, captured in captures:
+        if seq in seen:
+            report.duplicates += 1
+            continue
+        seen.add(seq)
+        if seq < highest:
+            report.reordered += 1
+        highest = max(highest, seq)
+        if seq in sent:
+            delta = captured - sent[seq]
+            if delta < 0:
+                report.clamped += 1
+                delta = 0.0
+            report.latency.record(int(delta * 1e9))
+    report.received = len(seen)
+    report.lost = sorted(set(sent) - seen)
+    if report.clamped:
+        logger.warning(
+            "Delivery run %s: %s of %s latency samples were negative and clamped to 0 "
+            "(%s clock); percentiles are biased low",
+            run_id, report.clamped, report.latency.count, clock,
+        )
+    return report
+
+
+def _created_at_epoch(metadata: Dict[str, Any]) -> Optional[float]:
+    try:
+        created = datetime.strptime(metadata["created_at"], "%Y-%m-%d %H:%M:%S")
+    except (KeyError, TypeError, ValueError):
+        return None
+    return created.replace(tzinfo=timezone.utc).timestamp()
+
+
+class DeliveryMeter:
+    """
+    Sends stamped events through a WebhookClient and matches them with what
+    the capture endpoint recorded.
+
+    Each payload carries {"x-delivery": {"run_id", "seq", "sent_monotonic",
+    "sent_at"}}. With a local CaptureStore attached to the client, latency is
+    capture `received_monotonic` - `sent_monotonic` (same process, exact);
+    against Webhook.site it is `created_at` - `sent_at` on the wall clock,
+    limited to Webhook.site's one-second timestamp resolution.
+
+    Events are stamped immediately before they are POSTed (in the sending
+    worker when concurrency > 1), so client-side queueing is not counted.
+    """
+
+    def __init__(self, client: WebhookClient, run_id: Optional[str] = None) -> None:
+        self.client = client
+        self.run_id = run_id or str(uuid4())
+        self._sent: Dict[int, Tuple[float, float]] = {}
+        self._failures = 0
+        self._next_seq = 0
+
+    def _allocate(self) -> int:
+        seq = self._next_seq
+        self._next_seq += 1
+        return seq
+
+    def _stamped(self, seq: int, payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        stamp = {
+            "run_id": self.run_id,
+            "seq": seq,
+            "sent_monotonic": time.monotonic(),
+            "sent_at": time.time(),
+        }
+        self._sent[seq] = (stamp["sent_monotonic"], stamp["sent_at"])
+        return dict(payload or {}, **{STAMP_FIELD: stamp})
+
+    def send(self, payload: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Send one stamped event; returns its sequence number.
+        """
+        seq = self._allocate()
+        body = self._stamped(seq, payload)
+        try:
+            response = self.client.send_event(body)
+            failed = response.status_code >= 400
+        except WebhookClientError:
+            failed = True
+        if failed:
+            self._failures += 1
+            del self._sent[seq]
+        return seq
+
+    def run(
+        self,
+        count: int,
+        rate: Optional[float] = None,
+        concurrency: int = 1,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Send a sustained stream of `count` events, paced at `rate` events per
+        second (None = as fast as possible). concurrency > 1 sends through
+        send_events; each event is stamped by its worker just before the
+        POST, not when it is queued.
+        """
+        if concurrency <= 1:
+            start = time.monotonic()
+            for n in range(count):
+                if rate:
+                    wait = start + n / rate - time.monotonic()
+                    if wait > 0:
+                        time.sleep(wait)
+                self.send(payload)
+            return
+
+        seqs: List[int] = []
+
+        def stamped() -> Iterator[Callable[[], Dict[str, Any]]]:
+            start = time.monotonic()
+            for n in range(count):
+                if rate:
+                    wait = start + n / rate - time.monotonic()
+                    if wait > 0:
+                        time.sleep(wait)
+                seq = self._allocate()
+                seqs.append(seq)
+                yield functools.partial(self._stamped, seq, payload)
+
+        report = self.client.send_events(stamped(), concurrency=concurrency)
+        for event in report.failures:
+            self._failures += 1
+            self._sent.pop(seqs[event.index], None)
+
+    def _captures(self) -> Iterator[Dict[str, Any]]:
+        store = self.client.capture_store
+        if store is not None:
+            token_id = self.client._extract_token_id()
+            items, _ = store.page(token_id, per_page=store.count(token_id), newest_first=False)
+            return iter(items)
+        # newest first from the API; the caller restores capture order
+        return self.client.iter_requests(query=f'content:"{self.run_id}"', per_page=100)
+
+    def collect(self, settle: float = 10.0, poll_interval: float = 0.5) -> DeliveryReport:
+        """
+        Wait up to `settle` seconds for every successfully sent event to be
+        captured, then analyse what arrived.
+        """
+        local = self.client.capture_store is not None
+        end = time.monotonic() + settle
+        while True:
+            captures: List[Tuple[int, float]] = []
+            for metadata in self._captures():
+                stamp = (decode_content(metadata) or {}).get(STAMP_FIELD)
+                if not isinstance(stamp, dict) or stamp.get("run_id") != self.run_id:
+                    continue
+                captured = metadata.get("received_monotonic") if local else _created_at_epoch(metadata)
+                if captured is not None:
+                    captures.append((int(stamp["seq"]), captured))
+            if not local:
+                captures.reverse()
+            if len({seq for seq, _ in captures} & set(self._sent)) >= len(self._sent):
+                break
+            if time.monotonic() >= end:
+                break
+            time.sleep(min(poll_interval, max(0.0, end - time.monotonic())))
+
+        sent = {seq: stamps[0] if local else stamps[1] for seq, stamps in self._sent.items()}
+        report = analyze(
+            self.run_id, sent, captures,
+            send_failures=self._failures,
+            clock="monotonic" if local else "wall (1s resolution)",
+        )
+        logger.info(
+            "Delivery run %s: %s sent, %s received, %s lost, %s duplicates, %s reordered",
+            self.run_id, report.sent, report.received, len(report.lost),
+            report.duplicates, report.reordered,
+        )
+        return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.delivery",
+        description="Measure webhook delivery latency, loss, duplication and reordering",
+    )
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=None, help="events per second")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--settle", type=float, default=30.0, help="seconds to wait for stragglers")
+    parser.add_argument("--local", action="store_true", help="use an in-process capture server")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.local:
+        from .webhook_capture import CaptureServer
+
+        server = CaptureServer().start()
+        client = WebhookClient(
+            target_url=server.target_url(),
+            api_base_url=server.base_url,
+            capture_store=server.store,
+        )
+    else:
+        client = WebhookClient()
+    try:
+        with client:
+            meter = DeliveryMeter(client)
+            meter.run(args.count, rate=args.rate, concurrency=args.concurrency)
+            report = meter.collect(settle=args.settle)
+    finally:
+        if server is not None:
+            server.stop()
+    print(json.dumps(report.summary(), indent=2))
+    return 0 if not report.lost else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Iterable, Optional
+import logging
+import threading
+
+from .latency import LatencyRecorder
+from .retry import RetryBudget
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEDGE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class HedgeStats:
+    """
+    Thread-safe hedging counters:
+      - requests: calls that went through the policy
+      - hedges_sent: duplicates fired after the hedge delay
+      - hedges_won: duplicates that finished before the original
+      - budget_denied: hedges skipped because the budget was empty
+      - pool_saturated: calls or hedges run unhedged because every worker
+        was busy
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        self.budget_denied = 0
+        self.pool_saturated = 0
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedges_sent": self.hedges_sent,
+                "hedges_won": self.hedges_won,
+                "budget_denied": self.budget_denied,
+                "pool_saturated": self.pool_saturated,
+                "hedge_ratio": self.hedges_sent / self.requests if self.requests else 0.0,
+            }
+
+
+def _discard(future: Future) -> None:
+    # the losing request cannot be interrupted mid-flight; release its
+    # connection as soon as it finishes
+    if future.cancelled() or future.exception() is not None:
+        return
+    close = getattr(future.result(), "close", None)
+    if close is not None:
+        close()
+
+
+class HedgePolicy:
+    """
+    Request hedging for idempotent calls: when a call has not completed
+    within the endpoint's observed p`percentile` latency, an identical call
+    is fired and whichever finishes first is used. The loser's response is
+    closed when it arrives.
+
+    - the hedge delay comes from the client's LatencyRecorder; endpoints
+      with fewer than `min_samples` successful calls are never hedged
+    - a RetryBudget caps the extra load: every call deposits `budget_ratio`
+      tokens, every hedge withdraws one (0.1 -> at most ~10% extra requests)
+    - calls run on a small thread pool so the caller can wait with a timeout;
+      the hedge delay starts once the call is running, and when no worker is
+      free the call runs unhedged on the caller's thread, so local queueing
+      never passes for a slow server
+
+    Build it from settings with HedgePolicy.from_settings(cfg["hedging"]).
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        methods: Iterable[str] = DEFAULT_HEDGE_METHODS,
+        min_samples: int = 20,
+        min_delay: float = 0.005,
+        max_delay: Optional[float] = None,
+        budget: Optional[RetryBudget] = None,
+        max_workers: int = 32,
+    ) -> None:
+        self.percentile = percentile
+        self.methods = frozenset(m.upper() for m in methods)
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget = budget if budget is not None else RetryBudget(
+            ratio=0.1, min_per_second=0.0, max_tokens=5.0
+        )
+        self.max_workers = max_workers
+        self.stats = HedgeStats()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._busy = 0
+
+    @classmethod
+    def from_settings(cls, section: Optional[Dict[str, Any]]) -> Optional["HedgePolicy"]:
+        """
+        Build a policy from settings["api"]["hedging"]; returns None unless
+        `enabled: true`.
+        """
+        section = section or {}
+        if not section.get("enabled", False):
+            return None
+        return cls(
+            percentile=float(section.get("percentile", 95.0)),
+            methods=section.get("methods", DEFAULT_HEDGE_METHODS),
+            min_samples=int(section.get("min_samples", 20)),
+            min_delay=float(section.get("min_delay", 0.005)),
+            max_delay=(
+                float(section["max_delay"]) if section.get("max_delay") is not None else None
+            ),
+            budget=RetryBudget(
+                ratio=float(section.get("budget_ratio", 0.1)),
+                min_per_second=float(section.get("budget_min_per_second", 0.0)),
+                max_tokens=float(section.get("budget_max_tokens", 5.0)),
+            ),
+            max_workers=int(section.get("max_workers", 32)),
+        )
+
+    def applies(self, method: str) -> bool:
+        return method.upper() in self.methods
+
+    def delay_for(self, latency: LatencyRecorder, method: str, path: str) -> Optional[float]:
+        """
+        Seconds to wait before hedging a call to this endpoint, or None when
+        too few successful calls have been observed to trust a percentile.
+        """
+        if latency.count(method, path) < self.min_samples:
+            return None
+        value_ns = latency.percentile(method, path, self.percentile)
+        if value_ns is None:
+            return None
+        delay = max(self.min_delay, value_ns / 1e9)
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        return delay
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="api-hedge"
+                )
+            return self._executor
+
+    def _reserve(self) -> bool:
+        # claim a worker, so submitted calls never wait in the executor queue
+        with self._lock:
+            if self._busy >= self.max_workers:
+                return False
+            self._busy += 1
+            return True
+
+    def _release(self, _future: Optional[Future] = None) -> None:
+        with self._lock:
+            self._busy -= 1
+
+    def _submit(self, call: Callable[[], Any]) -> Future:
+        """
+        Submit `call` on a reserved worker; returns once it has started.
+        """
+        started = threading.Event()
+
+        def task() -> Any:
+            started.set()
+            return call()
+
+        future = self._pool().submit(task)
+        future.add_done_callback(self._release)
+        started.wait()
+        return future
+
+    def run(self, call: Callable[[], Any], delay: Optional[float]) -> Any:
+        """
+        Run `call`, hedged after `delay` seconds (None = not hedged, runs
+        inline). Exceptions propagate only if every fired call failed.
+        """
+        self.stats.incr("requests")
+        self.budget.deposit()
+        if delay is None:
+            return call()
+        if not self._reserve():
+            self.stats.incr("pool_saturated")
+            return call()
+
+        primary = self._submit(call)
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+
+        if not self._reserve():
+            self.stats.incr("pool_saturated")
+            return primary.result()
+        if not self.budget.try_withdraw():
+            self._release()
+            self.stats.incr("budget_denied")
+            return primary.result()
+
+        self.stats.incr("hedges_sent")
+        hedge = self._submit(call)
+        logger.debug("Hedging request after %.3fs", delay)
+
+        done, _ = wait((primary, hedge), return_when=FIRST_COMPLETED)
+        winner = primary if primary in done else hedge
+        loser = hedge if winner is primary else primary
+        if winner.exception() is not None:
+            # the first to finish failed: the other one may still succeed
+            if loser.exception() is None:
+                winner, loser = loser, winner
+            else:
+                raise primary.exception()
+
+        loser.add_done_callback(_discard)
+        if winner is hedge:
+            self.stats.incr("hedges_won")
+        return winner.result()
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
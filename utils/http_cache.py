@@ -0,0 +1,187 @@
+from typing import Any, Dict, Iterable, Optional, Tuple
+from collections import OrderedDict
+import copy
+import logging
+import threading
+import time
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VARY_HEADERS = ("Accept", "x-api-key")
+
+
+def copy_response(response: Any) -> Any:
+    """
+    Shallow copy of a response (requests.Response or AsyncResponse) with its
+    own headers dict, so holders of cached or coalesced responses never
+    share (or see later changes to) each other's headers.
+    """
+    duplicate = copy.copy(response)
+    duplicate.headers = requests.structures.CaseInsensitiveDict(response.headers)
+    return duplicate
+
+
+class CacheEntry:
+    """
+    A cached GET response plus the validators needed to revalidate it.
+    """
+
+    __slots__ = ("response", "etag", "last_modified", "stored_at", "size")
+
+    def __init__(self, response: requests.Response) -> None:
+        self.response = response
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+        self.stored_at = time.monotonic()
+        self.size = len(response.content or b"")
+
+    @property
+    def can_revalidate(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache for GET responses.
+
+    - bounded by entry count (max_entries) and total body bytes (max_bytes)
+    - entries are fresh for `ttl` seconds; stale entries with an ETag or
+      Last-Modified are revalidated with If-None-Match / If-Modified-Since,
+      so a 304 reuses the cached body instead of transferring it again
+    - responses with Cache-Control: no-store are never cached
+
+    Counters (see snapshot()): hits, misses (incl. stale entries sent for
+    revalidation), revalidations (the 304s among those misses), stores,
+    evictions.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 8 * 1024 * 1024,
+        ttl: float = 60.0,
+        vary_headers: Iterable[str] = DEFAULT_VARY_HEADERS,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.vary_headers = tuple(h.lower() for h in vary_headers)
+        self._entries: "OrderedDict[Tuple[Any, ...], CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_settings(cls, section: Optional[Dict[str, Any]]) -> Optional["ResponseCache"]:
+        """
+        Build a cache from settings["api"]["cache"]; returns None unless
+        `enabled: true`.
+        """
+        section = section or {}
+        if not section.get("enabled", False):
+            return None
+        return cls(
+            max_entries=int(section.get("max_entries", 256)),
+            max_bytes=int(section.get("max_bytes", 8 * 1024 * 1024)),
+            ttl=float(section.get("ttl", 60.0)),
+            vary_headers=section.get("vary_headers", DEFAULT_VARY_HEADERS),
+        )
+
+    def key(self, url: str, params: Any, headers: Dict[str, str]) -> Tuple[Any, ...]:
+        """
+        Cache key: full URL with encoded query params plus the values of the
+        headers that change the representation (vary_headers).
+        """
+        prepared = requests.models.PreparedRequest()
+        prepared.prepare_url(url, params)
+        lowered = {k.lower(): v for k, v in headers.items()}
+        return (prepared.url,) + tuple(lowered.get(h) for h in self.vary_headers)
+
+    def lookup(self, key: Tuple[Any, ...]) -> Tuple[Optional[CacheEntry], bool]:
+        """
+        Returns (entry, is_fresh). A fresh entry counts as a hit; anything
+        else is left to the caller (miss or revalidation).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            if time.monotonic() - entry.stored_at < self.ttl:
+                self.hits += 1
+                return entry, True
+            self.misses += 1
+            return entry, False
+
+    def store(self, key: Tuple[Any, ...], response: requests.Response) -> None:
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if response.status_code != 200 or "no-store" in cache_control:
+            return
+        entry = CacheEntry(response)
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            self.stores += 1
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self.evictions += 1
+
+    def revalidated(self, key: Tuple[Any, ...], not_modified: requests.Response) -> Optional[requests.Response]:
+        """
+        Record a 304 for `key`: restart its TTL and return a copy of the
+        cached response (None if it was evicted meanwhile).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.stored_at = time.monotonic()
+            # replace the cached response rather than editing its headers:
+            # earlier copies (and the original caller's response) keep theirs
+            refreshed = copy_response(entry.response)
+            for name in ("ETag", "Last-Modified", "Date", "Cache-Control", "Expires"):
+                if name in not_modified.headers:
+                    refreshed.headers[name] = not_modified.headers[name]
+            entry.response = refreshed
+            entry.etag = refreshed.headers.get("ETag")
+            entry.last_modified = refreshed.headers.get("Last-Modified")
+            self.revalidations += 1
+            return copy_response(refreshed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "stores": self.stores,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,203 @@
+from typing import Any, Dict, Optional
+from functools import partial
+import logging
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_KEEPALIVE_IDLE_TIMEOUT = 30.0
+
+
+class ConnectionStats:
+    """
+    Thread-safe counters describing how a pooled session uses its connections.
+
+      - new_connections: requests that had to open a fresh TCP (+ TLS) connection
+      - reused_connections: requests served on an already open keep-alive connection
+      - idle_evictions: pooled connections closed because they sat idle too long
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.idle_evictions = 0
+
+    def record(self, reused: bool) -> None:
+        with self._lock:
+            if reused:
+                self.reused_connections += 1
+            else:
+                self.new_connections += 1
+
+    def record_idle_eviction(self) -> None:
+        with self._lock:
+            self.idle_evictions += 1
+
+    @property
+    def reuse_ratio(self) -> float:
+        with self._lock:
+            total = self.new_connections + self.reused_connections
+            return self.reused_connections / total if total else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.new_connections + self.reused_connections
+            return {
+                "new_connections": self.new_connections,
+                "reused_connections": self.reused_connections,
+                "idle_evictions": self.idle_evictions,
+                "reuse_ratio": self.reused_connections / total if total else 0.0,
+            }
+
+
+class _TrackingPoolMixin:
+    """
+    Connection pool mixin that counts reuse vs new connections and closes
+    keep-alive connections that have been idle longer than `idle_timeout`
+    (servers usually drop them anyway, and a stale socket costs a failed write).
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        stats: ConnectionStats,
+        idle_timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        self._stats = stats
+        self._idle_timeout = idle_timeout
+        super().__init__(*args, **kwargs)
+
+    def _get_conn(self, timeout: Optional[float] = None):
+        conn = super()._get_conn(timeout)
+        connected = getattr(conn, "is_connected", None)
+        if connected is None:  # urllib3 < 2 has no is_connected
+            connected = getattr(conn, "sock", None) is not None
+
+        last_used = getattr(conn, "_pool_last_used", None)
+        if (
+            connected
+            and self._idle_timeout is not None
+            and last_used is not None
+            and time.monotonic() - last_used > self._idle_timeout
+        ):
+            logger.debug("Closing idle keep-alive connection to %s", self.host)
+            conn.close()
+            self._stats.record_idle_eviction()
+            connected = False
+
+        self._stats.record(reused=bool(connected))
+        return conn
+
+    def _put_conn(self, conn) -> None:
+        if conn is not None:
+            conn._pool_last_used = time.monotonic()
+        super()._put_conn(conn)
+
+
+class _TrackingHTTPConnectionPool(_TrackingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _TrackingHTTPSConnectionPool(_TrackingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose per-host connection pools report into a ConnectionStats
+    instance and evict idle keep-alive connections.
+    """
+
+    def __init__(
+        self,
+        stats: ConnectionStats,
+        idle_timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.stats = stats
+        self.idle_timeout = idle_timeout
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        # PoolManager only calls pool_cls(host, port, **context), so partials
+        # let us hand our extra arguments to every pool it creates.
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": partial(
+                _TrackingHTTPConnectionPool,
+                stats=self.stats,
+                idle_timeout=self.idle_timeout,
+            ),
+            "https": partial(
+                _TrackingHTTPSConnectionPool,
+                stats=self.stats,
+                idle_timeout=self.idle_timeout,
+            ),
+        }
+
+
+class PooledSession(requests.Session):
+    """
+    requests.Session with a sized keep-alive connection pool.
+
+    Args:
+        pool_connections: number of per-host pools kept (distinct hosts cached)
+        pool_maxsize: max connections kept open per host
+        keepalive_idle_timeout: seconds a pooled connection may sit idle before
+            it is closed instead of reused (None disables the check)
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keepalive_idle_timeout: Optional[float] = DEFAULT_KEEPALIVE_IDLE_TIMEOUT,
+    ) -> None:
+        super().__init__()
+        self.stats = ConnectionStats()
+        adapter = PooledHTTPAdapter(
+            self.stats,
+            idle_timeout=keepalive_idle_timeout,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+
+def pool_settings(section: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Read connection pool settings from a config section (e.g. settings["api"]),
+    falling back to defaults for missing or invalid values.
+
+    Returns kwargs suitable for PooledSession(...).
+    """
+    section = section or {}
+
+    def _number(key: str, default: Any, cast: Any, nullable: bool = False) -> Any:
+        value = section.get(key, default)
+        if value is None and nullable:
+            return None
+        try:
+            return cast(value)
+        except (TypeError, ValueError):
+            logger.warning("Invalid %s=%r in settings, using %r", key, value, default)
+            return default
+
+    return {
+        "pool_connections": _number("pool_connections", DEFAULT_POOL_CONNECTIONS, int),
+        "pool_maxsize": _number("pool_maxsize", DEFAULT_POOL_MAXSIZE, int),
+        "keepalive_idle_timeout": _number(
+            # null = never evict idle connections
+            "keepalive_idle_timeout", DEFAULT_KEEPALIVE_IDLE_TIMEOUT, float, nullable=True
+        ),
+    }
@@ -1,3 +1,21 @@
+from datetime import datetime
+from typing import Any, Dict
+import re
+
+from jsonschema import FormatChecker
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+__all__ = [
+    "USER_SCHEMA",
+    "CREATED_USER_SCHEMA",
+    "ERROR_SCHEMA",
+    "SCHEMAS",
+    "FORMAT_CHECKER",
+    "get_validator",
+    "validate_fast",
+]
+
 # Schema for GET /api/users/{id} (user object inside "data")
 USER_SCHEMA = {
     "type": "object",
@@ -45,3 +63,67 @@ ERROR_SCHEMA = {
     },
     "additionalProperties": True
 }
+
+
+# Schemas by name, for validate_fast() and batch tools
+SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "user": USER_SCHEMA,
+    "created_user": CREATED_USER_SCHEMA,
+    "error": ERROR_SCHEMA,
+}
+
+FORMAT_CHECKER = FormatChecker()
+
+# RFC 3339 date-time: fraction of any length, "Z" or a numeric offset
+_DATE_TIME = re.compile(
+    r"^(\d{4}-\d{2}-\d{2})[Tt ](\d{2}:\d{2}:\d{2})(?:\.(\d+))?([Zz]|[+-]\d{2}:\d{2})$"
+)
+
+if "date-time" not in FORMAT_CHECKER.checkers:
+    # jsonschema only checks date-time when rfc3339-validator is installed,
+    # which requirements.txt does not pull in. Fall back to the stdlib
+    # parser; before 3.11 datetime.fromisoformat() rejects a trailing "Z"
+    # and fractions that are not 3 or 6 digits long, so normalise both
+    # (Reqres sends createdAt as "2024-01-01T12:00:00.000Z").
+    @FORMAT_CHECKER.checks("date-time", raises=ValueError)
+    def _is_date_time(instance: object) -> bool:
+        if not isinstance(instance, str):
+            return True
+        match = _DATE_TIME.match(instance)
+        if match is None:
+            raise ValueError(f"{instance!r} is not an RFC 3339 date-time")
+        date, time_, fraction, offset = match.groups()
+        fraction = f".{(fraction or '')[:6].ljust(6, '0')}"
+        offset = "+00:00" if offset in ("Z", "z") else offset
+        datetime.fromisoformat(f"{date}T{time_}{fraction}{offset}")
+        return True
+
+# name -> validator, built (and the schema checked) once per process
+_VALIDATORS: Dict[str, Any] = {}
+
+
+def get_validator(name: str) -> Any:
+    """
+    Precompiled validator (with email / date-time format checking) for a
+    schema in SCHEMAS. Built on first use and reused afterwards.
+    """
+    validator = _VALIDATORS.get(name)
+    if validator is None:
+        try:
+            schema = SCHEMAS[name]
+        except KeyError:
+            raise KeyError(f"Unknown schema {name!r}, expected one of {sorted(SCHEMAS)}") from None
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        validator = _VALIDATORS.setdefault(name, cls(schema, format_checker=FORMAT_CHECKER))
+    return validator
+
+
+def validate_fast(name: str, instance: Any) -> None:
+    """
+    Validate `instance` against the named schema with its cached validator.
+    Raises jsonschema.ValidationError (the best match) like jsonschema.validate.
+    """
+    error = best_match(get_validator(name).iter_errors(instance))
+    if error is not None:
+        raise error
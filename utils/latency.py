@@ -0,0 +1,207 @@
+from typing import Any, Dict, Iterable, Optional, Tuple
+import math
+import re
+import threading
+
+# Path segments that identify a resource rather than an endpoint
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[0-9a-fA-F]{16,})$"
+)
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+def template_path(path: str) -> str:
+    """
+    Collapse resource ids in a request path so all calls to one endpoint
+    share a histogram: /api/users/2?x=1 -> /api/users/{id}
+    """
+    path = path.split("?", 1)[0].split("#", 1)[0]
+    segments = [
+        "{id}" if _ID_SEGMENT.match(segment) else segment
+        for segment in path.split("/")
+    ]
+    templated = "/".join(segments)
+    return templated if templated.startswith("/") else "/" + templated
+
+
+def status_class(status_code: Optional[int]) -> str:
+    """
+    2xx / 3xx / 4xx / 5xx, or "error" when no response was received.
+    """
+    if status_code is None:
+        return "error"
+    return f"{status_code // 100}xx"
+
+
+class LatencyHistogram:
+    """
+    Log-linear (HDR-style) histogram of nanosecond latencies.
+
+    Values below 2**precision are counted exactly; above that each power of
+    two is split into 2**(precision - 1) linear sub-buckets, so every recorded
+    value is kept within a relative error of 2**-(precision - 1) (~1.6% with
+    the default precision of 7) in a small sparse dict of counters.
+    """
+
+    def __init__(self, precision: int = 7) -> None:
+        if not 2 <= precision <= 16:
+            raise ValueError("precision must be between 2 and 16")
+        self.precision = precision
+        self._linear_limit = 1 << precision
+        self._sub_buckets = 1 << (precision - 1)
+        self._lock = threading.Lock()
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def _index(self, value: int) -> int:
+        if value < self._linear_limit:
+            return value
+        shift = value.bit_length() - self.precision
+        top = value >> shift
+        return self._linear_limit + (shift - 1) * self._sub_buckets + (top - self._sub_buckets)
+
+    def _value_at(self, index: int) -> int:
+        """
+        Midpoint of the value range covered by bucket `index`.
+        """
+        if index < self._linear_limit:
+            return index
+        offset = index - self._linear_limit
+        shift = offset // self._sub_buckets + 1
+        top = offset % self._sub_buckets + self._sub_buckets
+        return (top << shift) + (1 << (shift - 1))
+
+    def record(self, value_ns: int) -> None:
+        value_ns = max(0, int(value_ns))
+        index = self._index(value_ns)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self.count += 1
+            self.total += value_ns
+            if self.min is None or value_ns < self.min:
+                self.min = value_ns
+            if self.max is None or value_ns > self.max:
+                self.max = value_ns
+
+    def percentile(self, q: float) -> Optional[int]:
+        """
+        Value (ns) at percentile q (0-100), or None when empty.
+        """
+        with self._lock:
+            return self._percentiles((q,))[0]
+
+    def _percentiles(self, qs: Iterable[float]) -> Tuple[Optional[int], ...]:
+        # caller holds the lock
+        if not self.count:
+            return tuple(None for _ in qs)
+        ranks = [min(self.count, max(1, math.ceil(q / 100.0 * self.count))) for q in qs]
+        # the extremes are tracked exactly
+        results: Dict[int, int] = {1: self.min, self.count: self.max}
+        seen = 0
+        pending = sorted(set(ranks) - set(results))
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            while pending and pending[0] <= seen:
+                # clamp the bucket midpoint to the exact extremes
+                results[pending.pop(0)] = min(max(self._value_at(index), self.min), self.max)
+            if not pending:
+                break
+        return tuple(results[rank] for rank in ranks)
+
+    def snapshot(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+        """
+        Summary in milliseconds: count, min, mean, max and the requested
+        percentiles (keys like p50, p99, p99.9).
+        """
+        qs = tuple(percentiles)
+        with self._lock:
+            values = self._percentiles(qs)
+            summary: Dict[str, Any] = {
+                "count": self.count,
+                "min_ms": _ms(self.min),
+                "mean_ms": _ms(self.total / self.count) if self.count else None,
+                "max_ms": _ms(self.max),
+            }
+        for q, value in zip(qs, values):
+            summary[f"p{q:g}_ms"] = _ms(value)
+        return summary
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self.count = 0
+            self.total = 0
+            self.min = None
+            self.max = None
+
+
+def _ms(value_ns: Optional[float]) -> Optional[float]:
+    return None if value_ns is None else value_ns / 1e6
+
+
+class LatencyRecorder:
+    """
+    Per-endpoint latency histograms keyed by
+    (method, templated path, status class), e.g. ("GET", "/api/users/{id}", "2xx").
+    """
+
+    def __init__(self, precision: int = 7) -> None:
+        self.precision = precision
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+
+    def histogram(self, method: str, path: str, status_code: Optional[int]) -> LatencyHistogram:
+        key = (method.upper(), template_path(path), status_class(status_code))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, LatencyHistogram(self.precision))
+        return histogram
+
+    def record(self, method: str, path: str, status_code: Optional[int], elapsed_ns: int) -> None:
+        self.histogram(method, path, status_code).record(elapsed_ns)
+
+    def percentile(
+        self, method: str, path: str, q: float, status: str = "2xx"
+    ) -> Optional[int]:
+        """
+        Percentile q (ns) for one endpoint and status class, None if unseen.
+        """
+        key = (method.upper(), template_path(path), status)
+        histogram = self._histograms.get(key)
+        return histogram.percentile(q) if histogram is not None else None
+
+    def count(self, method: str, path: str, status: str = "2xx") -> int:
+        """
+        Number of recorded calls for one endpoint and status class.
+        """
+        key = (method.upper(), template_path(path), status)
+        histogram = self._histograms.get(key)
+        return histogram.count if histogram is not None else 0
+
+    def snapshot(
+        self,
+        reset: bool = False,
+        percentiles: Iterable[float] = DEFAULT_PERCENTILES,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Summaries for every endpoint, keyed "METHOD /templated/path STATUS".
+        With reset=True the histograms are cleared after being read.
+        """
+        qs = tuple(percentiles)
+        with self._lock:
+            items = list(self._histograms.items())
+        result = {}
+        for (method, path, status), histogram in sorted(items):
+            result[f"{method} {path} {status}"] = histogram.snapshot(qs)
+            if reset:
+                histogram.reset()
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
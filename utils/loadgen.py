@@ -0,0 +1,292 @@
+"""
+Open-loop load generator replaying ApiClient workflows at a target arrival rate.
+
+    python -m utils.loadgen --stub --stage 5:20:200 --stage 10:200 --scenario get_user=3 --scenario create_user=1
+    python -m utils.loadgen --base-url https://reqres.in --stage 30:5
+"""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+
+import requests
+
+from .api_client import ApiClient, ApiClientError
+from .latency import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Scenario:
+    """
+    One workflow step: `call(client)` returns the response, which counts as
+    an error unless its status is `expected_status`. `weight` sets its share
+    of the arrivals.
+    """
+
+    name: str
+    call: Callable[[ApiClient], requests.Response]
+    expected_status: int
+    weight: float = 1.0
+
+
+# The calls exercised by tests/test_api_workflow.py
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("get_user", lambda c: c.get("/api/users/2", use_cache=False), 200),
+        Scenario("get_missing_user", lambda c: c.get("/api/users/23", use_cache=False), 404),
+        Scenario(
+            "create_user",
+            lambda c: c.post("/api/users", json={"name": "Rim", "job": "Senior QA Automation Engineer"}),
+            201,
+        ),
+        Scenario("delete_user", lambda c: c.delete("/api/users/2"), 204),
+        Scenario(
+            "login_missing_password",
+            lambda c: c.post("/api/login", json={"email": "user@domain"}),
+            400,
+        ),
+    )
+}
+
+
+@dataclass
+class Stage:
+    """
+    `duration` seconds with the arrival rate (requests/second) moving
+    linearly from `rate` to `rate_end` (constant when rate_end is None).
+    """
+
+    duration: float
+    rate: float
+    rate_end: Optional[float] = None
+
+    def rate_at(self, elapsed: float) -> float:
+        if self.rate_end is None or self.duration <= 0:
+            return self.rate
+        return self.rate + (self.rate_end - self.rate) * min(elapsed / self.duration, 1.0)
+
+    @classmethod
+    def parse(cls, text: str) -> "Stage":
+        """
+        "DURATION:RATE" or "DURATION:RATE:RATE_END", e.g. "10:50" or "5:0:100".
+        """
+        parts = [float(part) for part in text.split(":")]
+        if len(parts) not in (2, 3):
+            raise ValueError(f"Stage must be DURATION:RATE[:RATE_END], got {text!r}")
+        return cls(*parts)
+
+
+def arrival_offsets(
+    stages: Sequence[Stage],
+    poisson: bool = False,
+    rng: Optional[random.Random] = None,
+) -> Iterator[float]:
+    """
+    Intended start times (seconds from the start of the run) of every
+    request: evenly spaced at the current rate, or exponentially
+    distributed gaps with poisson=True.
+    """
+    rng = rng or random.Random()
+    stage_start = 0.0
+    for stage in stages:
+        stage_end = stage_start + stage.duration
+        t = stage_start
+        while True:
+            rate = stage.rate_at(t - stage_start)
+            if rate <= 0:
+                # idle part of a ramp: look again a little later
+                t += 0.01
+            else:
+                t += rng.expovariate(rate) if poisson else 1.0 / rate
+            # tolerance for float drift of many small gaps
+            if t >= stage_end - 1e-9:
+                break
+            if rate > 0:
+                yield t
+        stage_start = stage_end
+
+
+@dataclass
+class ScenarioStats:
+    """
+    Per-scenario results. `latency` is measured from the request's intended
+    start (so queueing behind a slow system is counted), `service` from the
+    moment it was actually sent.
+    """
+
+    name: str
+    count: int = 0
+    errors: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    service: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def summary(self, duration: float) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "error_rate": self.errors / self.count if self.count else 0.0,
+            "throughput_rps": self.count / duration if duration > 0 else 0.0,
+            "latency": self.latency.snapshot(),
+            "service": self.service.snapshot(),
+        }
+
+
+@dataclass
+class LoadReport:
+    """
+    Result of run_load(): per-scenario stats, wall-clock duration, and the
+    largest delay of the dispatcher behind the schedule (a large value means
+    the generator itself could not keep up).
+    """
+
+    scenarios: Dict[str, ScenarioStats] = field(default_factory=dict)
+    duration: float = 0.0
+    scheduled: int = 0
+    max_dispatch_lag: float = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "duration": self.duration,
+            "scheduled": self.scheduled,
+            "max_dispatch_lag": self.max_dispatch_lag,
+            "scenarios": {
+                name: stats.summary(self.duration) for name, stats in sorted(self.scenarios.items())
+            },
+        }
+
+
+def run_load(
+    client: ApiClient,
+    scenarios: Sequence[Scenario],
+    stages: Sequence[Stage],
+    workers: int = 64,
+    poisson: bool = False,
+    seed: Optional[int] = None,
+) -> LoadReport:
+    """
+    Drive `client` open-loop: requests are started on a fixed schedule
+    derived from `stages`, independent of how fast responses come back, so
+    a slow server shows up as growing latency instead of a lower send rate
+    (no coordinated omission).
+
+    Args:
+        client: ApiClient to call through (build it with single_flight=False
+            so identical concurrent GETs are not coalesced)
+        scenarios: workflows picked per arrival by weight
+        stages: arrival-rate profile, e.g. a ramp then a plateau
+        workers: threads executing requests; when all are busy requests
+            queue, and the wait counts toward their latency
+        poisson: exponential inter-arrival gaps instead of even spacing
+        seed: makes arrivals and scenario choice reproducible
+    """
+    if not scenarios:
+        raise ValueError("run_load needs at least one scenario")
+    rng = random.Random(seed)
+    weights = [scenario.weight for scenario in scenarios]
+    report = LoadReport(scenarios={s.name: ScenarioStats(s.name) for s in scenarios})
+    counters_lock = threading.Lock()
+
+    def execute(scenario: Scenario, intended_ns: int) -> None:
+        sent_ns = time.perf_counter_ns()
+        try:
+            response = scenario.call(client)
+            failed = response.status_code != scenario.expected_status
+        except ApiClientError:
+            failed = True
+        except Exception:
+            # nobody checks the futures: count it here or the arrival is lost
+            logger.exception("Scenario %s raised", scenario.name)
+            failed = True
+        done_ns = time.perf_counter_ns()
+        stats = report.scenarios[scenario.name]
+        stats.latency.record(done_ns - intended_ns)
+        stats.service.record(done_ns - sent_ns)
+        with counters_lock:
+            stats.count += 1
+            stats.errors += failed
+
+    start_ns = time.perf_counter_ns()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="loadgen") as executor:
+        for offset in arrival_offsets(stages, poisson=poisson, rng=rng):
+            intended_ns = start_ns + int(offset * 1e9)
+            wait = (intended_ns - time.perf_counter_ns()) / 1e9
+            if wait > 0:
+                time.sleep(wait)
+            else:
+                report.max_dispatch_lag = max(report.max_dispatch_lag, -wait)
+            scenario = rng.choices(scenarios, weights)[0]
+            executor.submit(execute, scenario, intended_ns)
+            report.scheduled += 1
+    report.duration = (time.perf_counter_ns() - start_ns) / 1e9
+
+    logger.info(
+        "Load run: %s requests scheduled in %.3fs (max dispatch lag %.3fs)",
+        report.scheduled,
+        report.duration,
+        report.max_dispatch_lag,
+    )
+    return report
+
+
+def _parse_scenario(text: str) -> Scenario:
+    name, _, weight = text.partition("=")
+    if name not in SCENARIOS:
+        raise argparse.ArgumentTypeError(f"unknown scenario {name!r}, expected one of {sorted(SCENARIOS)}")
+    scenario = SCENARIOS[name]
+    return Scenario(scenario.name, scenario.call, scenario.expected_status, float(weight or 1))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.loadgen",
+        description="Open-loop load generator for the ApiClient workflows",
+    )
+    parser.add_argument(
+        "--stage", action="append", type=Stage.parse, required=True,
+        help="DURATION:RATE[:RATE_END] in seconds and requests/second, repeatable",
+    )
+    parser.add_argument(
+        "--scenario", action="append", type=_parse_scenario,
+        help=f"NAME[=WEIGHT], repeatable; one of {sorted(SCENARIOS)} (default: all)",
+    )
+    parser.add_argument("--base-url", help="API base URL (default: api.base_url)")
+    parser.add_argument("--stub", action="store_true", help="run against an in-process Reqres stub")
+    parser.add_argument("--workers", type=int, default=64)
+    parser.add_argument("--poisson", action="store_true", help="exponential inter-arrival gaps")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    scenarios = args.scenario or list(SCENARIOS.values())
+    stub = None
+    base_url = args.base_url
+    if args.stub:
+        from .reqres_stub import ReqresStubServer
+
+        stub = ReqresStubServer().start()
+        base_url = stub.base_url
+        os.environ.setdefault("REQRES_API_TOKEN", "reqres-stub")
+    try:
+        with ApiClient(base_url=base_url, single_flight=False) as client:
+            report = run_load(
+                client, scenarios, args.stage,
+                workers=args.workers, poisson=args.poisson, seed=args.seed,
+            )
+    finally:
+        if stub is not None:
+            stub.stop()
+    print(json.dumps(report.summary(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
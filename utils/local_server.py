@@ -0,0 +1,88 @@
+from typing import Any, Optional
+import asyncio
+import logging
+import threading
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundServer:
+    """
+    Runs an aiohttp application on its own event loop in a daemon thread, so
+    blocking test code (ApiClient, WebhookClient) can talk to it over
+    127.0.0.1 without the caller managing a loop.
+
+    Use as a context manager, or call start() / stop():
+
+        with BackgroundServer(app) as server:
+            client = ApiClient(base_url=server.base_url)
+    """
+
+    def __init__(self, app: web.Application, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.app = app
+        self.host = host
+        self.port = port
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def __enter__(self) -> "BackgroundServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def start(self, timeout: float = 10.0) -> "BackgroundServer":
+        if self._thread is not None:
+            return self
+        started = threading.Event()
+        errors = []
+
+        def run() -> None:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            self._loop = loop
+            try:
+                loop.run_until_complete(self._start_site())
+            except Exception as exc:  # surfaced to the starting thread
+                errors.append(exc)
+                started.set()
+                loop.close()
+                return
+            started.set()
+            loop.run_forever()
+            loop.run_until_complete(self._runner.cleanup())
+            loop.close()
+
+        self._thread = threading.Thread(target=run, name="local-http-server", daemon=True)
+        self._thread.start()
+        if not started.wait(timeout):
+            raise RuntimeError("Local HTTP server did not start in time")
+        if errors:
+            self._thread = None
+            raise RuntimeError(f"Local HTTP server failed to start: {errors[0]!r}") from errors[0]
+        logger.info("Local HTTP server listening on %s", self.base_url)
+        return self
+
+    async def _start_site(self) -> None:
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        # resolve the real port when 0 (ephemeral) was requested
+        self.port = self._runner.addresses[0][1]
+
+    def stop(self) -> None:
+        if self._thread is None or self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=10)
+        self._thread = None
+        self._loop = None
+        logger.info("Local HTTP server on %s stopped", self.base_url)
@@ -0,0 +1,145 @@
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+import asyncio
+import logging
+import threading
+import time
+
+from .config import load_settings
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Client-side token bucket: `rate` requests per second on average, with
+    bursts of up to `burst` requests.
+
+    Callers reserve a token under a short lock and then wait outside it, so
+    the bucket is safe to share between threads and asyncio tasks: waiters
+    queue locally in arrival order instead of hammering the server.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst) if burst is not None else max(1.0, self.rate)
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+        self.waits = 0
+        self.waited_seconds = 0.0
+
+    def _reserve(self) -> float:
+        """
+        Take one token, possibly going into debt, and return how long the
+        caller must wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            if wait > 0:
+                self.waits += 1
+                self.waited_seconds += wait
+            return wait
+
+    def acquire(self) -> float:
+        """
+        Block the current thread until a token is available.
+        Returns the seconds waited.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """
+        Suspend the current task until a token is available.
+        Returns the seconds waited.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "waits": self.waits,
+                "waited_seconds": self.waited_seconds,
+            }
+
+
+class RateLimiterRegistry:
+    """
+    Per-host token buckets, configured in config/settings.yaml:
+
+        rate_limits:
+          reqres.in:
+            rate: 5     # requests per second
+            burst: 10
+
+    Keys are matched against the URL's host:port first, then its hostname.
+    Hosts without an entry are not limited.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        self._buckets: Dict[str, TokenBucket] = {}
+        for host, cfg in (limits or {}).items():
+            cfg = cfg or {}
+            if cfg.get("rate") is None:
+                logger.warning("rate_limits.%s has no rate, ignoring", host)
+                continue
+            self._buckets[host.lower()] = TokenBucket(cfg["rate"], cfg.get("burst"))
+
+    def for_url(self, url: str) -> Optional[TokenBucket]:
+        parsed = urlparse(url)
+        return self._buckets.get(parsed.netloc.lower()) or self._buckets.get(
+            (parsed.hostname or "").lower()
+        )
+
+    def acquire(self, url: str) -> float:
+        bucket = self.for_url(url)
+        if bucket is None:
+            return 0.0
+        waited = bucket.acquire()
+        if waited:
+            logger.debug("Rate limiter delayed request to %s by %.3fs", url, waited)
+        return waited
+
+    async def acquire_async(self, url: str) -> float:
+        bucket = self.for_url(url)
+        if bucket is None:
+            return 0.0
+        waited = await bucket.acquire_async()
+        if waited:
+            logger.debug("Rate limiter delayed request to %s by %.3fs", url, waited)
+        return waited
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {host: bucket.snapshot() for host, bucket in self._buckets.items()}
+
+
+_shared_registry: Optional[RateLimiterRegistry] = None
+_shared_lock = threading.Lock()
+
+
+def shared_rate_limiters() -> RateLimiterRegistry:
+    """
+    Process-wide registry built from the rate_limits settings section, so
+    every client in the process draws from the same per-host buckets.
+    """
+    global _shared_registry
+    with _shared_lock:
+        if _shared_registry is None:
+            _shared_registry = RateLimiterRegistry(load_settings().get("rate_limits"))
+        return _shared_registry
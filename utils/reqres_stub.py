@@ -0,0 +1,250 @@
+from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+import asyncio
+import json
+import logging
+import random
+import threading
+
+from aiohttp import web
+
+from .local_server import BackgroundServer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PER_PAGE = 6
+
+# The fixture users served by reqres.in
+_SEED_USERS = [
+    (1, "George", "Bluth"),
+    (2, "Janet", "Weaver"),
+    (3, "Emma", "Wong"),
+    (4, "Eve", "Holt"),
+    (5, "Charles", "Morris"),
+    (6, "Tracey", "Ramos"),
+    (7, "Michael", "Lawson"),
+    (8, "Lindsay", "Ferguson"),
+    (9, "Tobias", "Funke"),
+    (10, "Byron", "Fields"),
+    (11, "George", "Edwards"),
+    (12, "Rachel", "Howell"),
+]
+
+SUPPORT = {
+    "url": "https://reqres.in/#support-heading",
+    "text": "To keep ReqRes free, contributions towards server costs are appreciated!",
+}
+
+
+def _seed_user(user_id: int, first_name: str, last_name: str) -> Dict[str, Any]:
+    return {
+        "id": user_id,
+        "email": f"{first_name.lower()}.{last_name.lower()}@reqres.in",
+        "first_name": first_name,
+        "last_name": last_name,
+        "avatar": f"https://reqres.in/img/faces/{user_id}-image.jpg",
+    }
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class UserStore:
+    """
+    Thread-safe in-memory users, seeded with reqres.in's twelve fixture users.
+
+    Like reqres.in, writes (create / update / delete) are acknowledged but
+    not persisted, so reads stay identical however much load hits the stub.
+    """
+
+    def __init__(self, users: Optional[List[Dict[str, Any]]] = None) -> None:
+        self._lock = threading.Lock()
+        seeded = users if users is not None else [_seed_user(*user) for user in _SEED_USERS]
+        self._users: Dict[int, Dict[str, Any]] = {user["id"]: user for user in seeded}
+        self._next_id = max(self._users, default=0) + 1
+
+    def get(self, user_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._users.get(user_id)
+
+    def by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return next((u for u in self._users.values() if u["email"] == email), None)
+
+    def page(self, page: int, per_page: int) -> Dict[str, Any]:
+        with self._lock:
+            users = [self._users[key] for key in sorted(self._users)]
+        total = len(users)
+        start = (page - 1) * per_page
+        return {
+            "page": page,
+            "per_page": per_page,
+            "total": total,
+            "total_pages": -(-total // per_page) if per_page else 0,
+            "data": users[start:start + per_page] if start >= 0 else [],
+            "support": SUPPORT,
+        }
+
+    def allocate_id(self) -> int:
+        with self._lock:
+            user_id = self._next_id
+            self._next_id += 1
+            return user_id
+
+
+class FaultInjection:
+    """
+    Artificial latency and error injection for the stub, adjustable while
+    the server runs (plain attributes, read per request):
+
+      - latency: seconds added to every response
+      - jitter: extra uniformly random seconds in [0, jitter)
+      - error_rate: probability (0-1) of answering `error_status` instead
+      - error_status: status code of injected errors (503 by default)
+      - seed: makes the random choices reproducible
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self.injected_errors = 0
+
+    def delay(self) -> float:
+        return self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def should_fail(self) -> bool:
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.injected_errors += 1
+            return True
+        return False
+
+
+def create_reqres_app(users: UserStore, faults: FaultInjection) -> web.Application:
+    """
+    aiohttp app answering the reqres.in endpoints the suite uses:
+
+      - GET    /api/users?page=&per_page=  -> paged list
+      - GET    /api/users/{id}             -> {"data", "support"} or 404 {}
+      - POST   /api/users                  -> 201 echo + id + createdAt
+      - PUT    /api/users/{id}             -> 200 echo + updatedAt (PATCH too)
+      - DELETE /api/users/{id}             -> 204
+      - POST   /api/login, /api/register   -> token, or 400 {"error": ...}
+    """
+
+    @web.middleware
+    async def inject_faults(request: web.Request, handler: Any) -> web.StreamResponse:
+        delay = faults.delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if faults.should_fail():
+            return web.json_response({"error": "Injected failure"}, status=faults.error_status)
+        return await handler(request)
+
+    async def read_json(request: web.Request) -> Dict[str, Any]:
+        body = await request.read()
+        if not body:
+            return {}
+        try:
+            data = json.loads(body)
+        except ValueError:
+            raise web.HTTPBadRequest(
+                text=json.dumps({"error": "Invalid JSON"}), content_type="application/json"
+            )
+        return data if isinstance(data, dict) else {}
+
+    async def list_users(request: web.Request) -> web.Response:
+        try:
+            page = int(request.query.get("page", 1))
+            per_page = int(request.query.get("per_page", DEFAULT_PER_PAGE))
+        except ValueError:
+            page, per_page = 1, DEFAULT_PER_PAGE
+        return web.json_response(users.page(page, per_page))
+
+    async def get_user(request: web.Request) -> web.Response:
+        try:
+            user = users.get(int(request.match_info["id"]))
+        except ValueError:
+            user = None
+        if user is None:
+            return web.json_response({}, status=404)
+        return web.json_response({"data": user, "support": SUPPORT})
+
+    async def create_user(request: web.Request) -> web.Response:
+        body = await read_json(request)
+        body.update(id=str(users.allocate_id()), createdAt=_now())
+        return web.json_response(body, status=201)
+
+    async def update_user(request: web.Request) -> web.Response:
+        body = await read_json(request)
+        body["updatedAt"] = _now()
+        return web.json_response(body)
+
+    async def delete_user(request: web.Request) -> web.Response:
+        return web.Response(status=204)
+
+    async def login(request: web.Request) -> web.Response:
+        body = await read_json(request)
+        if not body.get("email") and not body.get("username"):
+            return web.json_response({"error": "Missing email or username"}, status=400)
+        if not body.get("password"):
+            return web.json_response({"error": "Missing password"}, status=400)
+        user = users.by_email(body.get("email", ""))
+        if user is None:
+            return web.json_response({"error": "user not found"}, status=400)
+        if request.path.endswith("/register"):
+            return web.json_response({"id": user["id"], "token": "QpwL5tke4Pnpja7X4"})
+        return web.json_response({"token": "QpwL5tke4Pnpja7X4"})
+
+    app = web.Application(middlewares=[inject_faults])
+    app.router.add_get("/api/users", list_users)
+    app.router.add_post("/api/users", create_user)
+    app.router.add_get("/api/users/{id}", get_user)
+    app.router.add_put("/api/users/{id}", update_user)
+    app.router.add_patch("/api/users/{id}", update_user)
+    app.router.add_delete("/api/users/{id}", delete_user)
+    app.router.add_post("/api/login", login)
+    app.router.add_post("/api/register", login)
+    return app
+
+
+class ReqresStubServer(BackgroundServer):
+    """
+    In-process stand-in for reqres.in, for offline runs and load tests at
+    local-network speed without the public rate limits.
+
+        with ReqresStubServer(latency=0.01, error_rate=0.05, seed=1) as stub:
+            client = ApiClient(base_url=stub.base_url)
+            stub.faults.error_rate = 0  # adjustable while running
+    """
+
+    def __init__(
+        self,
+        users: Optional[UserStore] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.users = users if users is not None else UserStore()
+        self.faults = FaultInjection(
+            latency=latency,
+            jitter=jitter,
+            error_rate=error_rate,
+            error_status=error_status,
+            seed=seed,
+        )
+        super().__init__(create_reqres_app(self.users, self.faults), host=host, port=port)
@@ -0,0 +1,291 @@
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Type
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import logging
+import random
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETRY_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+DEFAULT_RETRY_STATUSES = (429, 502, 503, 504)
+
+
+class RetryBudget:
+    """
+    Token bucket that caps retries relative to normal traffic, so a brownout
+    does not turn into a retry storm.
+
+    - every first attempt deposits `ratio` tokens (e.g. 0.2 -> at most ~20% extra load)
+    - every retry withdraws one token; no token, no retry
+    - the bucket also refills at `min_per_second`, so a low-traffic client
+      can still retry occasionally
+    - tokens never exceed `max_tokens`
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        max_tokens: float = 10.0,
+    ) -> None:
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.max_tokens, self._tokens + elapsed * self.min_per_second)
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class RetryStats:
+    """
+    Thread-safe retry counters.
+
+      - requests: logical requests executed through the policy
+      - attempts: total HTTP attempts (first tries + retries)
+      - retries: attempts beyond the first
+      - budget_exhausted: retries skipped because the budget was empty
+      - attempts_per_request: histogram {attempt count: number of requests}
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.attempts = 0
+        self.retries = 0
+        self.budget_exhausted = 0
+        self.attempts_per_request: Counter = Counter()
+
+    def record(self, attempts: int, budget_exhausted: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self.attempts += attempts
+            self.retries += attempts - 1
+            self.attempts_per_request[attempts] += 1
+            if budget_exhausted:
+                self.budget_exhausted += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "budget_exhausted": self.budget_exhausted,
+                "attempts_per_request": dict(self.attempts_per_request),
+            }
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date) into seconds.
+    Returns None if missing or unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Retry policy shared by ApiClient and WebhookClient.
+
+    - only methods in `methods` are retried (idempotent ones by default)
+    - a response is retried when its status is in `statuses`; transport errors
+      are retried when they are instances of the exception types passed to run()
+    - waits use capped exponential backoff with full jitter:
+      uniform(0, min(backoff_cap, backoff_base * 2 ** (retry - 1)))
+    - a Retry-After header on a retried response replaces the backoff
+      (capped at `max_retry_after`)
+    - every retry must take a token from the (optional) RetryBudget
+
+    Build it from a settings section with RetryPolicy.from_settings(cfg["retry"]).
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        methods: Iterable[str] = DEFAULT_RETRY_METHODS,
+        statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        backoff_base: float = 0.2,
+        backoff_cap: float = 5.0,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 30.0,
+        budget: Optional[RetryBudget] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.methods = frozenset(m.upper() for m in methods)
+        self.statuses = frozenset(int(s) for s in statuses)
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+        self.stats = RetryStats()
+        self._sleep = sleep
+
+    @classmethod
+    def from_settings(cls, section: Optional[Dict[str, Any]]) -> "RetryPolicy":
+        """
+        Build a policy from a config section such as settings["api"]["retry"].
+        Missing keys use the defaults; `enabled: false` means a single attempt.
+        """
+        section = section or {}
+        if not section.get("enabled", True):
+            return cls(max_attempts=1)
+
+        budget = None
+        if section.get("budget_ratio") is not None:
+            budget = RetryBudget(
+                ratio=float(section["budget_ratio"]),
+                min_per_second=float(section.get("budget_min_per_second", 1.0)),
+                max_tokens=float(section.get("budget_max_tokens", 10.0)),
+            )
+        return cls(
+            max_attempts=int(section.get("max_attempts", 3)),
+            methods=section.get("methods", DEFAULT_RETRY_METHODS),
+            statuses=section.get("statuses", DEFAULT_RETRY_STATUSES),
+            backoff_base=float(section.get("backoff_base", 0.2)),
+            backoff_cap=float(section.get("backoff_cap", 5.0)),
+            respect_retry_after=bool(section.get("respect_retry_after", True)),
+            max_retry_after=float(section.get("max_retry_after", 30.0)),
+            budget=budget,
+        )
+
+    def backoff(self, retry_number: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait before retry number `retry_number` (1-based).
+        """
+        if self.respect_retry_after:
+            delay = parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.max_retry_after)
+        ceiling = min(self.backoff_cap, self.backoff_base * (2 ** (retry_number - 1)))
+        return random.uniform(0, ceiling)
+
+    def run(
+        self,
+        method: str,
+        send: Callable[[], Any],
+        retry_exceptions: Tuple[Type[BaseException], ...] = (),
+    ) -> Tuple[Any, int]:
+        """
+        Call `send()` until it returns a non-retryable response, attempts run
+        out or the budget is empty.
+
+        Args:
+            method: HTTP method, used to decide whether retrying is allowed
+            send: performs one attempt and returns a response with
+                `status_code` and `headers`
+            retry_exceptions: exception types treated as transient
+
+        returns:
+            (last response, number of attempts). The last exception is
+            re-raised if the final attempt failed with one.
+        """
+        method = method.upper()
+        retryable_method = method in self.methods
+        if self.budget is not None:
+            self.budget.deposit()
+
+        attempt = 0
+        budget_exhausted = False
+        while True:
+            attempt += 1
+            try:
+                response = send()
+            except retry_exceptions as exc:
+                if not self._may_retry(retryable_method, attempt):
+                    self.stats.record(attempt, budget_exhausted)
+                    raise
+                if not self._take_budget():
+                    budget_exhausted = True
+                    self.stats.record(attempt, budget_exhausted)
+                    raise
+                delay = self.backoff(attempt)
+                logger.warning(
+                    "%s attempt %s failed with %r, retrying in %.3fs",
+                    method,
+                    attempt,
+                    exc,
+                    delay,
+                )
+                self._sleep(delay)
+                continue
+            except BaseException:
+                self.stats.record(attempt, budget_exhausted)
+                raise
+
+            if response.status_code not in self.statuses or not self._may_retry(
+                retryable_method, attempt
+            ):
+                break
+            if not self._take_budget():
+                budget_exhausted = True
+                break
+
+            delay = self.backoff(attempt, response.headers.get("Retry-After"))
+            logger.warning(
+                "%s attempt %s returned %s, retrying in %.3fs",
+                method,
+                attempt,
+                response.status_code,
+                delay,
+            )
+            close = getattr(response, "close", None)
+            if close is not None:
+                close()
+            self._sleep(delay)
+
+        self.stats.record(attempt, budget_exhausted)
+        return response, attempt
+
+    def _may_retry(self, retryable_method: bool, attempt: int) -> bool:
+        return retryable_method and attempt < self.max_attempts
+
+    def _take_budget(self) -> bool:
+        if self.budget is None or self.budget.try_withdraw():
+            return True
+        logger.warning("Retry budget exhausted, not retrying")
+        return False
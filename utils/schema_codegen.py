@@ -0,0 +1,312 @@
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from jsonschema.exceptions import best_match
+
+from .json_schemas import FORMAT_CHECKER, SCHEMAS, get_validator
+
+logger = logging.getLogger(__name__)
+
+# Bump when the generated code changes shape, so stale cache files are ignored
+GENERATOR_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path(
+    os.getenv("SCHEMA_CODEGEN_CACHE", Path(__file__).resolve().parent.parent / ".schema_cache")
+)
+
+# Keywords the generator understands; anything else makes compile_schema
+# fall back to the generic jsonschema validator
+_SUPPORTED_KEYWORDS = {
+    "type", "required", "properties", "additionalProperties", "items",
+    "format", "minLength", "maxLength", "minimum", "maximum",
+    "title", "description", "$schema", "$comment", "examples", "default",
+}
+
+# JSON Schema type -> inline Python check on `{v}` (same semantics as jsonschema)
+_TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "integer": (
+        "((isinstance({v}, int) and not isinstance({v}, bool))"
+        " or (isinstance({v}, float) and {v}.is_integer()))"
+    ),
+}
+
+
+class UnsupportedSchema(ValueError):
+    """
+    Raised when a schema uses keywords the code generator does not handle.
+    """
+
+
+def schema_hash(schema: Dict[str, Any]) -> str:
+    """
+    Stable hash of a schema (canonical JSON) plus the generator version.
+    """
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{GENERATOR_VERSION}:{canonical}".encode("utf-8")).hexdigest()
+
+
+class _Generator:
+    """
+    Emits the body of `is_valid(instance) -> bool` for one schema: every
+    keyword becomes an inline `if not <check>: return False`.
+    """
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self._names = 0
+
+    def _var(self) -> str:
+        self._names += 1
+        return f"v{self._names}"
+
+    def emit(self, line: str, depth: int) -> None:
+        self.lines.append("    " * depth + line)
+
+    def schema(self, schema: Any, var: str, depth: int) -> None:
+        if schema is True or schema == {}:
+            return
+        if schema is False:
+            self.emit("return False", depth)
+            return
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(f"schema must be a dict or bool, got {schema!r}")
+        unknown = set(schema) - _SUPPORTED_KEYWORDS
+        if unknown:
+            raise UnsupportedSchema(f"unsupported keywords: {sorted(unknown)}")
+
+        types = schema.get("type")
+        if isinstance(types, str):
+            types = [types]
+        if types is not None:
+            check = " or ".join(_TYPE_CHECKS[t].format(v=var) for t in types)
+            self.emit(f"if not ({check}): return False", depth)
+        known = set(types) if types is not None and len(types) == 1 else set()
+
+        self._object(schema, var, depth, "object" in known)
+        self._array(schema, var, depth, "array" in known)
+        self._string(schema, var, depth, "string" in known)
+        self._number(schema, var, depth, known & {"number", "integer"})
+
+    def _block(self, schema: Any, var: str, depth: int) -> None:
+        # body of an if/for: must not be empty
+        before = len(self.lines)
+        self.schema(schema, var, depth)
+        if len(self.lines) == before:
+            self.emit("pass", depth)
+
+    def _guarded(self, check: str, var: str, depth: int, known: bool) -> int:
+        # keywords only apply to instances of their type; skip the guard
+        # when "type" already enforced it
+        if known:
+            return depth
+        self.emit(f"if {check.format(v=var)}:", depth)
+        return depth + 1
+
+    def _object(self, schema: Dict[str, Any], var: str, depth: int, known: bool) -> None:
+        required = schema.get("required") or []
+        properties = schema.get("properties") or {}
+        additional = schema.get("additionalProperties", True)
+        if not (required or properties or additional is not True):
+            return
+        depth = self._guarded("isinstance({v}, dict)", var, depth, known)
+        for name in required:
+            self.emit(f"if {name!r} not in {var}: return False", depth)
+        for name, subschema in properties.items():
+            if subschema is True or subschema == {}:
+                continue
+            child = self._var()
+            self.emit(f"{child} = {var}.get({name!r}, _MISSING)", depth)
+            self.emit(f"if {child} is not _MISSING:", depth)
+            self._block(subschema, child, depth + 1)
+        if additional is not True:
+            key = self._var()
+            self.emit(f"for {key} in {var}:", depth)
+            self.emit(f"if {key} in {tuple(properties)!r}: continue", depth + 1)
+            if additional is False:
+                self.emit("return False", depth + 1)
+            else:
+                self.schema(additional, f"{var}[{key}]", depth + 1)
+
+    def _array(self, schema: Dict[str, Any], var: str, depth: int, known: bool) -> None:
+        items = schema.get("items", True)
+        if items is True or items == {}:
+            return
+        depth = self._guarded("isinstance({v}, list)", var, depth, known)
+        item = self._var()
+        self.emit(f"for {item} in {var}:", depth)
+        self._block(items, item, depth + 1)
+
+    def _string(self, schema: Dict[str, Any], var: str, depth: int, known: bool) -> None:
+        checks = []
+        if "minLength" in schema:
+            checks.append(f"len({var}) >= {int(schema['minLength'])}")
+        if "maxLength" in schema:
+            checks.append(f"len({var}) <= {int(schema['maxLength'])}")
+        fmt = schema.get("format")
+        if fmt == "email":
+            # jsonschema's own email check
+            checks.append(f"'@' in {var}")
+        elif fmt is not None and fmt in FORMAT_CHECKER.checkers:
+            checks.append(f"_conforms({var}, {fmt!r})")
+        if not checks:
+            return
+        depth = self._guarded("isinstance({v}, str)", var, depth, known)
+        self.emit(f"if not ({' and '.join(checks)}): return False", depth)
+
+    def _number(self, schema: Dict[str, Any], var: str, depth: int, known: Any) -> None:
+        checks = []
+        if "minimum" in schema:
+            checks.append(f"{var} >= {schema['minimum']!r}")
+        if "maximum" in schema:
+            checks.append(f"{var} <= {schema['maximum']!r}")
+        if not checks:
+            return
+        depth = self._guarded(_TYPE_CHECKS["number"], var, depth, bool(known))
+        self.emit(f"if not ({' and '.join(checks)}): return False", depth)
+
+
+def generate_source(schema: Dict[str, Any]) -> str:
+    """
+    Python source of a module defining `is_valid(instance) -> bool` for
+    `schema`. Raises UnsupportedSchema for keywords it cannot inline.
+    """
+    generator = _Generator()
+    generator.schema(schema, "instance", 1)
+    body = "\n".join(generator.lines) or "    pass"
+    return (
+        f"# generated by utils/schema_codegen.py v{GENERATOR_VERSION}, do not edit\n"
+        "def is_valid(instance):\n"
+        f"{body}\n"
+        "    return True\n"
+    )
+
+
+def _load_is_valid(source: str, origin: str) -> Callable[[Any], bool]:
+    namespace: Dict[str, Any] = {
+        "_MISSING": object(),
+        "_conforms": FORMAT_CHECKER.conforms,
+    }
+    exec(compile(source, origin, "exec"), namespace)
+    return namespace["is_valid"]
+
+
+class CompiledSchema:
+    """
+    A schema compiled to a specialised Python check.
+
+    - is_valid(instance): the generated function, no keyword interpretation
+    - validate(instance): raises the same jsonschema.ValidationError as
+      validate_fast (the generic validator re-runs only for invalid
+      instances, so error messages and paths are jsonschema's own)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        is_valid: Callable[[Any], bool],
+        source: Optional[str],
+        generic: Any,
+    ) -> None:
+        self.name = name
+        self.is_valid = is_valid
+        self.source = source
+        self._generic = generic
+
+    @property
+    def generated(self) -> bool:
+        return self.source is not None
+
+    def validate(self, instance: Any) -> None:
+        if self.is_valid(instance):
+            return
+        error = best_match(self._generic.iter_errors(instance))
+        if error is not None:
+            raise error
+
+    def iter_errors(self, instance: Any) -> Any:
+        if self.is_valid(instance):
+            return iter(())
+        return self._generic.iter_errors(instance)
+
+
+_compiled: Dict[str, CompiledSchema] = {}
+_compiled_lock = threading.Lock()
+
+
+def compile_schema(
+    name: str,
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+) -> CompiledSchema:
+    """
+    CompiledSchema for a schema in json_schemas.SCHEMAS, memoised per process.
+
+    Generated sources are cached on disk as <cache_dir>/<schema hash>.py, so
+    other processes (e.g. batch validation workers) load them instead of
+    regenerating; pass cache_dir=None to skip the disk cache. Schemas using
+    keywords the generator does not handle fall back to the generic validator.
+    """
+    compiled = _compiled.get(name)
+    if compiled is not None:
+        return compiled
+    with _compiled_lock:
+        compiled = _compiled.get(name)
+        if compiled is None:
+            compiled = _compile(name, cache_dir)
+            _compiled[name] = compiled
+        return compiled
+
+
+def _compile(name: str, cache_dir: Optional[Path]) -> CompiledSchema:
+    generic = get_validator(name)
+    schema = SCHEMAS[name]
+    digest = schema_hash(schema)
+    cache_file = Path(cache_dir) / f"{digest}.py" if cache_dir is not None else None
+
+    source = None
+    if cache_file is not None:
+        try:
+            source = cache_file.read_text(encoding="utf-8")
+            logger.debug("Loaded generated validator for %s from %s", name, cache_file)
+        except OSError:
+            source = None
+
+    if source is None:
+        try:
+            source = generate_source(schema)
+        except UnsupportedSchema as exc:
+            logger.warning("Schema %r not compiled (%s), using generic validator", name, exc)
+            return CompiledSchema(name, generic.is_valid, None, generic)
+        if cache_file is not None:
+            _write_atomic(cache_file, source)
+
+    origin = str(cache_file) if cache_file is not None else f"<schema {name}>"
+    return CompiledSchema(name, _load_is_valid(source, origin), source, generic)
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as exc:
+        # the cache is an optimisation only
+        logger.warning("Could not write schema cache %s: %r", path, exc)
+
+
+def validate_compiled(name: str, instance: Any) -> None:
+    """
+    Drop-in for validate_fast() using the generated validator.
+    """
+    compile_schema(name).validate(instance)
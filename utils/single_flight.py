@@ -0,0 +1,166 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+import asyncio
+import logging
+import threading
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+
+def request_key(
+    method: str,
+    url: str,
+    params: Any = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+) -> Tuple[Any, ...]:
+    """
+    Identity of a request for coalescing: method, full URL with encoded
+    query params, every header (names case-insensitive) and the timeout.
+    Only requests that would be sent identically are coalesced.
+    """
+    prepared = requests.models.PreparedRequest()
+    prepared.prepare_url(url, params)
+    lowered = tuple(sorted((k.lower(), str(v)) for k, v in (headers or {}).items()))
+    return (method.upper(), prepared.url, lowered, timeout)
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "followers")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls across threads: the first caller for
+    a key (the leader) runs the function, callers arriving while it is in
+    flight wait and receive the same result or exception.
+
+    Counters: leaders (upstream calls made) and coalesced (calls that piggy-
+    backed on a leader instead of going upstream).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run `fn` once per in-flight `key`.
+
+        returns:
+            (result, shared) where shared is True for callers that reused
+            another caller's result.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.followers += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.leaders += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            if call.followers:
+                logger.debug("Single-flight %s shared with %s callers", key, call.followers)
+        return call.result, False
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
+
+
+class _LeaderCancelled(Exception):
+    """
+    Set on a shared future when its leader task is cancelled, so followers
+    can tell that apart from their own cancellation.
+    """
+
+
+class AsyncSingleFlight:
+    """
+    asyncio counterpart of SingleFlight: concurrent tasks awaiting the same
+    key share one underlying coroutine. If the leading task is cancelled,
+    its followers are not: the first of them to resume becomes the new
+    leader and the others coalesce onto it.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(
+        self, key: Hashable, fn: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                return await self._lead(key, fn), False
+            self.coalesced += 1
+            try:
+                # shield: a cancelled follower must not cancel the shared call
+                return await asyncio.shield(future), True
+            except _LeaderCancelled:
+                # not a shared result after all: run it again, maybe as leader
+                self.coalesced -= 1
+
+    async def _lead(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.leaders += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as exc:
+            if not future.done():
+                future.set_exception(exc)
+                # mark retrieved so an unobserved failure is not logged
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def snapshot(self) -> Dict[str, int]:
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls),
+        }
@@ -0,0 +1,380 @@
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+from collections import deque
+from datetime import datetime, timezone
+from itertools import islice
+from uuid import uuid4
+import json
+import logging
+import re
+import threading
+import time
+
+from aiohttp import web
+
+from .local_server import BackgroundServer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PER_TOKEN = 100_000
+
+# field:"value" / field:value terms of a Webhook.site-style search query
+_QUERY_TERM = re.compile(r'([\w.\-]+):(?:"([^"]*)"|(\S+))')
+
+
+class CaptureStore:
+    """
+    Thread-safe in-memory store of captured webhook requests, per token.
+
+    Each capture is stored in the same shape the Webhook.site API returns
+    (and WebhookClient consumes): uuid, token_id, method, url, ip, query,
+    headers as {lower-cased name: [values]}, content as a string, size and
+    created_at. The newest `max_per_token` captures are kept per token.
+
+    Captures are also indexed by `event_id` (from a JSON body) and by the
+    `x-correlation-id` header, so find() is a dict lookup, and wait_for()
+    blocks on a condition variable that every add() notifies: waiters wake
+    up as soon as a matching capture lands, without polling.
+    """
+
+    def __init__(self, max_per_token: int = DEFAULT_MAX_PER_TOKEN) -> None:
+        self.max_per_token = max_per_token
+        self._cond = threading.Condition()
+        self._by_token: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._appended: Dict[str, int] = {}
+        self._by_uuid: Dict[str, Dict[str, Any]] = {}
+        self._by_event_id: Dict[str, List[Dict[str, Any]]] = {}
+        self._by_correlation_id: Dict[str, List[Dict[str, Any]]] = {}
+        self.total_captured = 0
+
+    @staticmethod
+    def _index_keys(capture: Dict[str, Any]) -> Tuple[Optional[str], List[str]]:
+        event_id = None
+        content = capture["content"]
+        # cheap pre-check so non-JSON bodies never pay for a parse
+        if content and "event_id" in content:
+            try:
+                body = json.loads(content)
+            except ValueError:
+                body = None
+            if isinstance(body, dict) and body.get("event_id") is not None:
+                event_id = str(body["event_id"])
+        return event_id, list(capture["headers"].get("x-correlation-id", ()))
+
+    def add(
+        self,
+        token_id: str,
+        method: str,
+        url: str,
+        headers: Dict[str, List[str]],
+        content: str,
+        ip: Optional[str] = None,
+        query: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc)
+        capture = {
+            "uuid": str(uuid4()),
+            "token_id": token_id,
+            "method": method,
+            "url": url,
+            "ip": ip,
+            "query": query or None,
+            "headers": headers,
+            "content": content,
+            "size": len(content.encode("utf-8")),
+            "created_at": now.strftime("%Y-%m-%d %H:%M:%S"),
+            # extra field (not in the Webhook.site API): capture time on this
+            # process's monotonic clock, for in-process latency measurements
+            "received_monotonic": time.monotonic(),
+        }
+        event_id, correlation_ids = self._index_keys(capture)
+        with self._cond:
+            captures = self._by_token.setdefault(token_id, deque())
+            if len(captures) >= self.max_per_token:
+                self._unindex(captures.popleft())
+            captures.append(capture)
+            self._appended[token_id] = self._appended.get(token_id, 0) + 1
+            self._by_uuid[capture["uuid"]] = capture
+            if event_id is not None:
+                self._by_event_id.setdefault(event_id, []).append(capture)
+            for correlation_id in correlation_ids:
+                self._by_correlation_id.setdefault(correlation_id, []).append(capture)
+            self.total_captured += 1
+            self._cond.notify_all()
+        return capture
+
+    def _unindex(self, capture: Dict[str, Any]) -> None:
+        # caller holds the lock
+        self._by_uuid.pop(capture["uuid"], None)
+        event_id, correlation_ids = self._index_keys(capture)
+        for index, key in [(self._by_event_id, event_id)] + [
+            (self._by_correlation_id, cid) for cid in correlation_ids
+        ]:
+            bucket = index.get(key) if key is not None else None
+            if bucket is None:
+                continue
+            if capture in bucket:
+                bucket.remove(capture)
+            if not bucket:
+                del index[key]
+
+    def latest(self, token_id: str) -> Optional[Dict[str, Any]]:
+        with self._cond:
+            captures = self._by_token.get(token_id)
+            return captures[-1] if captures else None
+
+    def get(self, token_id: str, request_id: str) -> Optional[Dict[str, Any]]:
+        with self._cond:
+            capture = self._by_uuid.get(request_id)
+        if capture is None or capture["token_id"] != token_id:
+            return None
+        return capture
+
+    def count(self, token_id: str) -> int:
+        with self._cond:
+            return len(self._by_token.get(token_id, ()))
+
+    def _find_indexed(
+        self,
+        token_id: Optional[str],
+        event_id: Optional[str],
+        correlation_id: Optional[str],
+        predicate: Optional[Callable[[Dict[str, Any]], bool]],
+    ) -> Optional[Dict[str, Any]]:
+        # caller holds the lock; newest match wins
+        if event_id is not None:
+            candidates = self._by_event_id.get(str(event_id), ())
+        else:
+            candidates = self._by_correlation_id.get(correlation_id, ())
+        for capture in reversed(candidates):
+            if token_id is not None and capture["token_id"] != token_id:
+                continue
+            if correlation_id is not None and correlation_id not in capture["headers"].get(
+                "x-correlation-id", ()
+            ):
+                continue
+            if predicate is not None and not predicate(capture):
+                continue
+            return capture
+        return None
+
+    def find(
+        self,
+        event_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        token_id: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Newest capture with this event_id and/or x-correlation-id (optionally
+        restricted to one token), via the hash indexes.
+        """
+        if event_id is None and correlation_id is None:
+            raise ValueError("find needs an event_id or correlation_id")
+        with self._cond:
+            return self._find_indexed(token_id, event_id, correlation_id, None)
+
+    def wait_for(
+        self,
+        token_id: Optional[str] = None,
+        event_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: float = 10.0,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Block until a capture matches, or `timeout` seconds pass (-> None).
+
+        With an event_id / correlation_id the check is an index lookup;
+        a predicate alone needs `token_id` and is evaluated once over that
+        token's captures, then only over captures added since.
+        """
+        if event_id is None and correlation_id is None:
+            if predicate is None or token_id is None:
+                raise ValueError(
+                    "wait_for needs an event_id, a correlation_id, or a predicate with a token_id"
+                )
+        end = time.monotonic() + timeout
+        with self._cond:
+            seen = 0
+            while True:
+                if event_id is not None or correlation_id is not None:
+                    found = self._find_indexed(token_id, event_id, correlation_id, predicate)
+                else:
+                    found, seen = self._scan_new(token_id, predicate, seen)
+                if found is not None:
+                    return found
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+
+    def _scan_new(
+        self,
+        token_id: str,
+        predicate: Callable[[Dict[str, Any]], bool],
+        seen: int,
+    ) -> Tuple[Optional[Dict[str, Any]], int]:
+        # caller holds the lock; check captures appended since `seen`, newest first
+        appended = self._appended.get(token_id, 0)
+        captures = self._by_token.get(token_id) or deque()
+        for capture in islice(reversed(captures), min(appended - seen, len(captures))):
+            if predicate(capture):
+                return capture, appended
+        return None, appended
+
+    def page(
+        self,
+        token_id: str,
+        page: int = 1,
+        per_page: int = 50,
+        newest_first: bool = True,
+        query: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        One page of captures for `token_id`, plus the total number matching.
+        Unfiltered pages only walk the captures they return.
+        """
+        start = (max(page, 1) - 1) * per_page
+        matcher = _query_matcher(query) if query else None
+        with self._cond:
+            captures = self._by_token.get(token_id) or deque()
+            ordered: Iterator[Dict[str, Any]] = reversed(captures) if newest_first else iter(captures)
+            if matcher is None:
+                return list(islice(ordered, start, start + per_page)), len(captures)
+            matching = [c for c in ordered if matcher(c)]
+        return matching[start:start + per_page], len(matching)
+
+    def clear(self, token_id: Optional[str] = None) -> None:
+        with self._cond:
+            tokens = [token_id] if token_id is not None else list(self._by_token)
+            for token in tokens:
+                for capture in self._by_token.pop(token, ()):
+                    self._unindex(capture)
+
+
+def _query_matcher(query: str):
+    """
+    Minimal Webhook.site-style search: AND-ed `field:"value"` terms, where
+    field is content, method, ip or headers.<name>, plus bare words matched
+    against content. Matching is substring based.
+    """
+    terms = []
+    remainder = query
+    for match in _QUERY_TERM.finditer(query):
+        terms.append((match.group(1).lower(), match.group(2) if match.group(2) is not None else match.group(3)))
+        remainder = remainder.replace(match.group(0), " ")
+    words = [w for w in remainder.split() if w.upper() not in ("AND", "OR")]
+    terms.extend(("content", w) for w in words)
+
+    def matches(capture: Dict[str, Any]) -> bool:
+        for field, value in terms:
+            if field.startswith("headers."):
+                values = capture["headers"].get(field[len("headers."):], [])
+                if not any(value in v for v in values):
+                    return False
+            elif value not in str(capture.get(field) or ""):
+                return False
+        return True
+
+    return matches
+
+
+def _not_found() -> web.Response:
+    return web.json_response(
+        {"success": False, "error": {"message": "Request not found"}}, status=404
+    )
+
+
+def create_capture_app(store: CaptureStore) -> web.Application:
+    """
+    aiohttp app mimicking the parts of Webhook.site used by WebhookClient:
+
+      - any method on /{token}[/...]        -> capture, 200
+      - GET /token/{token}/request/latest   -> latest capture or 404
+      - GET /token/{token}/requests         -> paged list (sorting, page,
+                                               per_page, query)
+      - GET /token/{token}/request/{uuid}   -> one capture or 404
+    """
+
+    async def latest(request: web.Request) -> web.Response:
+        capture = store.latest(request.match_info["token"])
+        return web.json_response(capture) if capture else _not_found()
+
+    async def one(request: web.Request) -> web.Response:
+        capture = store.get(request.match_info["token"], request.match_info["uuid"])
+        return web.json_response(capture) if capture else _not_found()
+
+    async def listing(request: web.Request) -> web.Response:
+        try:
+            page = int(request.query.get("page", 1))
+            per_page = min(int(request.query.get("per_page", 50)), 100)
+        except ValueError:
+            return web.json_response({"success": False}, status=400)
+        items, total = store.page(
+            request.match_info["token"],
+            page=page,
+            per_page=per_page,
+            newest_first=request.query.get("sorting", "oldest") == "newest",
+            query=request.query.get("query"),
+        )
+        first = (page - 1) * per_page
+        return web.json_response({
+            "data": items,
+            "total": total,
+            "per_page": per_page,
+            "current_page": page,
+            "is_last_page": first + len(items) >= total,
+            "from": first + 1 if items else None,
+            "to": first + len(items) if items else None,
+        })
+
+    async def capture(request: web.Request) -> web.Response:
+        body = await request.read()
+        headers: Dict[str, List[str]] = {}
+        for name, value in request.headers.items():
+            headers.setdefault(name.lower(), []).append(value)
+        store.add(
+            token_id=request.match_info["token"],
+            method=request.method,
+            url=str(request.url),
+            headers=headers,
+            content=body.decode("utf-8", errors="replace"),
+            ip=request.remote,
+            query=dict(request.query),
+        )
+        return web.Response(text="")
+
+    app = web.Application(client_max_size=16 * 1024 * 1024)
+    app.router.add_get("/token/{token}/request/latest", latest)
+    app.router.add_get("/token/{token}/requests", listing)
+    app.router.add_get("/token/{token}/request/{uuid}", one)
+    app.router.add_route("*", "/{token}", capture)
+    app.router.add_route("*", "/{token}/{tail:.*}", capture)
+    return app
+
+
+class CaptureServer(BackgroundServer):
+    """
+    In-process stand-in for Webhook.site: captures requests into a
+    CaptureStore and serves them back through the same API shape.
+
+        with CaptureServer() as server:
+            client = WebhookClient(
+                target_url=server.target_url("my-token"),
+                api_base_url=server.base_url,
+            )
+    """
+
+    def __init__(
+        self,
+        store: Optional[CaptureStore] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.store = store if store is not None else CaptureStore()
+        super().__init__(create_capture_app(self.store), host=host, port=port)
+
+    def target_url(self, token_id: Optional[str] = None) -> str:
+        """
+        Capture URL for `token_id` (a fresh uuid when omitted).
+        """
+        return f"{self.base_url}/{token_id or uuid4()}"
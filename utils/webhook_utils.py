@@ -1,14 +1,167 @@
-from typing import Any, Optional, Dict
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, Optional, Dict, Set, Tuple, Union
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 import logging
 import requests
 import json
+import time
 from urllib.parse import urlparse
 from uuid import uuid4
 
+from .cassette import Cassette, shared_cassette
 from .config import load_settings, get_env_or_setting
+from .http_pool import PooledSession, pool_settings
+from .latency import LatencyHistogram
+from .rate_limit import RateLimiterRegistry, shared_rate_limiters
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:  # webhook_capture pulls in aiohttp, only needed for local runs
+    from .webhook_capture import CaptureStore
+
+# Transport errors worth another attempt (not e.g. invalid URLs)
+_TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout)
 
 logger = logging.getLogger(__name__)
 
+# Predicate over captured request metadata, used by wait_for_event
+RequestPredicate = Callable[[Dict[str, Any]], bool]
+
+
+def decode_content(metadata: Dict[str, Any]) -> Any:
+    """
+    Decode the 'content' field (the original body, as a string) of captured
+    request metadata. Returns None when it is missing or not JSON.
+    """
+    content = metadata.get("content")
+    if not content:
+        return None
+    try:
+        return json.loads(content)
+    except (TypeError, json.JSONDecodeError):
+        return None
+
+
+def header_value(metadata: Dict[str, Any], name: str) -> Optional[str]:
+    """
+    First value of a captured header. Webhook.site stores headers as
+    {name: [values]} with lower-cased names.
+    """
+    values = (metadata.get("headers") or {}).get(name.lower())
+    if isinstance(values, list):
+        return values[0] if values else None
+    return values
+
+
+def match_event_id(event_id: str) -> RequestPredicate:
+    """
+    Predicate matching a captured request whose JSON body has this event_id.
+    Carries a `query` attribute used as a server-side search filter, and an
+    `event_id` attribute used for index lookups in a local CaptureStore.
+    """
+    def predicate(metadata: Dict[str, Any]) -> bool:
+        body = decode_content(metadata)
+        return isinstance(body, dict) and body.get("event_id") == event_id
+    # server-side hint for find_request(): full-text search on the body
+    predicate.query = f'content:"{event_id}"'
+    predicate.event_id = event_id
+    return predicate
+
+
+def match_correlation_id(correlation_id: str) -> RequestPredicate:
+    """
+    Predicate matching a captured request sent with this x-correlation-id header.
+    """
+    def predicate(metadata: Dict[str, Any]) -> bool:
+        return header_value(metadata, "x-correlation-id") == correlation_id
+    predicate.correlation_id = correlation_id
+    return predicate
+
+
+@dataclass
+class WebhookEvent:
+    """
+    A captured request found by WebhookClient.wait_for_event.
+
+      - request: captured request metadata (headers, content, ...)
+      - content: decoded JSON body, None if the body is not JSON
+      - latency: seconds from the send time (or the start of the wait) until
+        the request was observed
+      - polls: API calls it took to observe it
+    """
+
+    request: Dict[str, Any]
+    content: Any
+    latency: float
+    polls: int
+
+
+@dataclass
+class SentEvent:
+    """
+    Outcome of one payload sent by WebhookClient.send_events.
+
+      - index: position of the payload in the input
+      - status_code: HTTP status, None if the send failed
+      - latency: seconds spent sending (incl. retries and rate limiting)
+      - bytes_sent: size of the JSON body
+      - error: WebhookClientError when the send failed
+    """
+
+    index: int
+    status_code: Optional[int] = None
+    latency: float = 0.0
+    bytes_sent: int = 0
+    error: Optional["WebhookClientError"] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status_code is not None and self.status_code < 400
+
+
+@dataclass
+class SendReport:
+    """
+    Results of WebhookClient.send_events: one SentEvent per payload, in input
+    order, plus wall-clock time and a latency histogram of all sends.
+    """
+
+    events: List[SentEvent] = field(default_factory=list)
+    total_elapsed: float = 0.0
+    concurrency: int = 1
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def failures(self) -> List[SentEvent]:
+        return [event for event in self.events if not event.ok]
+
+    @property
+    def bytes_sent(self) -> int:
+        return sum(event.bytes_sent for event in self.events)
+
+    @property
+    def events_per_second(self) -> float:
+        return len(self.events) / self.total_elapsed if self.total_elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_sent / self.total_elapsed if self.total_elapsed > 0 else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Throughput summary: counts, events/sec, bytes/sec and send latency
+        percentiles (see LatencyHistogram.snapshot).
+        """
+        return {
+            "count": len(self.events),
+            "failures": len(self.failures),
+            "concurrency": self.concurrency,
+            "total_elapsed": self.total_elapsed,
+            "events_per_second": self.events_per_second,
+            "bytes_sent": self.bytes_sent,
+            "bytes_per_second": self.bytes_per_second,
+            "latency": self.latency.snapshot(),
+        }
+
 
 class WebhookClientError(RuntimeError):
     """
@@ -53,9 +206,31 @@ class WebhookClient:
 
     - Sends events to a capture URL (WEBHOOK_TARGET_URL)
     - Retrieves the latest captured request via Webhook.site API
+    - Keeps two pooled keep-alive sessions, one for the capture (target) URL and
+      one for the API base URL, sized from config/settings.yaml (webhook section).
+      Call close() or use the client as a context manager to release them.
+    - Transient failures are retried per config/settings.yaml (webhook.retry);
+      by default only GET retrievals, add POST there to retry sends too
+    - Sends take a token from the per-host rate limiter (rate_limits in
+      config/settings.yaml) before every attempt
+    - wait_for_event() polls with adaptive intervals until a captured request
+      matches a predicate or the deadline passes
+    - With a local CaptureStore attached (capture_store=...), find_request()
+      and wait_for_event() read the store directly: index lookups by
+      event_id / correlation id and wakeups on capture instead of API polls
+    - Both sessions go through the record / replay cassette when one is
+      configured (CASSETTE_MODE, CASSETTE_PATH), like ApiClient
     """
 
-    def __init__(self, target_url: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        target_url: Optional[str] = None,
+        api_base_url: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiters: Optional[RateLimiterRegistry] = None,
+        capture_store: Optional["CaptureStore"] = None,
+        cassette: Optional[Cassette] = None,
+    ) -> None:
         settings = load_settings()
         webhook_cfg = settings.get("webhook", {})
 
@@ -82,7 +257,13 @@ class WebhookClient:
             "WEBHOOK_API_URL",
             default=config_api_base,
         )
-        self.api_base_url = env_api_base.rstrip("/")
+        self.api_base_url = (api_base_url or env_api_base).rstrip("/")
+
+        # Default per-request timeout (webhook.timeout)
+        try:
+            self.default_timeout: float = float(webhook_cfg.get("timeout"))
+        except (TypeError, ValueError):
+            self.default_timeout = 10.0
 
         logger.debug(
             "WebhookClient initialized with target_url=%s, api_base_url=%s",
@@ -97,6 +278,52 @@ class WebhookClient:
             default=None,
         )
 
+        # Separate pools so a burst of sends never starves API retrievals
+        pool_kwargs = pool_settings(webhook_cfg)
+        self.pool_maxsize: int = pool_kwargs["pool_maxsize"]
+        self.target_session = PooledSession(**pool_kwargs)
+        self.api_session = PooledSession(**pool_kwargs)
+        self.cassette = cassette if cassette is not None else shared_cassette()
+        if self.cassette is not None:
+            self.cassette.mount(self.target_session)
+            self.cassette.mount(self.api_session)
+
+        if retry_policy is None:
+            retry_policy = RetryPolicy.from_settings(webhook_cfg.get("retry"))
+        self.retry_policy = retry_policy
+        self.rate_limiters = rate_limiters or shared_rate_limiters()
+        self.capture_store = capture_store
+
+    def __enter__(self) -> "WebhookClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close all pooled connections held by this client.
+        """
+        self.target_session.close()
+        self.api_session.close()
+
+    @property
+    def connection_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Connection pool usage for the target (send) and API (retrieve) sessions.
+        """
+        return {
+            "target": self.target_session.stats.snapshot(),
+            "api": self.api_session.stats.snapshot(),
+        }
+
+    @property
+    def retry_stats(self) -> Dict[str, Any]:
+        """
+        Retry counters for sends and retrievals (see RetryStats).
+        """
+        return self.retry_policy.stats.snapshot()
+
     def _extract_token_id(self) -> str:
         """
         Extract the tokenId from the target URL.
@@ -130,9 +357,17 @@ class WebhookClient:
         Send a JSON payload to the webhook target URL via POST.
         """
         logger.info("Sending webhook event to %s", self.target_url)
+        try:
+            body = json.dumps(payload, allow_nan=False).encode("utf-8")
+        except (TypeError, ValueError) as exc:
+            raise WebhookClientError(
+                "Webhook payload is not JSON serialisable",
+                original_exception=exc,
+            ) from exc
+        send_headers = {"Content-Type": "application/json", **(headers or {})}
 
         try:
-            response = requests.post(self.target_url, json=payload, headers=headers)
+            response, attempts = self._post_target(body, send_headers)
         except requests.RequestException as exc:
             logger.error("Failed to send webhook event: %r", exc)
             raise WebhookClientError(
@@ -143,46 +378,179 @@ class WebhookClient:
             ) from exc
 
         logger.info(
-            "Webhook event POST -> %s (status %s)",
+            "Webhook event POST -> %s (status %s, attempts=%s)",
             response.url,
             response.status_code,
+            attempts,
         )
         logger.debug("Webhook POST response body: %s", response.text)
         return response
 
-    def retrieve_latest_request(self) -> Dict[str, Any]:
+    def send_events(
+        self,
+        payloads: Iterable[Union[Dict[str, Any], Callable[[], Dict[str, Any]]]],
+        concurrency: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> SendReport:
         """
-        Fetch metadata for the latest request sent to this webhook URL using:
-        GET {api_base_url}/token/{tokenId}/request/latest
+        Send many JSON payloads to the target URL concurrently over the pooled
+        target session.
+
+        `payloads` is consumed lazily (a generator works), and at most
+        2 * concurrency sends are queued at any time, so memory stays flat
+        however many events are pushed. Each send goes through the same rate
+        limiter and retry policy as send_event(); failures are recorded per
+        event instead of aborting the run.
+
+        Args:
+            payloads: iterable of JSON-serialisable dicts, or of zero-argument
+                callables returning one; a callable is invoked by the worker
+                right before its send (e.g. to stamp the actual send time)
+            concurrency: worker threads; defaults to the target pool size
+                (webhook.pool_maxsize) so every worker keeps a warm connection
+            headers: extra headers sent with every event
 
         returns:
-            - A dict with the request metadata if found.
-            - An empty dict {} if there is no latest request yet (e.g. 404 status code returned).
+            SendReport with one SentEvent per payload (input order),
+            events/sec, bytes/sec and send latency percentiles.
+        """
+        if concurrency is None:
+            concurrency = self.pool_maxsize
+        concurrency = max(1, concurrency)
+        if concurrency > self.pool_maxsize:
+            # Extra connections are opened and then discarded, not pooled
+            logger.warning(
+                "send_events concurrency=%s exceeds pool_maxsize=%s",
+                concurrency,
+                self.pool_maxsize,
+            )
+        send_headers = {"Content-Type": "application/json", **(headers or {})}
+        report = SendReport(concurrency=concurrency)
+
+        def run(index: int, payload: Any) -> SentEvent:
+            event = SentEvent(index=index)
+            if callable(payload):
+                try:
+                    payload = payload()
+                except Exception as exc:
+                    event.error = WebhookClientError(
+                        "Building the webhook payload failed",
+                        original_exception=exc,
+                    )
+                    return event
+            start = time.perf_counter_ns()
+            try:
+                body = json.dumps(payload, allow_nan=False).encode("utf-8")
+                event.bytes_sent = len(body)
+                response, _ = self._post_target(body, send_headers)
+                event.status_code = response.status_code
+            except (TypeError, ValueError) as exc:
+                event.error = WebhookClientError(
+                    "Webhook payload is not JSON serialisable",
+                    original_exception=exc,
+                )
+            except requests.RequestException as exc:
+                event.error = WebhookClientError(
+                    "Failed to send webhook event",
+                    method="POST",
+                    url=self.target_url,
+                    original_exception=exc,
+                )
+            elapsed_ns = time.perf_counter_ns() - start
+            event.latency = elapsed_ns / 1e9
+            report.latency.record(elapsed_ns)
+            return event
+
+        window = 2 * concurrency
+        pending: Set[Future] = set()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="webhook-send"
+        ) as executor:
+            try:
+                for index, payload in enumerate(payloads):
+                    if len(pending) >= window:
+                        # backpressure: pull more input only as sends complete
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        report.events.extend(f.result() for f in done)
+                    pending.add(executor.submit(run, index, payload))
+                done, _ = wait(pending)
+                report.events.extend(f.result() for f in done)
+            finally:
+                for future in pending:
+                    future.cancel()
+        report.total_elapsed = time.perf_counter() - start
+        report.events.sort(key=lambda event: event.index)
+
+        logger.info(
+            "send_events: %s events, %s failures, %.1f events/s, %.0f B/s (%s workers)",
+            len(report.events),
+            len(report.failures),
+            report.events_per_second,
+            report.bytes_per_second,
+            concurrency,
+        )
+        return report
+
+    def _post_target(self, body: bytes, headers: Dict[str, str]) -> Tuple[requests.Response, int]:
+        def send() -> requests.Response:
+            self.rate_limiters.acquire(self.target_url)
+            return self.target_session.post(
+                self.target_url,
+                data=body,
+                headers=headers,
+                timeout=self.default_timeout,
+            )
+
+        return self.retry_policy.run("POST", send, retry_exceptions=_TRANSIENT_ERRORS)
+
+    def _api_get(
+        self,
+        url: str,
+        action: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        retry: bool = True,
+    ) -> requests.Response:
+        """
+        GET a Webhook.site API URL through the API session, wrapping
+        transport failures in WebhookClientError.
+
+        Args:
+            url: full API URL
+            action: description used in logs/errors, e.g. "fetch latest webhook request"
+            params: optional query params
+            timeout: optional per-call timeout (defaults to webhook.timeout)
+            retry: apply the retry policy (pollers with a deadline pass False)
         """
-        token_id = self._extract_token_id()
-        url = f"{self.api_base_url}/token/{token_id}/request/latest"
         headers = self._build_headers()
+        effective_timeout = timeout or self.default_timeout
+
+        def fetch() -> requests.Response:
+            return self.api_session.get(
+                url, headers=headers, params=params, timeout=effective_timeout
+            )
 
-        logger.info("Fetching latest webhook request from %s", url)
         try:
-            response = requests.get(url, headers=headers)
+            if retry:
+                response, _ = self.retry_policy.run(
+                    "GET",
+                    fetch,
+                    retry_exceptions=_TRANSIENT_ERRORS,
+                )
+            else:
+                response = fetch()
         except requests.RequestException as exc:
-            logger.error("Failed to fetch latest webhook request: %r", exc)
+            logger.error("Failed to %s: %r", action, exc)
             raise WebhookClientError(
-                "Failed to fetch latest webhook request",
+                f"Failed to {action}",
                 method="GET",
                 url=url,
                 original_exception=exc,
             ) from exc
+        return response
 
-        # 404 is expected when there is no request yet so we treat it as "no data"
-        if response.status_code == 404:
-            logger.warning(
-                "No latest webhook request found yet (404). Response body: %s",
-                response.text,
-            )
-            return {}
-
+    def _decode_api_json(self, response: requests.Response, url: str) -> Any:
         if response.status_code != 200:
             logger.error(
                 "Unexpected status from webhook API: %s, body=%s",
@@ -196,7 +564,7 @@ class WebhookClient:
             )
 
         try:
-            data = response.json()
+            return response.json()
         except json.JSONDecodeError as exc:
             logger.error("Failed to decode JSON from webhook API: %r", exc)
             raise WebhookClientError(
@@ -206,9 +574,182 @@ class WebhookClient:
                 original_exception=exc,
             ) from exc
 
+    def retrieve_latest_request(
+        self,
+        timeout: Optional[float] = None,
+        retry: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Fetch metadata for the latest request sent to this webhook URL using:
+        GET {api_base_url}/token/{tokenId}/request/latest
+
+        Args:
+            timeout: optional per-call timeout (defaults to webhook.timeout)
+            retry: apply the retry policy (pollers with a deadline pass False)
+
+        returns:
+            - A dict with the request metadata if found.
+            - An empty dict {} if there is no latest request yet (e.g. 404 status code returned).
+        """
+        token_id = self._extract_token_id()
+        url = f"{self.api_base_url}/token/{token_id}/request/latest"
+
+        logger.info("Fetching latest webhook request from %s", url)
+        response = self._api_get(
+            url, "fetch latest webhook request", timeout=timeout, retry=retry
+        )
+
+        # 404 is expected when there is no request yet so we treat it as "no data"
+        if response.status_code == 404:
+            logger.warning(
+                "No latest webhook request found yet (404). Response body: %s",
+                response.text,
+            )
+            return {}
+
+        data = self._decode_api_json(response, url)
         logger.debug("Latest webhook request payload (metadata): %s", data)
         return data
 
+    def iter_requests(
+        self,
+        query: Optional[str] = None,
+        per_page: int = 50,
+        max_pages: Optional[int] = None,
+        timeout: Optional[float] = None,
+        retry: bool = True,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate captured requests for this token, newest first, using:
+        GET {api_base_url}/token/{tokenId}/requests?sorting=newest&page=N
+
+        Pages are fetched lazily, so a caller that stops early never
+        downloads the rest of the history.
+
+        Args:
+            query: optional server-side search query (Webhook.site search syntax)
+            per_page: page size requested from the API
+            max_pages: stop after this many pages (None = until the last page)
+            timeout / retry: as for retrieve_latest_request
+            deadline: optional absolute time.monotonic() value; every page
+                request is given at most the time left, and iteration stops
+                once it has passed
+        """
+        token_id = self._extract_token_id()
+        url = f"{self.api_base_url}/token/{token_id}/requests"
+
+        page = 1
+        while max_pages is None or page <= max_pages:
+            params: Dict[str, Any] = {"sorting": "newest", "page": page, "per_page": per_page}
+            if query:
+                params["query"] = query
+
+            page_timeout = timeout
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.info("Deadline reached before webhook requests page %s", page)
+                    return
+                page_timeout = min(timeout or self.default_timeout, remaining)
+
+            logger.info("Fetching webhook requests page %s from %s", page, url)
+            response = self._api_get(
+                url, "list webhook requests", params=params, timeout=page_timeout, retry=retry
+            )
+            if response.status_code == 404:
+                # token has no requests yet
+                return
+            if query and response.status_code in (400, 422):
+                logger.warning("Webhook API rejected query %r, filtering client-side", query)
+                query = None
+                continue
+            body = self._decode_api_json(response, url)
+
+            items = body.get("data") or []
+            yield from items
+            if not items or body.get("is_last_page", True):
+                return
+            page += 1
+
+    def find_request(
+        self,
+        predicate: Optional[RequestPredicate] = None,
+        event_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        max_pages: int = 5,
+        per_page: int = 50,
+        timeout: Optional[float] = None,
+        retry: bool = True,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Search this token's captured requests (newest first) for the first one
+        matching every given criterion, stopping as soon as it is found.
+
+        Unlike retrieve_latest_request(), this is not affected by other senders
+        sharing the capture URL. When the criteria carry a server-side query
+        (match_event_id does), it is sent as the `query` filter; matches are
+        always re-checked client-side. `deadline` (absolute time.monotonic())
+        bounds the whole search, see iter_requests().
+
+        returns:
+            - the matching request metadata
+            - {} if nothing matched within max_pages (or before the deadline)
+        """
+        predicates = [p for p in (
+            predicate,
+            match_event_id(event_id) if event_id else None,
+            match_correlation_id(correlation_id) if correlation_id else None,
+        ) if p is not None]
+        if not predicates:
+            raise ValueError("find_request needs a predicate, event_id or correlation_id")
+
+        if self.capture_store is not None:
+            return self._find_in_store(predicates, event_id, correlation_id) or {}
+
+        queries = [getattr(p, "query", None) for p in predicates]
+        query = " AND ".join(q for q in queries if q) or None
+
+        for metadata in self.iter_requests(
+            query=query,
+            per_page=per_page,
+            max_pages=max_pages,
+            timeout=timeout,
+            retry=retry,
+            deadline=deadline,
+        ):
+            if all(p(metadata) for p in predicates):
+                logger.debug("Found matching webhook request %s", metadata.get("uuid"))
+                return metadata
+        return {}
+
+    @staticmethod
+    def _index_keys(predicate: Optional[RequestPredicate]) -> Dict[str, Optional[str]]:
+        return {
+            "event_id": getattr(predicate, "event_id", None),
+            "correlation_id": getattr(predicate, "correlation_id", None),
+        }
+
+    def _find_in_store(
+        self,
+        predicates: List[RequestPredicate],
+        event_id: Optional[str],
+        correlation_id: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        token_id = self._extract_token_id()
+        keys = self._index_keys(predicates[0])
+        event_id = event_id or keys["event_id"]
+        correlation_id = correlation_id or keys["correlation_id"]
+        if event_id is None and correlation_id is None:
+            # no indexable key: scan the token's captures, newest first
+            items, _ = self.capture_store.page(token_id, per_page=self.capture_store.count(token_id))
+            return next((m for m in items if all(p(m) for p in predicates)), None)
+        metadata = self.capture_store.find(event_id, correlation_id, token_id=token_id)
+        if metadata is not None and all(p(metadata) for p in predicates):
+            return metadata
+        return None
+
     def retrieve_latest_request_content(self) -> Dict[str, Any]:
         """
         Retrieve latest request metadata and return the 'content' field as JSON
@@ -247,3 +788,135 @@ class WebhookClient:
         logger.debug("Latest webhook request JSON body: %s", body_json)
         return body_json
 
+    def wait_for_event(
+        self,
+        predicate: RequestPredicate,
+        deadline: float = 10.0,
+        sent_at: Optional[float] = None,
+        initial_interval: float = 0.05,
+        max_interval: float = 1.0,
+        backoff: float = 2.0,
+        search: bool = False,
+        search_pages: int = 1,
+    ) -> Optional[WebhookEvent]:
+        """
+        Poll the latest captured request until `predicate(metadata)` is true.
+        With search=True each poll runs find_request() over the newest
+        `search_pages` pages instead, so other senders sharing the capture URL
+        cannot hide the event by overwriting "latest".
+
+        With a capture_store attached there is no polling at all: the call
+        blocks on the store until a matching capture arrives (an index lookup
+        for match_event_id / match_correlation_id predicates), `polls` is 0
+        and the latency is measured up to the capture time.
+
+        The first re-poll happens after `initial_interval` seconds, then the
+        interval grows by `backoff` up to `max_interval`. Sleeps and the
+        timeout of every HTTP request (each page of a search included) are
+        clipped to the time left, so the call returns close to `deadline`
+        seconds at the latest. requests applies a timeout to the connect and
+        to each socket read separately, so a server trickling its response
+        byte by byte can still overrun it. A failed poll (5xx, reset
+        connection, ...) is logged and polling continues.
+
+        Args:
+            predicate: called with captured request metadata, e.g.
+                match_event_id(event_id) or match_correlation_id(cid)
+            deadline: seconds to wait in total
+            sent_at: time.monotonic() taken when the event was sent, used
+                for the reported latency (defaults to the start of the wait)
+
+        returns:
+            WebhookEvent for the first matching request, or None if the
+            deadline passed first.
+
+        Raises:
+            WebhookClientError: the deadline passed without a match and the
+                last poll failed (e.g. the webhook API is down)
+        """
+        start = time.monotonic()
+        end = start + deadline
+        origin = start if sent_at is None else sent_at
+        interval = initial_interval
+        polls = 0
+        last_error: Optional[WebhookClientError] = None
+
+        if self.capture_store is not None:
+            return self._wait_in_store(predicate, end, origin, deadline)
+
+        while True:
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                break
+            polls += 1
+            try:
+                if search:
+                    metadata = self.find_request(
+                        predicate, max_pages=search_pages, retry=False, deadline=end
+                    )
+                else:
+                    metadata = self.retrieve_latest_request(
+                        timeout=min(remaining, self.default_timeout), retry=False
+                    )
+            except WebhookClientError as exc:
+                if isinstance(exc.original_exception, requests.Timeout) and time.monotonic() >= end:
+                    # cut short by our own deadline, not an API failure
+                    break
+                # transient API failure: keep polling until the deadline
+                logger.warning("Webhook poll %s failed, retrying: %s", polls, exc)
+                last_error = exc
+                metadata = None
+            else:
+                last_error = None
+
+            if metadata and predicate(metadata):
+                latency = time.monotonic() - origin
+                logger.info(
+                    "Matching webhook request observed after %.3fs (%s polls)",
+                    latency,
+                    polls,
+                )
+                return WebhookEvent(
+                    request=metadata,
+                    content=decode_content(metadata),
+                    latency=latency,
+                    polls=polls,
+                )
+
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+            interval = min(interval * backoff, max_interval)
+
+        logger.warning(
+            "No matching webhook request within %.3fs (%s polls)", deadline, polls
+        )
+        if last_error is not None:
+            raise last_error
+        return None
+
+    def _wait_in_store(
+        self,
+        predicate: RequestPredicate,
+        end: float,
+        origin: float,
+        deadline: float,
+    ) -> Optional[WebhookEvent]:
+        metadata = self.capture_store.wait_for(
+            token_id=self._extract_token_id(),
+            predicate=predicate,
+            timeout=max(0.0, end - time.monotonic()),
+            **self._index_keys(predicate),
+        )
+        if metadata is None:
+            logger.warning("No matching webhook request within %.3fs (local store)", deadline)
+            return None
+        latency = max(0.0, metadata.get("received_monotonic", time.monotonic()) - origin)
+        logger.info("Matching webhook request captured after %.3fs (local store)", latency)
+        return WebhookEvent(
+            request=metadata,
+            content=decode_content(metadata),
+            latency=latency,
+            polls=0,
+        )